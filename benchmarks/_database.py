@@ -0,0 +1,135 @@
+"""
+Seeded MySQL database of the database benchmarks.
+
+Notes
+-----
+Configure the database with the `TEST_DB_HOST`, `TEST_DB_USER`,
+`TEST_DB_PWD` and `BENCH_DB_NAME` environment variables. The
+database named by `BENCH_DB_NAME` (default: `LiveLaunchBench`)
+is dropped and recreated.
+"""
+from collections.abc import Awaitable, Callable
+from os import environ, getenv
+import random
+import string
+from time import perf_counter
+from typing import Any
+
+import aiomysql
+
+from bin import Database
+
+TEST_DB_HOST = getenv('TEST_DB_HOST')
+TEST_DB_USER = getenv('TEST_DB_USER', 'root')
+TEST_DB_PWD = getenv('TEST_DB_PWD')
+BENCH_DB_NAME = getenv('BENCH_DB_NAME', 'LiveLaunchBench')
+
+# YouTube video ID characters
+_YT_ALPHABET = string.ascii_letters + string.digits + '-_'
+
+
+async def start_database() -> Database:
+    """
+    Recreate the benchmark database and create the schema.
+
+    Returns
+    -------
+    db : Database
+        Started database with empty tables.
+
+    Raises
+    ------
+    SystemExit
+        When `TEST_DB_HOST` is not set.
+    """
+    if TEST_DB_HOST is None:
+        raise SystemExit('TEST_DB_HOST is not set, skipping the benchmark')
+
+    # Recreate the benchmark database
+    con = await aiomysql.connect(
+        host=TEST_DB_HOST,
+        user=TEST_DB_USER,
+        password=TEST_DB_PWD,
+        autocommit=True
+    )
+    async with con.cursor() as cur:
+        await cur.execute(f'DROP DATABASE IF EXISTS {BENCH_DB_NAME}')
+        await cur.execute(f'CREATE DATABASE {BENCH_DB_NAME}')
+    con.close()
+
+    # Create the schema
+    environ['DB_PWD'] = TEST_DB_PWD or ''
+    db = Database()
+    db._host = TEST_DB_HOST
+    db._user = TEST_DB_USER
+    db._database = BENCH_DB_NAME
+    await db.start()
+    return db
+
+
+async def stop_database(db: Database) -> None:
+    """
+    Close the connection pool of the benchmark database.
+
+    Parameters
+    ----------
+    db : Database
+        Started database.
+    """
+    db.pool.close()
+    await db.pool.wait_closed()
+
+
+def yt_vid_ids(amount: int, rng: random.Random) -> list[str]:
+    """
+    Generate unique random YouTube video IDs.
+
+    Parameters
+    ----------
+    amount : int
+        Amount of IDs.
+    rng : random.Random
+        Seeded random generator.
+
+    Returns
+    -------
+    ids : list[str]
+        11 character video IDs.
+    """
+    ids: set[str] = set()
+    while len(ids) < amount:
+        ids.add(''.join(rng.choices(_YT_ALPHABET, k=11)))
+    return list(ids)
+
+
+async def timed(
+    func: Callable[..., Awaitable[Any]],
+    *args: Any,
+    repeat: int = 5,
+    **kwargs: Any
+) -> float:
+    """
+    Time the fastest of multiple awaits of a coroutine function.
+
+    Parameters
+    ----------
+    func : Callable[..., Awaitable[Any]]
+        Coroutine function.
+    *args : Any
+        Arguments of the function.
+    repeat : int, default: 5
+        Amount of awaits.
+    **kwargs : Any
+        Keyword arguments of the function.
+
+    Returns
+    -------
+    seconds : float
+        Fastest duration in seconds.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = perf_counter()
+        await func(*args, **kwargs)
+        best = min(best, perf_counter() - start)
+    return best
@@ -0,0 +1,109 @@
+"""
+Micro-benchmark of the YouTube Atom feed parsing, the streaming
+lxml iterparse of `YouTubeRSS` against the former BeautifulSoup tree.
+
+Notes
+-----
+The feeds are read from `benchmarks/fixtures/*.xml`, a 15 entry
+channel feed in the format YouTube serves. Every entry
+of a fixture is parsed by both parsers so the results can be
+compared. The BeautifulSoup parser is skipped when `bs4` is not
+installed.
+
+Examples
+--------
+>>> python -m benchmarks.feed_parsing --number 500
+"""
+import argparse
+from datetime import datetime
+from pathlib import Path
+from timeit import repeat
+
+try:
+    from bs4 import BeautifulSoup
+except ImportError:
+    BeautifulSoup = None
+
+from bin import YouTubeRSS
+from bin.youtube_rss import Entry
+
+FIXTURES = Path(__file__).parent / 'fixtures'
+# Old enough to parse every entry of the fixture feeds
+MAX_DAYS_AGO = 10_000
+
+
+def parse_bs4(feed: bytes) -> list[Entry]:
+    """
+    Parse the entries of an Atom feed the way
+    `YouTubeRSS` did before the lxml parser.
+
+    Parameters
+    ----------
+    feed : bytes
+        Atom feed of a YouTube channel.
+
+    Returns
+    -------
+    entries : list[Entry]
+        Video ID, title, published and updated
+        datetimes of all complete entries.
+    """
+    soup = BeautifulSoup(feed.decode(), features='xml')
+    entries: list[Entry] = []
+    for entry in soup.find_all('entry'):
+        # Skip incomplete entries
+        yt_vid_id = entry.find('yt:videoId')
+        if not (entry.published and entry.updated and entry.title
+                and yt_vid_id and yt_vid_id.string):
+            continue
+        entries.append(
+            (
+                yt_vid_id.string,
+                entry.title.text,
+                datetime.fromisoformat(entry.published.text),
+                datetime.fromisoformat(entry.updated.text)
+            )
+        )
+    return entries
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument(
+        '--number',
+        type=int,
+        default=200,
+        help='parses per timing'
+    )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=5,
+        help='timings per parser, the fastest is reported'
+    )
+    args = parser.parse_args()
+
+    rss = YouTubeRSS()
+    for path in sorted(FIXTURES.glob('*.xml')):
+        feed = path.read_bytes()
+        parsers = {
+            'lxml': lambda: rss._parse_entries(feed, MAX_DAYS_AGO)
+        }
+        if BeautifulSoup is not None:
+            parsers['bs4'] = lambda: parse_bs4(feed)
+
+        print(f'{path.name}: {len(feed)} bytes')
+        results = {name: parse() for name, parse in parsers.items()}
+        if 'bs4' in results and results['bs4'] != results['lxml']:
+            print('  parsers disagree, lxml parsed '
+                  f"{len(results['lxml'])} of {len(results['bs4'])} entries")
+        for name, parse in parsers.items():
+            best = min(repeat(parse, number=args.number, repeat=args.repeat))
+            print(
+                f'  {name:>4}: {best / args.number * 1e3:8.3f} ms per feed,'
+                f' {len(results[name])} entries'
+            )
+
+
+if __name__ == '__main__':
+    main()
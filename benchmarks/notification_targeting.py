@@ -0,0 +1,270 @@
+"""
+Benchmark of the guild targeting of a combined status and T-0 change
+notification, the single pass of `notification_iter` against the
+former three queries.
+
+Notes
+-----
+Seeds 10k guilds with random notification settings, agency filters
+and scheduled events. The former approach queried the guilds with
+both changes enabled, with only the status change and with only the
+T-0 change separately, it is reconstructed in `former_targets`.
+Both approaches are checked to target the same guilds with the same
+changes. Requires a MySQL database, see `benchmarks._database`.
+
+Examples
+--------
+>>> TEST_DB_HOST=localhost python -m benchmarks.notification_targeting
+"""
+import argparse
+import asyncio
+from datetime import datetime, timedelta, timezone
+import random
+
+from benchmarks._database import start_database, stop_database, timed
+from bin import Database
+
+# Seeded table sizes
+AGENCIES = 50
+GUILDS = 10_000
+# Launch of the notification and its new status, Go
+LL2_ID = f'{0:036d}'
+AGENCY_ID = 1
+STATUS = 1
+
+# Status and T-0 setting columns of the guilds
+SETTINGS = (
+    'notification_launch',
+    'notification_event',
+    'notification_t0_change',
+    'notification_tbd',
+    'notification_tbc',
+    'notification_go',
+    'notification_liftoff',
+    'notification_hold',
+    'notification_deploy',
+    'notification_end_status',
+    'notification_scheduled_event'
+)
+
+
+async def seed(db: Database, rng: random.Random) -> None:
+    """
+    Fill the tables with guilds with random notification
+    settings, agency filters and scheduled events.
+
+    Parameters
+    ----------
+    db : Database
+        Started database.
+    rng : random.Random
+        Seeded random generator.
+    """
+    now = datetime.now(timezone.utc).replace(microsecond=0, tzinfo=None)
+    guilds = [
+        (
+            guild_id,
+            f'https://discord.com/api/webhooks/{guild_id}/token',
+            rng.random() < .5,
+            *(rng.random() < .5 for _ in SETTINGS)
+        )
+        for guild_id in range(1, GUILDS + 1)
+    ]
+    async with db.pool.acquire() as con, con.cursor() as cur:
+        await cur.executemany(
+            'INSERT INTO ll2_agencies (agency_id, name) VALUES (%s, %s)',
+            [(i, f'Agency {i}') for i in range(AGENCIES)]
+        )
+        await cur.execute(
+            """
+            INSERT INTO ll2_events
+            (ll2_id, agency_id, name, status, start, end, slug, flightclub)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, 1)
+            """,
+            (
+                LL2_ID,
+                AGENCY_ID,
+                'Falcon 9 | Starlink',
+                STATUS,
+                now + timedelta(hours=1),
+                now + timedelta(hours=2),
+                'falcon-9-starlink'
+            )
+        )
+        await cur.executemany(
+            f"""
+            INSERT INTO enabled_guilds
+            (
+                guild_id,
+                notification_webhook_url,
+                agencies_include_exclude,
+                {', '.join(SETTINGS)}
+            )
+            VALUES ({', '.join(['%s'] * (len(SETTINGS) + 3))})
+            """,
+            guilds
+        )
+        # A few filtered agencies per guild
+        await cur.executemany(
+            'INSERT INTO ll2_agencies_filter VALUES (%s, %s)',
+            [
+                (guild_id, agency_id)
+                for guild_id in range(1, GUILDS + 1)
+                for agency_id in rng.sample(range(AGENCIES), 3)
+            ]
+        )
+        # Scheduled events of the launch
+        await cur.executemany(
+            'INSERT INTO scheduled_events VALUES (%s, %s, %s)',
+            [
+                (guild_id, guild_id, LL2_ID)
+                for guild_id in range(1, GUILDS + 1)
+                if rng.random() < .3
+            ]
+        )
+        await cur.execute(
+            """
+            ANALYZE TABLE
+                ll2_agencies,
+                ll2_events,
+                enabled_guilds,
+                ll2_agencies_filter,
+                scheduled_events
+            """
+        )
+        await cur.fetchall()
+
+
+async def targets(db: Database) -> dict[int, tuple[bool, bool]]:
+    """
+    Guilds to notify in a single pass of `notification_iter`.
+
+    Parameters
+    ----------
+    db : Database
+        Seeded database.
+
+    Returns
+    -------
+    targets : dict[int, tuple[bool, bool]]
+        T-0 and status change per guild ID.
+    """
+    return {
+        row['guild_id']: (row['t0_change'], row['status_change'])
+        async for row in db.notification_iter(
+            ll2_id=LL2_ID,
+            status=STATUS,
+            t0_change=True
+        )
+    }
+
+
+async def former_targets(db: Database) -> dict[int, tuple[bool, bool]]:
+    """
+    Guilds to notify with the former three queries, for guilds
+    with both changes, only the status and only the T-0 change.
+
+    Parameters
+    ----------
+    db : Database
+        Seeded database.
+
+    Returns
+    -------
+    targets : dict[int, tuple[bool, bool]]
+        T-0 and status change per guild ID.
+    """
+    result: dict[int, tuple[bool, bool]] = {}
+    for change, settings in (
+        (
+            (True, True),
+            'eg.notification_t0_change AND eg.notification_launch'
+            ' AND eg.notification_go'
+        ),
+        (
+            (False, True),
+            'NOT eg.notification_t0_change AND eg.notification_go'
+        ),
+        (
+            (True, False),
+            'eg.notification_t0_change AND eg.notification_launch'
+            ' AND NOT eg.notification_go'
+        )
+    ):
+        async with db.pool.acquire() as con, con.cursor() as cur:
+            await cur.execute(
+                f"""
+                SELECT
+                    eg.guild_id,
+                    eg.notification_webhook_url,
+                    le.flightclub AND eg.notification_button_fc AS button_fc,
+                    eg.notification_button_g4l AS button_g4l,
+                    eg.notification_button_sln AS button_sln,
+                    se.scheduled_event_id
+                FROM
+                    enabled_guilds AS eg
+                JOIN
+                    ll2_events as le
+                    ON le.ll2_id = %s
+                LEFT JOIN
+                    ll2_agencies_filter as laf
+                    ON laf.guild_id = eg.guild_id
+                    AND laf.agency_id = le.agency_id
+                LEFT JOIN
+                    scheduled_events AS se
+                    ON se.guild_id = eg.guild_id
+                    AND eg.notification_scheduled_event
+                    AND se.ll2_id = le.ll2_id
+                WHERE
+                    eg.notification_webhook_url IS NOT NULL
+                    AND
+                    (
+                        le.is_event
+                        OR laf.agency_id IS NULL
+                        XOR eg.agencies_include_exclude <=> 1
+                    )
+                    AND
+                        {settings}
+                """,
+                (LL2_ID,)
+            )
+            for row in await cur.fetchall():
+                result[row[0]] = change
+    return result
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=10,
+        help='timings per approach, the fastest is reported'
+    )
+    args = parser.parse_args()
+
+    db = await start_database()
+    try:
+        await seed(db, random.Random(24))
+
+        single = await targets(db)
+        former = await former_targets(db)
+        if single != former:
+            print(
+                f'approaches disagree, single pass: {len(single)},'
+                f' former: {len(former)} guilds'
+            )
+        print(f'{len(single)} of {GUILDS} guilds targeted')
+
+        for name, func in (
+            ('single pass', targets),
+            ('three queries', former_targets)
+        ):
+            seconds = await timed(func, db, repeat=args.repeat)
+            print(f'{name:>13}: {seconds * 1e3:8.2f} ms')
+    finally:
+        await stop_database(db)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
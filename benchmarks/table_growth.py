@@ -0,0 +1,138 @@
+"""
+Benchmark of the `sent_streams` table as it grows, the indexed
+fixed-width key against the former unindexed text column.
+
+Notes
+-----
+The table is grown to each size with random video IDs sent during
+the last 400 days, the ones older than a year are removed by the
+clean-up. The same rows are copied into `sent_streams_text`, the
+former schema, where IDs were checked one at a time. Lookups
+miss the sent media cache, every round checks IDs that were
+not checked before, half of them sent. Requires a MySQL
+database, see `benchmarks._database`.
+
+Examples
+--------
+>>> TEST_DB_HOST=localhost python -m benchmarks.table_growth
+"""
+import argparse
+import asyncio
+from datetime import datetime, timedelta, timezone
+import random
+
+from benchmarks._database import (
+    start_database,
+    stop_database,
+    timed,
+    yt_vid_ids
+)
+
+# IDs per lookup and insert
+BATCH = 50
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument(
+        '--sizes',
+        type=int,
+        nargs='+',
+        default=[10_000, 100_000, 1_000_000],
+        help='table sizes in rows'
+    )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=5,
+        help='timings per operation, the fastest is reported'
+    )
+    args = parser.parse_args()
+
+    rng = random.Random(13)
+    db = await start_database()
+    now = datetime.now(timezone.utc).replace(microsecond=0, tzinfo=None)
+    try:
+        async with db.pool.acquire() as con, con.cursor() as cur:
+            await cur.execute(
+                """
+                CREATE TABLE sent_streams_text (
+                yt_vid_id TEXT,
+                datetime DATETIME DEFAULT NULL
+                )
+                """
+            )
+
+        # Unseeded IDs of the lookups and inserts per size
+        unseeded = len(args.sizes) * (2 * args.repeat + 1) * BATCH
+        ids = yt_vid_ids(max(args.sizes) + unseeded, rng)
+        new_ids = iter(ids[max(args.sizes):])
+        size = 0
+        print(' '.join(
+            f'{column:>9}'
+            for column in ('rows', 'lookup', 'text', 'insert', 'clean')
+        ))
+        for target in sorted(args.sizes):
+            # Grow both tables
+            rows = [
+                (_id, now - timedelta(minutes=rng.randrange(400 * 24 * 60)))
+                for _id in ids[size:target]
+            ]
+            async with db.pool.acquire() as con, con.cursor() as cur:
+                for i in range(0, len(rows), 10_000):
+                    for table in ('sent_streams', 'sent_streams_text'):
+                        await cur.executemany(
+                            f'INSERT INTO {table} VALUES (%s, %s)',
+                            rows[i:i + 10_000]
+                        )
+                await cur.execute(
+                    'ANALYZE TABLE sent_streams, sent_streams_text'
+                )
+                await cur.fetchall()
+            size = target
+
+            # Uncached IDs, half of them sent
+            lookups = iter(rng.sample(ids[:size], BATCH * args.repeat))
+
+            async def lookup() -> None:
+                batch = [next(lookups) for _ in range(BATCH // 2)]
+                batch += [next(new_ids) for _ in range(BATCH // 2)]
+                await db.sent_media_exists_many(yt_vid_ids=batch)
+
+            async def lookup_text() -> None:
+                batch = rng.sample(ids[:size], BATCH // 2)
+                batch += [next(new_ids) for _ in range(BATCH // 2)]
+                async with db.pool.acquire() as con, con.cursor() as cur:
+                    for _id in batch:
+                        await cur.execute(
+                            """
+                            SELECT datetime
+                            FROM sent_streams_text
+                            WHERE yt_vid_id=%s
+                            """,
+                            (_id,)
+                        )
+                        await cur.fetchall()
+
+            async def insert() -> None:
+                await db.sent_media_add_many(
+                    yt_vid_ids=[next(new_ids) for _ in range(BATCH)]
+                )
+
+            lookup_time = await timed(lookup, repeat=args.repeat)
+            lookup_text_time = await timed(lookup_text, repeat=1)
+            insert_time = await timed(insert, repeat=args.repeat)
+            clean_time = await timed(db.sent_media_clean, repeat=1)
+            print(
+                f'{size:>9}'
+                f' {lookup_time * 1e3:>7.2f}ms'
+                f' {lookup_text_time * 1e3:>7.2f}ms'
+                f' {insert_time * 1e3:>7.2f}ms'
+                f' {clean_time * 1e3:>7.2f}ms'
+            )
+    finally:
+        await stop_database(db)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -1,12 +1,17 @@
 from .aget import *
+from .config_file import *
 from .enums import *
 from .database import *
+from .delivery import *
+from .fanout import *
 from .launchlibrary2 import *
 from .minutes import *
 from .nasatv import *
+from .session import *
 from .notification_check import *
 from .snapi import *
 from .strings import *
+from .ttl_cache import *
 from .youtube_api import *
 from .youtube_rss import *
 from .youtube_id import *
@@ -1,6 +1,7 @@
-import aiohttp
 from typing import Any, Literal, overload
 
+from .session import session_manager
+
 @overload
 async def get(
     url: str,
@@ -26,8 +27,8 @@ async def get(
     json: bool = False
 ) -> str | dict[str, Any]:
     """
-    Use aiohttp to get the contents of
-    a webpage or API asynchronously.
+    Use the shared aiohttp session to get the
+    contents of a webpage or API asynchronously.
 
     Parameters
     ----------
@@ -44,10 +45,7 @@ async def get(
         Response data in a form of a string or dictionairy
         depending on the json parameter.
     """
-    async with (
-        aiohttp.ClientSession() as session,
-        session.get(url, headers=headers) as response
-    ):
+    async with session_manager.session.get(url, headers=headers) as response:
         if json:
             return await response.json()
         else:
@@ -0,0 +1,105 @@
+from collections.abc import Callable
+import json
+import logging
+import os
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+class ConfigFile:
+    """
+    Json configuration file kept in memory, only
+    reloaded when its modification time changes.
+
+    Notes
+    -----
+    Use the `.reload()` method to check the file for changes
+    and `.data` to get the parsed and validated configuration.
+    When the file is missing it is created with the default.
+    """
+    def __init__(
+        self,
+        path: str,
+        default: dict[str, Any],
+        validate: Callable[[dict[str, Any]], None] | None = None
+    ) -> None:
+        # File location
+        self.path = path
+        # Configuration used when the file is missing or invalid
+        self.default = default
+        # Validation function, raises an exception for invalid data
+        self.validate = validate
+        # Parsed configuration
+        self.data: dict[str, Any] = json.loads(json.dumps(default))
+        # Modification time and size of the loaded file
+        self._stat: tuple[int, int] | None = None
+
+    def _file_stat(self) -> tuple[int, int] | None:
+        """
+        Modification time and size of the file.
+
+        Returns
+        -------
+        stat : tuple[int, int] or None
+            Modification time in nanoseconds and
+            size in bytes, None when missing.
+        """
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def reload(self) -> bool:
+        """
+        Reload the file when it changed since the last load.
+
+        Returns
+        -------
+        reloaded : bool
+            Whether the configuration was (re)loaded.
+        """
+        stat = self._file_stat()
+
+        # Create the file with the default configuration
+        if stat is None:
+            self.save(json.loads(json.dumps(self.default)))
+            logger.info(f'Created {self.path} with the default configuration')
+            return True
+
+        # Unchanged
+        if stat == self._stat:
+            return False
+        self._stat = stat
+
+        # Load and validate, keep the previous configuration on failure
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if self.validate:
+                self.validate(data)
+        except Exception as e:
+            logger.error(
+                f'Invalid configuration in {self.path}, keeping '
+                f'the previous configuration: {e}, {type(e)}'
+            )
+            return False
+
+        self.data = data
+        logger.info(f'Reloaded {self.path}')
+        return True
+
+    def save(self, data: dict[str, Any]) -> None:
+        """
+        Store the configuration into the file
+        without triggering a reload.
+
+        Parameters
+        ----------
+        data : dict[str, Any]
+            Configuration to store.
+        """
+        self.data = data
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        self._stat = self._file_stat()
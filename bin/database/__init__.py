@@ -1,4 +1,7 @@
+from os import getenv
+
 from ._button_settings import ButtonSettings
+from ._delivery_queue import DeliveryQueue
 from ._enabled_guilds import EnabledGuilds
 from ._guilds import Guilds
 from ._ll2_agencies import LL2Agencies
@@ -17,6 +20,7 @@ from ._start import Start
 
 class Database(
     ButtonSettings,
+    DeliveryQueue,
     EnabledGuilds,
     Guilds,
     LL2Agencies,
@@ -37,9 +41,17 @@ class Database(
     Database methods for LiveLaunch.
     """
     def __init__(self) -> None:
-        self._host = 'server.juststephen.com'
+        self._host = getenv('DB_HOST', 'server.juststephen.com')
         self._user = 'root'
         self._database = 'LiveLaunch'
+        # Initialize delivery retry settings
+        DeliveryQueue.__init__(self)
         # Initialize filter classes
         LL2AgenciesFilter.__init__(self)
         NewsFilter.__init__(self)
+        # Initialize countdown notification schedule
+        NotificationCountdown.__init__(self)
+        # Initialize sent media caches
+        SentMedia.__init__(self)
+        # Initialize scheduled events reconciliation
+        ScheduledEvents.__init__(self)
@@ -56,6 +56,7 @@ class ButtonSettings:
                 """,
                 args
             )
+        self.notification_countdown_mark_dirty(guild_id=guild_id)
 
     async def button_settings_get(
         self,
@@ -0,0 +1,276 @@
+import aiomysql
+import json
+import logging
+from os import getenv
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+class DeliveryQueue:
+    """
+    Persistent queue of webhook messages
+    that failed and have to be retried.
+
+    Notes
+    -----
+    Retries are spread with an exponential
+    backoff, jobs are dropped after
+    `DELIVERY_MAX_ATTEMPTS` attempts.
+    Jobs are sent to the webhook the guild
+    has set at the time of the retry.
+    """
+    def __init__(self) -> None:
+        # Maximum amount of attempts per job
+        self._dq_max_attempts = int(getenv('DELIVERY_MAX_ATTEMPTS', 10))
+        # Backoff in seconds, doubled every attempt
+        self._dq_backoff = float(getenv('DELIVERY_BACKOFF', 30))
+        self._dq_backoff_max = float(getenv('DELIVERY_BACKOFF_MAX', 3600))
+        # Guild settings per webhook type
+        self._dq_webhook_settings = {
+            'video': ('channel_id', 'webhook_url'),
+            'news': ('news_channel_id', 'news_webhook_url'),
+            'notification': (
+                'notification_channel_id',
+                'notification_webhook_url'
+            )
+        }
+
+    async def delivery_queue_webhook_remove(
+        self,
+        guild_id: int,
+        webhook: str,
+        webhook_url: str
+    ) -> bool:
+        """
+        Remove an unfound webhook from the guild
+        settings and its queued messages, only
+        when the guild still uses that webhook.
+        Messages of a replaced webhook are kept.
+
+        Parameters
+        ----------
+        guild_id : int
+            Discord guild ID.
+        webhook : str
+            Webhook type, `video`, `news`
+            or `notification`.
+        webhook_url : str
+            Unfound Discord webhook URL.
+
+        Returns
+        -------
+        removed : bool
+            Whether the guild settings were cleared.
+        """
+        channel, url = self._dq_webhook_settings[webhook]
+        async with self.pool.acquire() as con, con.cursor() as cur:
+            await cur.execute(
+                f"""
+                UPDATE enabled_guilds
+                SET
+                    {channel} = NULL,
+                    {url} = NULL
+                WHERE
+                    guild_id = %s
+                    AND {url} = %s
+                """,
+                (guild_id, webhook_url)
+            )
+            if not (removed := cur.rowcount > 0):
+                return removed
+            await cur.execute(
+                """
+                DELETE FROM delivery_queue
+                WHERE guild_id = %s
+                AND webhook = %s
+                """,
+                (guild_id, webhook)
+            )
+        if webhook == 'notification':
+            self.notification_countdown_mark_dirty(guild_id=guild_id)
+        return removed
+
+    def _delivery_queue_backoff(self, attempts: int) -> float:
+        """
+        Seconds to wait before the next attempt.
+
+        Parameters
+        ----------
+        attempts : int
+            Amount of failed attempts.
+
+        Returns
+        -------
+        backoff : float
+            Seconds until the next attempt.
+        """
+        return min(
+            self._dq_backoff_max,
+            self._dq_backoff * 2 ** max(0, attempts - 1)
+        )
+
+    async def delivery_queue_add(
+        self,
+        guild_id: int,
+        webhook: str,
+        payload: dict[str, Any]
+    ) -> None:
+        """
+        Queue a failed webhook message for a retry.
+
+        Parameters
+        ----------
+        guild_id : int
+            Discord guild ID.
+        webhook : str
+            Webhook type, `video`, `news`
+            or `notification`.
+        payload : dict[str, Any]
+            Json serializable message.
+        """
+        async with self.pool.acquire() as con, con.cursor() as cur:
+            await cur.execute(
+                """
+                INSERT INTO delivery_queue
+                (guild_id, webhook, payload, attempts, next_attempt)
+                VALUES (%s, %s, %s, 1, DATE_ADD(NOW(), INTERVAL %s SECOND))
+                """,
+                (
+                    guild_id,
+                    webhook,
+                    json.dumps(payload),
+                    self._delivery_queue_backoff(1)
+                )
+            )
+
+    async def delivery_queue_due(
+        self,
+        limit: int = 100
+    ) -> list[dict[str, Any]]:
+        """
+        Get the queued messages that are due for a retry.
+
+        Parameters
+        ----------
+        limit : int, default: 100
+            Maximum amount of messages.
+
+        Returns
+        -------
+        jobs : list[dict[
+            id : int,
+            guild_id : int,
+            webhook : str,
+            webhook_url : str or None,
+            payload : dict[str, Any],
+            attempts : int
+        ]]
+            Due messages, oldest first, with
+            the current webhook URL of the guild,
+            None when the webhook was removed.
+        """
+        async with (
+            self.pool.acquire() as con,
+            con.cursor(aiomysql.DictCursor) as cur
+        ):
+            await cur.execute(
+                """
+                SELECT
+                    dq.id,
+                    dq.guild_id,
+                    dq.webhook,
+                    CASE dq.webhook
+                        WHEN 'video' THEN eg.webhook_url
+                        WHEN 'news' THEN eg.news_webhook_url
+                        WHEN 'notification' THEN eg.notification_webhook_url
+                    END AS webhook_url,
+                    dq.payload,
+                    dq.attempts
+                FROM
+                    delivery_queue AS dq
+                JOIN
+                    enabled_guilds AS eg
+                    ON eg.guild_id = dq.guild_id
+                WHERE
+                    dq.next_attempt <= NOW()
+                ORDER BY dq.next_attempt
+                LIMIT %s
+                """,
+                (limit,)
+            )
+            jobs = await cur.fetchall()
+        for job in jobs:
+            job['payload'] = json.loads(job['payload'])
+        return jobs
+
+    async def delivery_queue_retry(self, id: int, attempts: int) -> None:
+        """
+        Reschedule a queued message after
+        another failed attempt, drops it
+        when the maximum is reached.
+
+        Parameters
+        ----------
+        id : int
+            Queued message ID.
+        attempts : int
+            Amount of failed attempts.
+        """
+        if attempts >= self._dq_max_attempts:
+            logger.warning(
+                f'Dropping queued delivery {id} after {attempts} attempts'
+            )
+            await self.delivery_queue_remove(id)
+            return
+        async with self.pool.acquire() as con, con.cursor() as cur:
+            await cur.execute(
+                """
+                UPDATE delivery_queue
+                SET
+                    attempts = %s,
+                    next_attempt = DATE_ADD(NOW(), INTERVAL %s SECOND)
+                WHERE id = %s
+                """,
+                (attempts, self._delivery_queue_backoff(attempts), id)
+            )
+
+    async def delivery_queue_remove(self, id: int) -> None:
+        """
+        Remove a queued message.
+
+        Parameters
+        ----------
+        id : int
+            Queued message ID.
+        """
+        async with self.pool.acquire() as con, con.cursor() as cur:
+            await cur.execute(
+                """
+                DELETE FROM delivery_queue
+                WHERE id = %s
+                """,
+                (id,)
+            )
+
+    async def delivery_queue_stats(self) -> dict[str, float | int]:
+        """
+        Statistics of the delivery queue.
+
+        Returns
+        -------
+        stats : dict[str, float | int]
+            Amount of queued and due messages
+            and the age of the oldest in seconds.
+        """
+        async with self.pool.acquire() as con, con.cursor() as cur:
+            await cur.execute(
+                """
+                SELECT
+                    COUNT(*),
+                    COALESCE(SUM(next_attempt <= NOW()), 0),
+                    COALESCE(TIMESTAMPDIFF(SECOND, MIN(created), NOW()), 0)
+                FROM delivery_queue
+                """
+            )
+            depth, due, age = await cur.fetchone()
+        return {'depth': depth, 'due': int(due), 'age': age}
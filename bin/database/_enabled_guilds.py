@@ -71,6 +71,8 @@ class EnabledGuilds:
                     notification_webhook_url
                 )
             )
+        self.scheduled_events_mark_dirty(guild_id)
+        self.notification_countdown_mark_dirty(guild_id=guild_id)
 
     async def enabled_guilds_remove(self, guild_id: int) -> None:
         """
@@ -90,6 +92,8 @@ class EnabledGuilds:
                 """,
                 (guild_id,)
             )
+        self.scheduled_events_mark_dirty(guild_id)
+        self.notification_countdown_mark_dirty(guild_id=guild_id)
 
     async def enabled_guilds_check(self, guild_id: int) -> bool:
         """
@@ -334,6 +338,9 @@ class EnabledGuilds:
                 """,
                 args
             )
+        if scheduled_events is not None:
+            self.scheduled_events_mark_dirty(guild_id)
+        self.notification_countdown_mark_dirty(guild_id=guild_id)
 
     async def enabled_guilds_clean(self) -> None:
         """
@@ -373,6 +380,8 @@ class EnabledGuilds:
                     eg.notification_webhook_url IS NULL
                 """
             )
+            if cur.rowcount:
+                self.notification_countdown_mark_dirty()
 
     async def enabled_guilds_unused_notification_iter(
         self
@@ -1,4 +1,66 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from time import monotonic
+
+@dataclass
+class FilterIndex:
+    """
+    In-memory index of the filters
+    per guild for fast checking.
+
+    Attributes
+    ----------
+    guilds : dict[int, tuple[bool, frozenset[int]]]
+        Include/exclude setting and
+        the filtered IDs per guild.
+    loaded : float or None, default: None
+        Monotonic time of the last
+        full load, None when never
+        loaded.
+    ttl : float, default: 300
+        Seconds after which the index
+        is fully reloaded to pick up
+        changes made outside the bot.
+    """
+    guilds: dict[int, tuple[bool, frozenset[int]]] = field(
+        default_factory=dict
+    )
+    loaded: float | None = None
+    ttl: float = 300
+
+    @property
+    def expired(self) -> bool:
+        """
+        Whether the index needs a full reload.
+
+        Returns
+        -------
+        expired : bool
+            True when never loaded or
+            older than `.ttl` seconds.
+        """
+        return self.loaded is None or monotonic() - self.loaded > self.ttl
+
+    def check(self, guild_id: int, id_value: int | None) -> bool:
+        """
+        Check if the ID passes the filter of the guild.
+
+        Parameters
+        ----------
+        guild_id : int
+            Discord guild ID.
+        id_value : int or None
+            ID to check, None
+            when it has no ID.
+
+        Returns
+        -------
+        check : bool
+            True when the ID should be
+            sent to the guild, IDs that are
+            None are only sent when excluding.
+        """
+        include, ids = self.guilds.get(guild_id, (False, frozenset()))
+        return (id_value is None or id_value not in ids) != include
 
 @dataclass
 class FilterTable:
@@ -26,12 +88,16 @@ class FilterTable:
     name_column : str
         Column name of the data table
         that contains the names.
+    index : FilterIndex
+        In-memory index of the
+        filters per guild.
     """
     data_table: str
     filter_table: str
     id_column: str
     include_exclude_column: str
     name_column: str
+    index: FilterIndex = field(default_factory=FilterIndex)
 
 class Filter:
     """
@@ -72,6 +138,7 @@ class Filter:
                 """,
                 (include_or_exclude, guild_id)
             )
+        await self.filter_index_refresh(tables, guild_id)
 
     async def filter_get_include_exclude(
         self,
@@ -179,6 +246,7 @@ class Filter:
                     else:
                         failed.append(arg)
 
+        await self.filter_index_refresh(tables, guild_id)
         return failed
 
     async def filter_add(
@@ -399,3 +467,102 @@ class Filter:
                     (guild_id, id_value)
                 )
             return (await cur.fetchone())[0] == 0
+
+    async def filter_index_load(
+        self,
+        tables: FilterTable,
+        *,
+        guild_id: int | None = None
+    ) -> None:
+        """
+        Load the filters of all or a
+        single guild into the index.
+
+        Parameters
+        ----------
+        tables : FilterTable
+            FilterTable object
+            with the required
+            SQL table data.
+        guild_id : int or None, default: None
+            Discord guild ID, when None,
+            load the filters of all guilds.
+        """
+        guilds: dict[int, tuple[bool, set[int]]] = {}
+        async with self.pool.acquire() as con, con.cursor() as cur:
+            await cur.execute(
+                f"""
+                SELECT
+                    eg.guild_id,
+                    eg.{tables.include_exclude_column},
+                    `filter`.{tables.id_column}
+                FROM
+                    enabled_guilds AS eg
+                LEFT JOIN
+                    {tables.filter_table} AS `filter`
+                    ON `filter`.guild_id = eg.guild_id
+                {'WHERE eg.guild_id = %s' if guild_id else ''}
+                """,
+                (guild_id,) if guild_id else None
+            )
+            for row_guild_id, include, id_value in await cur.fetchall():
+                guild = guilds.setdefault(row_guild_id, (include != 0, set()))
+                if id_value is not None:
+                    guild[1].add(id_value)
+
+        filters = {
+            row_guild_id: (include, frozenset(ids))
+            for row_guild_id, (include, ids) in guilds.items()
+        }
+        index = tables.index
+        if guild_id:
+            index.guilds.pop(guild_id, None)
+            index.guilds |= filters
+        else:
+            index.guilds = filters
+            index.loaded = monotonic()
+
+    async def filter_index_refresh(
+        self,
+        tables: FilterTable,
+        guild_id: int
+    ) -> None:
+        """
+        Reload the filters of a guild after a change,
+        only needed when the index has been loaded.
+
+        Parameters
+        ----------
+        tables : FilterTable
+            FilterTable object
+            with the required
+            SQL table data.
+        guild_id : int
+            Discord guild ID.
+        """
+        if tables.index.loaded is not None:
+            await self.filter_index_load(tables, guild_id=guild_id)
+
+    async def filter_index_get(
+        self,
+        tables: FilterTable
+    ) -> FilterIndex:
+        """
+        Get the filter index, fully
+        reloaded when it expired.
+
+        Parameters
+        ----------
+        tables : FilterTable
+            FilterTable object
+            with the required
+            SQL table data.
+
+        Returns
+        -------
+        index : FilterIndex
+            Filter index of all guilds.
+        """
+        if tables.index.expired:
+            await self.filter_index_load(tables)
+        return tables.index
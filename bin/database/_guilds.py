@@ -45,6 +45,7 @@ class Guilds:
 
             # Drop the temporary table
             await cur.execute('DROP TEMPORARY TABLE `tmp_guilds`;')
+        self.notification_countdown_mark_dirty()
 
     async def guild_add(self, guild_id: int) -> None:
         """
@@ -82,3 +83,4 @@ class Guilds:
                 """,
                 (guild_id,)
             )
+        self.notification_countdown_mark_dirty(guild_id=guild_id)
@@ -33,6 +33,9 @@ class LL2Agencies:
                     name
                 )
             )
+            # Reload countdown notifications when the name changed
+            if cur.rowcount == 2:
+                self.notification_countdown_mark_dirty()
 
     async def ll2_agencies_get(self, ll2_id: str) -> tuple[str, str]:
         """
@@ -1,4 +1,4 @@
-from ._filter import Filter, FilterTable
+from ._filter import Filter, FilterIndex, FilterTable
 
 class LL2AgenciesFilter(Filter):
     """
@@ -32,11 +32,13 @@ class LL2AgenciesFilter(Filter):
             `True` when included,
             `False` when excluded.
         """
-        return await self.filter_set_include_exclude(
+        await self.filter_set_include_exclude(
             self._agency_filter_table,
             guild_id,
             include_or_exclude=include_or_exclude
         )
+        self.scheduled_events_mark_dirty(guild_id)
+        self.notification_countdown_mark_dirty(guild_id=guild_id)
 
     async def ll2_agencies_filter_get_include_exclude(
         self,
@@ -88,12 +90,15 @@ class LL2AgenciesFilter(Filter):
             List containing all the
             failed names and IDs.
         """
-        return await self.filter_add(
+        failed = await self.filter_add(
             self._agency_filter_table,
             guild_id,
             names=agency_names,
             ids=agency_ids
         )
+        self.scheduled_events_mark_dirty(guild_id)
+        self.notification_countdown_mark_dirty(guild_id=guild_id)
+        return failed
 
     async def ll2_agencies_filter_remove(
         self,
@@ -122,12 +127,15 @@ class LL2AgenciesFilter(Filter):
             List containing all the
             failed names and IDs.
         """
-        return await self.filter_remove(
+        failed = await self.filter_remove(
             self._agency_filter_table,
             guild_id,
             names=agency_names,
             ids=agency_ids
         )
+        self.scheduled_events_mark_dirty(guild_id)
+        self.notification_countdown_mark_dirty(guild_id=guild_id)
+        return failed
 
     async def ll2_agencies_filter_list(
         self,
@@ -187,3 +195,17 @@ class LL2AgenciesFilter(Filter):
             guild_id,
             id_value=agency_id
         )
+
+    async def ll2_agencies_filter_index(self) -> FilterIndex:
+        """
+        Get the in-memory index of the agency
+        filters of all guilds for bulk checking.
+
+        Returns
+        -------
+        index : FilterIndex
+            Agency filter index, use `.check()`
+            to see if an agency passes the
+            filter of a guild.
+        """
+        return await self.filter_index_get(self._agency_filter_table)
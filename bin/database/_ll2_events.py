@@ -21,6 +21,7 @@ class LL2Events:
         status: int | None = None,
         webcast_live: bool = False,
         flightclub: bool = False,
+        is_event: bool = False,
         **kwargs: Any
     ) -> None:
         """
@@ -53,14 +54,31 @@ class LL2Events:
             Event is live or not.
         flightclub : bool, default: False
             Event has a Flight Club page.
+        is_event : bool, default: False
+            Whether it is an event
+            instead of a launch.
         **kwargs : Any
             Ignored kwargs.
         """
         async with self.pool.acquire() as con, con.cursor() as cur:
             await cur.execute(
                 """
-                INSERT INTO ll2_events
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                INSERT INTO ll2_events (
+                    ll2_id,
+                    agency_id,
+                    name,
+                    status,
+                    description,
+                    url,
+                    image_url,
+                    start,
+                    end,
+                    webcast_live,
+                    slug,
+                    flightclub,
+                    is_event
+                )
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
                 """,
                 (
                     ll2_id,
@@ -73,9 +91,12 @@ class LL2Events:
                     end,
                     webcast_live,
                     slug,
-                    flightclub
+                    flightclub,
+                    is_event
                 )
             )
+        self.scheduled_events_mark_dirty(ll2_id=ll2_id)
+        self.notification_countdown_mark_dirty(ll2_id=ll2_id)
 
     async def ll2_events_remove(
         self,
@@ -98,6 +119,8 @@ class LL2Events:
                 """,
                 (ll2_id,)
             )
+        self.scheduled_events_mark_dirty(ll2_id=ll2_id)
+        self.notification_countdown_mark_dirty(ll2_id=ll2_id)
 
     async def ll2_events_iter(
         self,
@@ -127,7 +150,8 @@ class LL2Events:
             end : datetime,
             webcast_live : bool,
             slug : str,
-            flightclub : bool
+            flightclub : bool,
+            is_event : bool
         ]]
             Yields row with of an LL2
             event with the relevant data.
@@ -157,6 +181,7 @@ class LL2Events:
                 # Convert booleans
                 row['webcast_live'] = bool(row['webcast_live'])
                 row['flightclub'] = bool(row['flightclub'])
+                row['is_event'] = bool(row['is_event'])
                 yield row
 
     async def ll2_events_get(
@@ -185,7 +210,8 @@ class LL2Events:
             end : datetime,
             webcast_live : bool,
             slug : str,
-            flightclub : bool
+            flightclub : bool,
+            is_event : bool
         ] or None
             Returns a row with the ll2_event's data
             if it exists, otherwise None.
@@ -210,6 +236,7 @@ class LL2Events:
             # Convert booleans
             row['webcast_live'] = bool(row['webcast_live'])
             row['flightclub'] = bool(row['flightclub'])
+            row['is_event'] = bool(row['is_event'])
         return row
 
     async def ll2_events_edit(
@@ -303,3 +330,12 @@ class LL2Events:
                 """,
                 args
             )
+        # Recompute scheduled events when the selection can change
+        if (agency_id is not None or status is not None or url is not MISSING
+                or start is not None or end is not None):
+            self.scheduled_events_mark_dirty(ll2_id=ll2_id)
+        # Reload countdown notifications when their content can change
+        if (agency_id is not None or name is not None or status is not None
+                or url is not MISSING or image_url is not MISSING
+                or start is not None or flightclub is not None):
+            self.notification_countdown_mark_dirty(ll2_id=ll2_id)
@@ -55,10 +55,10 @@ class LL2EventsNext:
                 WHERE
                     le.start > NOW()
                     AND
-                        le.ll2_id REGEXP '^[0-9]+$' = %s
+                        le.is_event = %s
                     AND
                     (
-                        le.ll2_id REGEXP '^[0-9]+$'
+                        le.is_event
                         OR laf.agency_id IS NULL
                         XOR eg.agencies_include_exclude <=> 1
                     )
@@ -1,3 +1,5 @@
+from collections.abc import Iterable
+
 class News:
     """
     News sites table methods.
@@ -54,3 +56,42 @@ class News:
                 (news_site_name,)
             )
             return (await cur.fetchone())[0]
+
+    async def news_sites_get(
+        self,
+        news_site_names: Iterable[str]
+    ) -> dict[str, tuple[int, str | None]]:
+        """
+        Get the IDs and logos of news sites by their names.
+
+        Parameters
+        ----------
+        news_site_names : Iterable[str]
+            Names of the news sites.
+
+        Returns
+        -------
+        news_sites : dict[str, tuple[int, str or None]]
+            News site ID and logo URL per name,
+            unknown news sites are left out.
+        """
+        if not (names := list(dict.fromkeys(news_site_names))):
+            return {}
+        async with self.pool.acquire() as con, con.cursor() as cur:
+            await cur.execute(
+                f"""
+                SELECT
+                    news_site_name,
+                    news_site_id,
+                    logo_url
+                FROM
+                    news_sites
+                WHERE
+                    news_site_name IN ({', '.join(['%s'] * len(names))})
+                """,
+                names
+            )
+            return {
+                name: (news_site_id, logo_url)
+                for name, news_site_id, logo_url in await cur.fetchall()
+            }
@@ -1,4 +1,4 @@
-from ._filter import Filter, FilterTable
+from ._filter import Filter, FilterIndex, FilterTable
 
 class NewsFilter(Filter):
     """
@@ -187,3 +187,17 @@ class NewsFilter(Filter):
             guild_id,
             name_value=news_site_name
         )
+
+    async def news_filter_index(self) -> FilterIndex:
+        """
+        Get the in-memory index of the news site
+        filters of all guilds for bulk checking.
+
+        Returns
+        -------
+        index : FilterIndex
+            News site filter index, use `.check()`
+            to see if a news site ID passes the
+            filter of a guild.
+        """
+        return await self.filter_index_get(self._news_filter_table)
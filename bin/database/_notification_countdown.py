@@ -1,12 +1,131 @@
 import aiomysql
 from datetime import datetime, timedelta, timezone
-from typing import AsyncGenerator
+from heapq import heapify, heappop
+from itertools import count
+import logging
+from os import getenv
+from time import monotonic
+from typing import Any, AsyncGenerator
+
+logger = logging.getLogger(__name__)
 
 class NotificationCountdown:
     """
     Notification Countdown table.
+
+    Notes
+    -----
+    Countdown notifications are loaded into an in-memory
+    schedule ordered by their send time, only the rows of
+    changed LL2 events or guilds are reloaded.
     """
-    last_get: datetime
+    def __init__(self) -> None:
+        # Scheduled notifications, (send time, sequence number, row)
+        self._nc_schedule: list[tuple[datetime, int, dict[str, Any]]] = []
+        # Notifications before this UTC datetime have been sent
+        self._nc_watermark: datetime | None = None
+        # The schedule contains notifications up to this UTC datetime
+        self._nc_loaded_until: datetime | None = None
+        # Reload the schedule on the next call
+        self._nc_dirty = True
+        # Reload only these LL2 events and guilds on the next call
+        self._nc_dirty_ll2_ids: set[str] = set()
+        self._nc_dirty_guilds: set[int] = set()
+        # Sequence numbers of the scheduled rows
+        self._nc_seq = count()
+        # Time frame of the schedule
+        self._nc_horizon = timedelta(
+            seconds=float(getenv('COUNTDOWN_HORIZON', 600))
+        )
+        # Reload the schedule at least this often
+        self._nc_reload = timedelta(
+            seconds=float(getenv('COUNTDOWN_RELOAD_INTERVAL', 300))
+        )
+        # Maximum time frame of missed notifications to send after a stall
+        self._nc_max_catch_up = timedelta(
+            seconds=float(getenv('COUNTDOWN_MAX_CATCH_UP', 3600))
+        )
+        # Store the watermark at least this often in seconds
+        self._nc_persist_interval = 60.
+        self._nc_persisted_at = 0.
+        # Seconds the watermark was behind at the last call
+        self.notification_countdown_lag = 0.
+
+    async def _notification_countdown_watermark_get(self) -> datetime | None:
+        """
+        Get the stored countdown notifications watermark.
+
+        Returns
+        -------
+        watermark : datetime or None
+            Timezone unaware UTC datetime before
+            which all notifications have been sent,
+            None when it hasn't been stored yet.
+        """
+        async with self.pool.acquire() as con, con.cursor() as cur:
+            await cur.execute(
+                """
+                SELECT watermark
+                FROM notification_countdown_state
+                WHERE id = 0
+                """
+            )
+            if (row := await cur.fetchone()):
+                return row[0]
+
+    async def _notification_countdown_watermark_set(
+        self,
+        watermark: datetime
+    ) -> None:
+        """
+        Store the countdown notifications watermark.
+
+        Parameters
+        ----------
+        watermark : datetime
+            Timezone unaware UTC datetime before
+            which all notifications have been sent.
+        """
+        async with self.pool.acquire() as con, con.cursor() as cur:
+            await cur.execute(
+                """
+                INSERT INTO notification_countdown_state
+                VALUES (0, %s) AS new
+                ON DUPLICATE KEY UPDATE
+                    watermark = new.watermark
+                """,
+                (watermark,)
+            )
+        self._nc_persisted_at = monotonic()
+
+    def notification_countdown_mark_dirty(
+        self,
+        *,
+        guild_id: int | None = None,
+        ll2_id: str | None = None
+    ) -> None:
+        """
+        Reload (part of) the countdown notification schedule
+        on the next call of `.notification_countdown_iter()`.
+
+        Parameters
+        ----------
+        guild_id : int or None, default: None
+            Discord guild ID to reload.
+        ll2_id : str or None, default: None
+            Launch Library 2 ID to reload.
+
+        Notes
+        -----
+        The whole schedule is reloaded
+        when neither ID is given.
+        """
+        if guild_id is not None:
+            self._nc_dirty_guilds.add(guild_id)
+        if ll2_id is not None:
+            self._nc_dirty_ll2_ids.add(ll2_id)
+        if guild_id is None and ll2_id is None:
+            self._nc_dirty = True
 
     async def notification_countdown_add(
         self,
@@ -37,6 +156,7 @@ class NotificationCountdown:
                 """,
                 (guild_id, minutes)
             )
+        self.notification_countdown_mark_dirty(guild_id=guild_id)
 
     async def notification_countdown_remove(
         self,
@@ -89,6 +209,7 @@ class NotificationCountdown:
                 """,
                 (guild_id, index)
             )
+        self.notification_countdown_mark_dirty(guild_id=guild_id)
 
     async def notification_countdown_list(
         self,
@@ -160,58 +281,80 @@ class NotificationCountdown:
             )
             return (await cur.fetchone())[0] != 0
 
-    async def notification_countdown_iter(
-        self
-    ) -> AsyncGenerator[dict[str, datetime | int | str]]:
+    async def _notification_countdown_load(
+        self,
+        start: datetime,
+        until: datetime,
+        *,
+        guild_ids: set[int] | None = None,
+        ll2_ids: set[str] | None = None
+    ) -> None:
         """
-        Retrieve all countdown notifications
-        that need sending to their respective
-        guild depending on their settings.
+        Load the countdown notifications that need
+        sending between `start` and `until` into
+        the schedule, replacing the current one.
 
-        Yields
-        -------
-        notifications : AsyncGenerator[dict[
-            guild_id : int,
-            notification_webhook_url : str,
-            button_fc : bool,
-            button_g4l : bool,
-            button_sln : bool,
-            minutes : int,
-            ll2_id : str,
-            name : str,
-            slug : str,
-            status : int,
-            agency : str,
-            logo_url : str,
-            url : str,
-            image_url : str,
-            start : datetime,
-            scheduled_event_id : int
-            type : int
-        ]]
-            A list containing the
-            notification data.
+        Parameters
+        ----------
+        start : datetime
+            Timezone unaware UTC datetime, inclusive.
+        until : datetime
+            Timezone unaware UTC datetime, exclusive.
+        guild_ids : set[int] or None, default: None
+            Only replace the rows of these guilds.
+        ll2_ids : set[str] or None, default: None
+            Only replace the rows of these LL2 events.
 
         Notes
         -----
-        the `type` key in the yielded dict
-        is a 1 for events and 0 for launches.
+        The whole schedule is replaced
+        when neither set is given. The start of
+        the LL2 events is bounded in the `WHERE`
+        clause by the shortest and longest countdown,
+        so the `ll2_events_start` index can be used.
         """
-        # Check for missing `.last_get`
-        if not hasattr(self, 'last_get'):
-            self.last_get = datetime.now(timezone.utc).replace(
-                microsecond=0,
-                tzinfo=None
-            )
-            return
+        # Changes made while loading trigger another reload
+        partial = guild_ids is not None or ll2_ids is not None
+        if not partial:
+            self._nc_dirty = False
+        self._nc_dirty_guilds = set()
+        self._nc_dirty_ll2_ids = set()
+        guild_ids = guild_ids or set()
+        ll2_ids = ll2_ids or set()
+
+        # Limit to the changed LL2 events and guilds
+        if partial:
+            conditions: list[str] = []
+            if guild_ids:
+                conditions.append(
+                    f"eg.guild_id IN ({', '.join(['%s'] * len(guild_ids))})"
+                )
+            if ll2_ids:
+                conditions.append(
+                    f"le.ll2_id IN ({', '.join(['%s'] * len(ll2_ids))})"
+                )
+            selection = ' OR '.join(conditions)
+        else:
+            selection = 'TRUE'
 
         # Execute SQL
         async with (
             self.pool.acquire() as con,
             con.cursor(aiomysql.DictCursor) as cur
         ):
+            # Shortest and longest countdown
             await cur.execute(
                 """
+                SELECT
+                    MIN(minutes) AS shortest,
+                    MAX(minutes) AS longest
+                FROM
+                    notification_countdown
+                """
+            )
+            bounds = await cur.fetchone()
+            await cur.execute(
+                f"""
                 SELECT
                     eg.guild_id,
                     eg.notification_webhook_url,
@@ -229,15 +372,14 @@ class NotificationCountdown:
                     le.image_url,
                     le.start,
                     se.scheduled_event_id,
-                    le.ll2_id REGEXP '^[0-9]+$' AS `type`,
-                    NOW() AS now
+                    le.is_event AS `type`
                 FROM ll2_events AS le
-                JOIN
-                    enabled_guilds AS eg
-                    ON eg.notification_webhook_url IS NOT NULL
                 JOIN
                     notification_countdown AS nc
-                    ON nc.guild_id = eg.guild_id
+                JOIN
+                    enabled_guilds AS eg
+                    ON eg.guild_id = nc.guild_id
+                    AND eg.notification_webhook_url IS NOT NULL
                 LEFT JOIN
                     ll2_agencies AS la
                     ON la.agency_id = le.agency_id
@@ -251,9 +393,17 @@ class NotificationCountdown:
                     AND eg.notification_scheduled_event
                     AND se.ll2_id = le.ll2_id
                 WHERE
-                    le.status != 5
-                    OR
-                    le.status IS NULL
+                    le.start >= DATE_ADD(%s, INTERVAL %s MINUTE)
+                    AND
+                    le.start < DATE_ADD(%s, INTERVAL %s MINUTE)
+                    AND
+                    (
+                        le.status != 5
+                        OR
+                        le.status IS NULL
+                    )
+                    AND
+                    ({selection})
                 GROUP BY
                     eg.guild_id,
                     nc.minutes,
@@ -264,12 +414,9 @@ class NotificationCountdown:
                     eg.notification_launch,
                     se.scheduled_event_id
                 HAVING
-                        le.start >= DATE_ADD(
-                            STR_TO_DATE(%s, '%%Y-%%m-%%d %%H:%%i:%%s'),
-                            INTERVAL nc.minutes MINUTE
-                        )
+                        le.start >= DATE_ADD(%s, INTERVAL nc.minutes MINUTE)
                     AND
-                        le.start < DATE_ADD(NOW(), INTERVAL nc.minutes MINUTE)
+                        le.start < DATE_ADD(%s, INTERVAL nc.minutes MINUTE)
                     AND
                     (
                         `type`
@@ -287,20 +434,156 @@ class NotificationCountdown:
                         )
                     )
                 """,
-                (self.last_get,)
+                (
+                    start,
+                    bounds['shortest'] or 0,
+                    until,
+                    bounds['longest'] or 0,
+                    *guild_ids,
+                    *ll2_ids,
+                    start,
+                    until
+                )
+            )
+            rows = await cur.fetchall()
+
+        # Keep the rows of unchanged LL2 events and guilds
+        if partial:
+            schedule = [
+                entry for entry in self._nc_schedule
+                if entry[2]['guild_id'] not in guild_ids
+                and entry[2]['ll2_id'] not in ll2_ids
+            ]
+        else:
+            schedule = []
+
+        # Order by send time
+        schedule += [
+            (
+                row['start'] - timedelta(minutes=row['minutes']),
+                next(self._nc_seq),
+                row
+            )
+            for row in rows
+        ]
+        heapify(schedule)
+        self._nc_schedule = schedule
+        if not partial:
+            self._nc_loaded_until = until
+
+    async def notification_countdown_iter(
+        self
+    ) -> AsyncGenerator[dict[str, datetime | int | str]]:
+        """
+        Retrieve all countdown notifications
+        that need sending to their respective
+        guild depending on their settings.
+
+        Yields
+        -------
+        notifications : AsyncGenerator[dict[
+            guild_id : int,
+            notification_webhook_url : str,
+            button_fc : bool,
+            button_g4l : bool,
+            button_sln : bool,
+            minutes : int,
+            ll2_id : str,
+            name : str,
+            slug : str,
+            status : int,
+            agency : str,
+            logo_url : str,
+            url : str,
+            image_url : str,
+            start : datetime,
+            scheduled_event_id : int
+            type : int
+        ]]
+            A list containing the
+            notification data.
+
+        Notes
+        -----
+        the `type` key in the yielded dict
+        is a 1 for events and 0 for launches.
+        Yields the notifications that are due
+        since the previous call, meant to be
+        called every second. The watermark of
+        sent notifications is stored, missed
+        notifications are sent after a restart
+        or stall up to `COUNTDOWN_MAX_CATCH_UP`
+        seconds back.
+        """
+        # Whole seconds like the stored watermark
+        now = datetime.now(timezone.utc).replace(microsecond=0, tzinfo=None)
+
+        # Continue from the stored watermark
+        if self._nc_watermark is None:
+            self._nc_watermark = (
+                await self._notification_countdown_watermark_get() or now
+            )
+            self._nc_dirty = True
+
+        # Bound the catch-up of missed notifications
+        if self._nc_watermark < (oldest := now - self._nc_max_catch_up):
+            logger.warning(
+                'Skipping countdown notifications between '
+                f'{self._nc_watermark} and {oldest} UTC'
+            )
+            self._nc_watermark = oldest
+            self._nc_dirty = True
+
+        # Lag of the watermark
+        self.notification_countdown_lag = (
+            now - self._nc_watermark
+        ).total_seconds()
+        if self.notification_countdown_lag > 60:
+            logger.warning(
+                'Catching up on countdown notifications, '
+                f'{self.notification_countdown_lag:.0f}s behind'
             )
 
-            # No results, increment `.last_get` for next call
-            if not cur.rowcount:
-                self.last_get += timedelta(minutes=1)
-
-            async for row in cur:
-                # New `.last_get` for next call
-                self.last_get = row.pop('now')
-                # Convert timezone unaware datetime into UTC datetime
-                row['start'] = row['start'].replace(tzinfo=timezone.utc)
-                # Convert button settings to bools
-                row['button_fc'] = bool(row['button_fc'])
-                row['button_g4l'] = bool(row['button_g4l'])
-                row['button_sln'] = bool(row['button_sln'])
-                yield row
+        # Reload the schedule when running out or changed
+        if (self._nc_dirty
+                or self._nc_loaded_until is None
+                or now + self._nc_reload >= self._nc_loaded_until):
+            await self._notification_countdown_load(
+                self._nc_watermark,
+                now + self._nc_horizon
+            )
+        # Reload the rows of changed LL2 events and guilds
+        elif self._nc_dirty_guilds or self._nc_dirty_ll2_ids:
+            await self._notification_countdown_load(
+                self._nc_watermark,
+                self._nc_loaded_until,
+                guild_ids=self._nc_dirty_guilds,
+                ll2_ids=self._nc_dirty_ll2_ids
+            )
+
+        # Send the due notifications, each is only removed from
+        # the schedule once the consumer asks for the next one
+        sent = False
+        while self._nc_schedule and (
+            (send_time := self._nc_schedule[0][0]) < now
+        ):
+            row = dict(self._nc_schedule[0][2])
+            # Convert timezone unaware datetime into UTC datetime
+            row['start'] = row['start'].replace(tzinfo=timezone.utc)
+            # Convert button settings to bools
+            row['button_fc'] = bool(row['button_fc'])
+            row['button_g4l'] = bool(row['button_g4l'])
+            row['button_sln'] = bool(row['button_sln'])
+            yield row
+            heappop(self._nc_schedule)
+            sent = True
+            # Move past the send time once all its notifications are sent
+            if not self._nc_schedule or self._nc_schedule[0][0] > send_time:
+                self._nc_watermark = send_time + timedelta(seconds=1)
+
+        # Everything before now has been sent
+        self._nc_watermark = now
+        if sent or (
+            monotonic() - self._nc_persisted_at > self._nc_persist_interval
+        ):
+            await self._notification_countdown_watermark_set(now)
@@ -9,37 +9,27 @@ class NotificationIter:
     async def notification_iter(
         self,
         *,
+        ll2_id: str,
         event: bool = False,
-        launch: bool = False,
-        ll2_id: str | None = None,
         status: int | None = None,
-        no_status: bool = False,
-        no_t0: bool = False
-    ) -> AsyncGenerator[dict[str, int | str]]:
+        t0_change: bool = False
+    ) -> AsyncGenerator[dict[str, bool | int | str]]:
         """
-        Request webhooks for guilds with the
-        given setting and notifications enabled.
+        Request webhooks for guilds with the given
+        notification types enabled in a single query,
+        together with the changes to notify them of.
 
         Parameters
         ----------
-        event : bool, default: False
-            Whether or not the NET
-            change is for an event.
-        launch : bool, default: False
-            Whether or not the NET
-            change is for a launch.
-        ll2_id : str or None, default: None
+        ll2_id : str
             Launch Library 2 ID.
+        event : bool, default: False
+            Whether the change is for
+            an event instead of a launch.
         status : int or None, default: None
-            Status ID.
-        no_status : bool, default: False
-            Invert the status check
-            to get guilds without the
-            status type on.
-        no_t0 : bool, default: False
-            Don't add the event or launch
-            checks for a T-0 notification
-            if this is True.
+            New status ID when the status changed.
+        t0_change : bool, default: False
+            Whether the T-0 changed.
 
         Yields
         -------
@@ -49,45 +39,58 @@ class NotificationIter:
             button_fc : bool,
             button_g4l : bool,
             button_sln : bool,
-            scheduled_event_id : int
+            scheduled_event_id : int,
+            t0_change : bool,
+            status_change : bool
         ]]
             A dictionary containing the
             guild notification data.
-        """
-        # Select setting columns
-        settings: list[str] = []
-        status_prefix = 'NOT ' if no_status else ''
 
+        Notes
+        -----
+        Guilds with T-0 change notifications
+        enabled get the T-0 change including
+        the status change when enabled, others
+        only get the status change if enabled.
+        """
         # T-0 settings
-        if no_t0:
-            settings.append('NOT eg.notification_t0_change')
-        elif event:
-            settings.append('eg.notification_t0_change')
-            settings.append('eg.notification_event')
-        elif launch:
-            settings.append('eg.notification_t0_change')
-            settings.append('eg.notification_launch')
+        if t0_change:
+            t0_key = 'eg.notification_t0_change AND ' + (
+                'eg.notification_event' if event else 'eg.notification_launch'
+            )
+        else:
+            t0_key = 'FALSE'
 
         # Status settings
         match status:
+            case None:
+                status_key = 'FALSE'
             case 2:
-                key = 'eg.notification_tbd'
+                status_key = 'eg.notification_tbd'
             case 8:
-                key = 'eg.notification_tbc'
+                status_key = 'eg.notification_tbc'
             case 1:
-                key = 'eg.notification_go'
+                status_key = 'eg.notification_go'
             case 6:
-                key = 'eg.notification_liftoff'
+                status_key = 'eg.notification_liftoff'
             case 5:
-                key = 'eg.notification_hold'
+                status_key = 'eg.notification_hold'
             case 9:
-                key = 'eg.notification_deploy'
+                status_key = 'eg.notification_deploy'
             case 3 | 4 | 7:
-                key = 'eg.notification_end_status'
+                status_key = 'eg.notification_end_status'
             case _:
-                key = None
-        if key:
-            settings.append(f'{status_prefix}{key}')
+                status_key = 'FALSE'
+
+        # Status only for guilds without T-0 change notifications
+        if t0_change:
+            settings = f"""
+                ({t0_key})
+                OR
+                (NOT eg.notification_t0_change AND {status_key})
+            """
+        else:
+            settings = status_key
 
         # Execute SQL
         async with (
@@ -102,7 +105,9 @@ class NotificationIter:
                     le.flightclub AND eg.notification_button_fc AS button_fc,
                     eg.notification_button_g4l AS button_g4l,
                     eg.notification_button_sln AS button_sln,
-                    se.scheduled_event_id
+                    se.scheduled_event_id,
+                    {t0_key} AS t0_change,
+                    {status_key} AS status_change
                 FROM
                     enabled_guilds AS eg
                 JOIN
@@ -121,18 +126,20 @@ class NotificationIter:
                     eg.notification_webhook_url IS NOT NULL
                     AND
                     (
-                        le.ll2_id REGEXP '^[0-9]+$'
+                        le.is_event
                         OR laf.agency_id IS NULL
                         XOR eg.agencies_include_exclude <=> 1
                     )
                     AND
-                        {' AND '.join(settings)}
+                    ({settings})
                 """,
                 (ll2_id,)
             )
             async for row in cur:
-                # Convert button settings to bools
+                # Convert button and change settings to bools
                 row['button_fc'] = bool(row['button_fc'])
                 row['button_g4l'] = bool(row['button_g4l'])
                 row['button_sln'] = bool(row['button_sln'])
+                row['t0_change'] = bool(row['t0_change'])
+                row['status_change'] = bool(row['status_change'])
                 yield row
@@ -120,3 +120,4 @@ class NotificationSettings:
                 """,
                 args
             )
+        self.notification_countdown_mark_dirty(guild_id=guild_id)
@@ -0,0 +1,85 @@
+import aiomysql
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from time import monotonic
+from typing import Any
+
+class MeteredPool:
+    """
+    Wrapper around an aiomysql pool that
+    measures how connections are acquired.
+
+    Notes
+    -----
+    Use `.acquire()` like the aiomysql pool,
+    other attributes are passed to the pool.
+    """
+    def __init__(self, pool: aiomysql.Pool) -> None:
+        self._pool = pool
+        # Acquire statistics
+        self.acquires = 0
+        self.wait_total = 0.
+        self.wait_max = 0.
+        self.hold_max = 0.
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Pass attributes to the aiomysql pool.
+
+        Parameters
+        ----------
+        name : str
+            Attribute name.
+
+        Returns
+        -------
+        Any
+        """
+        return getattr(self._pool, name)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[aiomysql.Connection]:
+        """
+        Acquire a connection from the pool.
+
+        Yields
+        ------
+        con : aiomysql.Connection
+            Database connection, released
+            back into the pool on exit.
+        """
+        start = monotonic()
+        async with self._pool.acquire() as con:
+            acquired = monotonic()
+            # Wait time to acquire
+            self.acquires += 1
+            self.wait_total += (wait := acquired - start)
+            self.wait_max = max(self.wait_max, wait)
+            try:
+                yield con
+            finally:
+                # Time the connection was held
+                self.hold_max = max(self.hold_max, monotonic() - acquired)
+
+    @property
+    def stats(self) -> dict[str, float | int]:
+        """
+        Pool statistics.
+
+        Returns
+        -------
+        stats : dict[str, float | int]
+            Connections in use and free, the
+            maximum size, the amount of acquires,
+            the average and longest wait to acquire
+            and the longest a connection was held.
+        """
+        return {
+            'in_use': self._pool.size - self._pool.freesize,
+            'free': self._pool.freesize,
+            'maxsize': self._pool.maxsize,
+            'acquires': self.acquires,
+            'wait_avg': self.wait_total / self.acquires if self.acquires else 0.,
+            'wait_max': self.wait_max,
+            'hold_max': self.hold_max
+        }
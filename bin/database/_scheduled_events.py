@@ -1,10 +1,203 @@
 import aiomysql
+from collections.abc import Iterable
+from os import getenv
+from time import monotonic
 from typing import AsyncGenerator
 
 class ScheduledEvents:
     """
     Discord scheduled events table.
+
+    Notes
+    -----
+    Changes to guild settings and filters mark guilds as
+    dirty, changes to LL2 events mark the LL2 events as dirty.
+    `.scheduled_events_reconcile_iter()` only recomputes the
+    scheduled events of dirty guilds, guilds with a scheduled
+    event for a dirty LL2 event and guilds a dirty LL2 event
+    qualifies for and can be added to their upcoming events.
     """
+    def __init__(self) -> None:
+        # Guilds that need to be recomputed, all when True
+        self._se_dirty_guilds: set[int] = set()
+        self._se_dirty_all = True
+        # LL2 events that changed since the last recompute
+        self._se_dirty_ll2_ids: set[str] = set()
+        # Monotonic time of the next start or end
+        # that changes the wanted scheduled events
+        self._se_next_transition: float | None = None
+        # Interval of full recomputes in seconds,
+        # to pick up changes made outside the bot
+        self._se_full_interval = float(
+            getenv('SCHEDULED_EVENTS_FULL_INTERVAL', 900)
+        )
+        self._se_full_at = 0.
+
+    def scheduled_events_mark_dirty(
+        self,
+        guild_id: int | None = None,
+        *,
+        ll2_id: str | None = None
+    ) -> None:
+        """
+        Mark the scheduled events of a guild, the guilds
+        affected by an LL2 event or all guilds to be recomputed.
+
+        Parameters
+        ----------
+        guild_id : int or None, default: None
+            Discord guild ID.
+        ll2_id : str or None, default: None
+            Launch Library 2 ID that changed.
+
+        Notes
+        -----
+        All guilds are marked when neither ID is given.
+        """
+        if guild_id is not None:
+            self._se_dirty_guilds.add(guild_id)
+        if ll2_id is not None:
+            self._se_dirty_ll2_ids.add(ll2_id)
+        if guild_id is None and ll2_id is None:
+            self._se_dirty_all = True
+
+    async def _scheduled_events_affected_guilds(
+        self,
+        ll2_ids: set[str]
+    ) -> set[int]:
+        """
+        Guilds whose scheduled events can change
+        because of the given LL2 events.
+
+        Parameters
+        ----------
+        ll2_ids : set[str]
+            Launch Library 2 IDs that changed.
+
+        Returns
+        -------
+        guild_ids : set[int]
+            Guilds with a scheduled event for one of the
+            LL2 events and guilds one of the LL2 events
+            qualifies for, when they have less scheduled
+            events than wanted or the LL2 event starts
+            before their last scheduled event.
+
+        Notes
+        -----
+        An LL2 event qualifies for a guild when it is
+        upcoming and passes the launch/event type,
+        agency filter and URL settings of the guild.
+        """
+        ids = ', '.join(['%s'] * len(ll2_ids))
+        async with self.pool.acquire() as con, con.cursor() as cur:
+            await cur.execute(
+                f"""
+                SELECT
+                    eg.guild_id
+                FROM
+                    enabled_guilds AS eg
+                LEFT JOIN
+                    (
+                        SELECT
+                            se.guild_id,
+                            COUNT(*) AS amount,
+                            MAX(le.`start`) AS last_start,
+                            SUM(se.ll2_id IN ({ids})) AS changed
+                        FROM
+                            scheduled_events AS se
+                        JOIN
+                            ll2_events AS le
+                            ON le.ll2_id = se.ll2_id
+                        GROUP BY
+                            se.guild_id
+                    ) AS se
+                    ON se.guild_id = eg.guild_id
+                WHERE
+                    se.changed
+                    OR
+                    (
+                        eg.scheduled_events > 0
+                        AND
+                        EXISTS (
+                            SELECT
+                                1
+                            FROM
+                                ll2_events AS le
+                            LEFT JOIN
+                                ll2_agencies_filter as laf
+                                ON laf.guild_id = eg.guild_id
+                                AND laf.agency_id = le.agency_id
+                            WHERE
+                                le.ll2_id IN ({ids})
+                                AND
+                                le.`end` > NOW()
+                                AND
+                                (
+                                    le.`status` IS NULL
+                                    OR
+                                    le.`status` NOT IN (3, 4, 7)
+                                )
+                                AND
+                                NOT (
+                                    eg.se_no_url AND le.url IS NULL
+                                )
+                                AND
+                                (
+                                    le.is_event
+                                    OR laf.agency_id IS NULL
+                                    XOR eg.agencies_include_exclude <=> 1
+                                )
+                                AND
+                                (
+                                    (
+                                        le.is_event AND
+                                        eg.se_event
+                                    ) OR (
+                                        NOT le.is_event AND
+                                        eg.se_launch
+                                    )
+                                )
+                                AND
+                                (
+                                    COALESCE(se.amount, 0) < eg.scheduled_events
+                                    OR
+                                    le.`start` <= se.last_start
+                                )
+                        )
+                    )
+                """,
+                (*ll2_ids, *ll2_ids)
+            )
+            return {guild_id for guild_id, in await cur.fetchall()}
+
+    @staticmethod
+    def _scheduled_events_guild_clause(
+        column: str,
+        guild_ids: list[int] | None
+    ) -> str:
+        """
+        SQL condition limiting a query to the given guilds.
+
+        Parameters
+        ----------
+        column : str
+            Guild ID column.
+        guild_ids : list[int] or None
+            Discord guild IDs, when
+            None, all guilds are used.
+
+        Returns
+        -------
+        condition : str
+            SQL condition with a placeholder per guild.
+        """
+        if guild_ids is None:
+            return 'TRUE'
+        if not guild_ids:
+            return 'FALSE'
+        return f"{column} IN ({', '.join(['%s'] * len(guild_ids))})"
+
     async def scheduled_events_add(
         self,
         scheduled_event_id: int,
@@ -39,10 +232,13 @@ class ScheduledEvents:
                     ll2_id
                 )
             )
+        self.scheduled_events_mark_dirty(guild_id)
+        self.notification_countdown_mark_dirty(guild_id=guild_id)
 
     async def scheduled_events_remove(
         self,
-        scheduled_event_id: int
+        scheduled_event_id: int,
+        guild_id: int | None = None
     ) -> None:
         """
         Removes an entry in the corresponding
@@ -53,6 +249,10 @@ class ScheduledEvents:
         ----------
         scheduled_event_id : int
             Discord scheduled event ID.
+        guild_id : int or None, default: None
+            Discord guild ID of the scheduled
+            event, when None, all guilds
+            are marked to be recomputed.
         """
         async with self.pool.acquire() as con, con.cursor() as cur:
             await cur.execute(
@@ -62,6 +262,72 @@ class ScheduledEvents:
                 """,
                 (scheduled_event_id,)
             )
+        self.scheduled_events_mark_dirty(guild_id)
+        self.notification_countdown_mark_dirty(guild_id=guild_id)
+
+    async def scheduled_events_add_many(
+        self,
+        rows: Iterable[tuple[int, int, str]]
+    ) -> None:
+        """
+        Add multiple Discord scheduled event
+        entries to the `scheduled_events`
+        table of the LiveLaunch database.
+
+        Parameters
+        ----------
+        rows : Iterable[tuple[int, int, str]]
+            Discord scheduled event ID, guild
+            ID and Launch Library 2 ID per event.
+
+        Notes
+        -----
+        Rows of guilds or LL2 events that were removed
+        in the meantime are skipped instead of failing
+        the other rows.
+        """
+        if not (rows := list(rows)):
+            return
+        async with self.pool.acquire() as con, con.cursor() as cur:
+            await cur.executemany(
+                """
+                INSERT IGNORE INTO scheduled_events
+                VALUES (%s, %s, %s)
+                """,
+                rows
+            )
+        # Written by the reconciler, only the countdown notifications change
+        for guild_id in {guild_id for _, guild_id, _ in rows}:
+            self.notification_countdown_mark_dirty(guild_id=guild_id)
+
+    async def scheduled_events_remove_many(
+        self,
+        rows: Iterable[tuple[int, int]]
+    ) -> None:
+        """
+        Removes multiple entries in the
+        corresponding `scheduled_events`
+        table of the LiveLaunch database.
+
+        Parameters
+        ----------
+        rows : Iterable[tuple[int, int]]
+            Discord scheduled event ID
+            and guild ID per event.
+        """
+        if not (rows := list(rows)):
+            return
+        async with self.pool.acquire() as con, con.cursor() as cur:
+            await cur.execute(
+                f"""
+                DELETE FROM scheduled_events
+                WHERE scheduled_event_id IN ({', '.join(['%s'] * len(rows))})
+                """,
+                [scheduled_event_id for scheduled_event_id, _ in rows]
+            )
+        # Written by the reconciler, only the countdown notifications change
+        for guild_id in {guild_id for _, guild_id in rows}:
+            self.notification_countdown_mark_dirty(guild_id=guild_id)
 
     async def scheduled_events_get(
         self,
@@ -176,13 +442,20 @@ class ScheduledEvents:
                 yield row
 
     async def scheduled_events_remove_iter(
-        self
+        self,
+        guild_ids: list[int] | None = None
     ) -> AsyncGenerator[dict[str, int | bool]]:
         """
         Asynchronous iterator that goes over
         Discord scheduled events that need
         to be removed.
 
+        Parameters
+        ----------
+        guild_ids : list[int] or None, default: None
+            Discord guild IDs to check,
+            when None, check all guilds.
+
         Yields
         ------
         AsyncGenerator[dict[
@@ -191,12 +464,16 @@ class ScheduledEvents:
             create_remove : bool = False
         ]]
         """
+        guild_clause = self._scheduled_events_guild_clause(
+            'eg.guild_id',
+            guild_ids
+        )
         async with (
             self.pool.acquire() as con,
             con.cursor(aiomysql.DictCursor) as cur
         ):
             await cur.execute(
-                """
+                f"""
                 SELECT
                     se.guild_id,
                     se.scheduled_event_id,
@@ -215,7 +492,7 @@ class ScheduledEvents:
                                     eg.scheduled_events,
                                     le.ll2_id,
                                     le.`start`,
-                                    le.ll2_id REGEXP '^[0-9]+$' AS `type`,
+                                    le.is_event AS `type`,
                                     ROW_NUMBER() OVER
                                     (
                                         PARTITION BY
@@ -240,6 +517,8 @@ class ScheduledEvents:
                                         OR
                                         le.`status` NOT IN (3, 4, 7)
                                     )
+                                    AND
+                                    {guild_clause}
                                 GROUP BY
                                     eg.guild_id,
                                     laf.agency_id,
@@ -283,20 +562,30 @@ class ScheduledEvents:
                     AND le.ll2_id = se.ll2_id
                 WHERE
                     le.guild_id IS NULL
-                """
+                    AND
+                    {self._scheduled_events_guild_clause('se.guild_id', guild_ids)}
+                """,
+                (guild_ids or []) * 2
             )
             async for row in cur:
                 row['create_remove'] = bool(row['create_remove'])
                 yield row
 
     async def scheduled_events_create_iter(
-        self
+        self,
+        guild_ids: list[int] | None = None
     ) -> AsyncGenerator[dict[str, bool | int | str]]:
         """
         Asynchronous iterator that goes over
         Launch Library 2 events that need
         to be created.
 
+        Parameters
+        ----------
+        guild_ids : list[int] or None, default: None
+            Discord guild IDs to check,
+            when None, check all guilds.
+
         Yields
         ------
         AsyncGenerator[dict[
@@ -310,7 +599,7 @@ class ScheduledEvents:
             con.cursor(aiomysql.DictCursor) as cur
         ):
             await cur.execute(
-                """
+                f"""
                 SELECT
                     le.guild_id,
                     le.ll2_id,
@@ -322,7 +611,7 @@ class ScheduledEvents:
                             eg.scheduled_events,
                             le.ll2_id,
                             le.`start`,
-                            le.ll2_id REGEXP '^[0-9]+$' AS `type`,
+                            le.is_event AS `type`,
                             ROW_NUMBER() OVER
                             (
                                 PARTITION BY
@@ -347,6 +636,8 @@ class ScheduledEvents:
                                 OR
                                 le.`status` NOT IN (3, 4, 7)
                             )
+                            AND
+                            {self._scheduled_events_guild_clause('eg.guild_id', guild_ids)}
                         GROUP BY
                             eg.guild_id,
                             laf.agency_id,
@@ -394,16 +685,24 @@ class ScheduledEvents:
                     se.scheduled_event_id IS NULL
                     AND
                     le.row_nr <= le.scheduled_events
-                """
+                """,
+                guild_ids
             )
             async for row in cur:
                 row['create_remove'] = bool(row['create_remove'])
                 yield row
 
     async def scheduled_events_remove_create_iter(
-        self
+        self,
+        guild_ids: Iterable[int] | None = None
     ) -> AsyncGenerator[dict[str, bool | int | str]]:
         """
+        Parameters
+        ----------
+        guild_ids : Iterable[int] or None, default: None
+            Discord guild IDs to check,
+            when None, check all guilds.
+
         Yields
         ------
         AsyncGenerator[dict[
@@ -412,7 +711,119 @@ class ScheduledEvents:
             create_remove : bool
         ]]
         """
-        async for row in self.scheduled_events_remove_iter():
+        if guild_ids is not None:
+            guild_ids = list(guild_ids)
+        async for row in self.scheduled_events_remove_iter(guild_ids):
             yield row
-        async for row in self.scheduled_events_create_iter():
+        async for row in self.scheduled_events_create_iter(guild_ids):
             yield row
+
+    async def _scheduled_events_next_transition(self) -> float | None:
+        """
+        Seconds until the next LL2 event end or creation
+        cutoff that changes the wanted scheduled events.
+
+        Returns
+        -------
+        seconds : float or None
+            Seconds until the next transition,
+            None when there are no events.
+        """
+        async with self.pool.acquire() as con, con.cursor() as cur:
+            await cur.execute(
+                """
+                SELECT
+                    TIMESTAMPDIFF(SECOND, NOW(), MIN(t))
+                FROM
+                    (
+                        SELECT MIN(`end`) AS t
+                        FROM ll2_events
+                        WHERE `end` > NOW()
+                        UNION ALL
+                        SELECT DATE_SUB(MIN(`start`), INTERVAL 2 MINUTE)
+                        FROM ll2_events
+                        WHERE `start` > DATE_ADD(NOW(), INTERVAL 2 MINUTE)
+                    ) AS transitions
+                """
+            )
+            seconds = (await cur.fetchone())[0]
+        return None if seconds is None else float(seconds)
+
+    async def scheduled_events_reconcile_iter(
+        self
+    ) -> AsyncGenerator[dict[str, bool | int | str]]:
+        """
+        Goes over the scheduled events to remove and
+        create, only recomputing the dirty guilds.
+
+        Yields
+        ------
+        AsyncGenerator[dict[
+            guild_id : int,
+            scheduled_event_id : int or ll2_id : str,
+            create_remove : bool
+        ]]
+
+        Notes
+        -----
+        Changed LL2 events only recompute the guilds they can
+        affect. All guilds are recomputed when an event ends
+        or passes the creation cutoff and every
+        `SCHEDULED_EVENTS_FULL_INTERVAL` seconds.
+        """
+        now = monotonic()
+        full = (
+            self._se_dirty_all
+            or now - self._se_full_at > self._se_full_interval
+            or (
+                self._se_next_transition is not None
+                and now >= self._se_next_transition
+            )
+        )
+        if not (full or self._se_dirty_guilds or self._se_dirty_ll2_ids):
+            return
+
+        # Take the dirty guilds, changes made while iterating mark new ones
+        dirty_guilds = self._se_dirty_guilds
+        dirty_ll2_ids = self._se_dirty_ll2_ids
+        self._se_dirty_guilds = set()
+        self._se_dirty_ll2_ids = set()
+        guild_ids: list[int] | None = None
+        if not full:
+            if dirty_ll2_ids:
+                try:
+                    affected = await self._scheduled_events_affected_guilds(
+                        dirty_ll2_ids
+                    )
+                except Exception:
+                    self._se_dirty_guilds.update(dirty_guilds)
+                    self._se_dirty_ll2_ids.update(dirty_ll2_ids)
+                    raise
+                dirty_guilds |= affected
+            if not dirty_guilds:
+                return
+            guild_ids = list(dirty_guilds)
+        if full:
+            self._se_dirty_all = False
+            self._se_full_at = now
+        # Changed LL2 events can move the next transition
+        if full or dirty_ll2_ids:
+            seconds = await self._scheduled_events_next_transition()
+            self._se_next_transition = (
+                None if seconds is None else now + seconds
+            )
+
+        completed = False
+        try:
+            async for row in self.scheduled_events_remove_create_iter(
+                guild_ids
+            ):
+                yield row
+            completed = True
+        finally:
+            # Retry the guilds on failure
+            if not completed:
+                if guild_ids is None:
+                    self._se_dirty_all = True
+                else:
+                    self._se_dirty_guilds.update(guild_ids)
@@ -56,3 +56,4 @@ class ScheduledEventsSettings:
                 """,
                 args
             )
+        self.scheduled_events_mark_dirty(guild_id)
@@ -1,9 +1,102 @@
-from datetime import datetime, timezone
+from collections.abc import Iterable
+from datetime import datetime, timedelta, timezone
+import logging
+from os import getenv
+
+from ..ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
 
 class SentMedia:
     """
     Sent streams/news tables.
+
+    Notes
+    -----
+    Sent IDs are kept in an in-memory cache in front
+    of the tables, only IDs that aren't cached are
+    checked in the database. Entries expire together
+    with the one year retention of `.sent_media_clean()`.
     """
+    def __init__(self) -> None:
+        # Retention of sent media
+        self._sent_media_retention = timedelta(days=365)
+        # Sent IDs per table, ID: None
+        self._sent_media_cache: dict[str, TTLCache[int | str]] = {
+            table: TTLCache(
+                maxsize=int(getenv('SENT_MEDIA_CACHE_SIZE', 65536)),
+                ttl=self._sent_media_retention.total_seconds()
+            )
+            for table in ('news', 'streams')
+        }
+
+    @property
+    def sent_media_cache_stats(self) -> dict[str, dict[str, float | int]]:
+        """
+        Statistics of the sent media caches.
+
+        Returns
+        -------
+        stats : dict[str, dict[str, float | int]]
+            Cache statistics for `news` and `streams`.
+        """
+        return {
+            table: cache.stats
+            for table, cache in self._sent_media_cache.items()
+        }
+
+    def _sent_media_cache_set(
+        self,
+        table: str,
+        _id: int | str,
+        timestamp: datetime | None
+    ) -> None:
+        """
+        Cache a sent ID until the end of its retention.
+
+        Parameters
+        ----------
+        table : str
+            Sent media table, `news` or `streams`.
+        _id : int or str
+            SNAPI article or YouTube video ID.
+        timestamp : datetime or None
+            Datetime the media was sent, naive
+            datetimes are in UTC, when None,
+            the current datetime is used.
+        """
+        if timestamp is None:
+            timestamp = datetime.now(timezone.utc)
+        elif timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        self._sent_media_cache[table].set(
+            _id,
+            None,
+            expires=(timestamp + self._sent_media_retention).timestamp()
+        )
+
+    async def sent_media_warm(self) -> None:
+        """
+        Load the most recently sent IDs
+        into the sent media caches.
+        """
+        async with self.pool.acquire() as con, con.cursor() as cur:
+            for table, col in (('news', 'snapi_id'), ('streams', 'yt_vid_id')):
+                cache = self._sent_media_cache[table]
+                await cur.execute(
+                    f"""
+                    SELECT {col}, datetime
+                    FROM sent_{table}
+                    ORDER BY datetime DESC
+                    LIMIT %s
+                    """,
+                    (cache.maxsize,)
+                )
+                # Oldest first to keep the most recent in the cache
+                for _id, timestamp in reversed(await cur.fetchall()):
+                    self._sent_media_cache_set(table, _id, timestamp)
+                logger.info(f'Loaded {len(cache)} sent {table} IDs')
+
     async def sent_media_add(
         self,
         *,
@@ -41,10 +134,13 @@ class SentMedia:
             await cur.execute(
                 f"""
                 INSERT INTO sent_{table}
-                VALUES (%s, %s)
+                VALUES (%s, %s) AS new
+                ON DUPLICATE KEY UPDATE
+                    datetime = new.datetime
                 """,
                 args
             )
+        self._sent_media_cache_set(table, *args)
 
     async def sent_media_clean(self) -> None:
         """
@@ -98,14 +194,126 @@ class SentMedia:
             col = 'yt_vid_id'
             args = (yt_vid_id,)
 
+        # Skip the database for cached IDs
+        if args[0] in self._sent_media_cache[table]:
+            return True
+
         # Connect and check
         async with self.pool.acquire() as con, con.cursor() as cur:
             await cur.execute(
                 f"""
-                SELECT COUNT(*)
+                SELECT datetime
                 FROM sent_{table}
                 WHERE {col}=%s
                 """,
                 args
             )
-            return (await cur.fetchone())[0] != 0
+            if (row := await cur.fetchone()) is None:
+                return False
+        self._sent_media_cache_set(table, args[0], row[0])
+        return True
+
+    async def sent_media_add_many(
+        self,
+        *,
+        snapi_ids: Iterable[int] | None = None,
+        yt_vid_ids: Iterable[str] | None = None,
+        timestamp: datetime | None = None
+    ) -> None:
+        """
+        Adds multiple entries in the specified sent
+        media table of the LiveLaunch database.
+
+        Parameters
+        ----------
+        snapi_ids : Iterable[int] or None, default: None
+            SNAPI article IDs.
+        yt_vid_ids : Iterable[str] or None, default: None
+            YouTube video IDs.
+        timestamp : datetime or None, default: None
+            Datetime object, when default,
+            the current UTC datetime is used.
+        """
+        if timestamp is None:
+            timestamp = datetime.now(timezone.utc)
+
+        # Select the correct sent media table
+        if snapi_ids is not None:
+            table = 'news'
+            ids = snapi_ids
+        else:
+            table = 'streams'
+            ids = yt_vid_ids or ()
+        if not (args := [(_id, timestamp) for _id in dict.fromkeys(ids)]):
+            return
+
+        # Connect and add
+        async with self.pool.acquire() as con, con.cursor() as cur:
+            await cur.executemany(
+                f"""
+                INSERT INTO sent_{table}
+                VALUES (%s, %s) AS new
+                ON DUPLICATE KEY UPDATE
+                    datetime = new.datetime
+                """,
+                args
+            )
+        for _id, _ in args:
+            self._sent_media_cache_set(table, _id, timestamp)
+
+    async def sent_media_exists_many(
+        self,
+        *,
+        snapi_ids: Iterable[int] | None = None,
+        yt_vid_ids: Iterable[str] | None = None
+    ) -> set[int | str]:
+        """
+        Checks which entries exist in the specified
+        sent media table of the LiveLaunch database.
+
+        Parameters
+        ----------
+        snapi_ids : Iterable[int] or None, default: None
+            SNAPI article IDs.
+        yt_vid_ids : Iterable[str] or None, default: None
+            YouTube video IDs.
+
+        Returns
+        -------
+        existing : set[int | str]
+            The given IDs that exist.
+        """
+        # Select the correct sent media table
+        if snapi_ids is not None:
+            table = 'news'
+            col = 'snapi_id'
+            ids = snapi_ids
+        else:
+            table = 'streams'
+            col = 'yt_vid_id'
+            ids = yt_vid_ids or ()
+        # Skip the database for cached IDs
+        existing: set[int | str] = set()
+        args: list[int | str] = []
+        for _id in dict.fromkeys(ids):
+            if _id in self._sent_media_cache[table]:
+                existing.add(_id)
+            else:
+                args.append(_id)
+        if not args:
+            return existing
+
+        # Connect and check
+        async with self.pool.acquire() as con, con.cursor() as cur:
+            await cur.execute(
+                f"""
+                SELECT {col}, datetime
+                FROM sent_{table}
+                WHERE {col} IN ({', '.join(['%s'] * len(args))})
+                """,
+                args
+            )
+            for _id, timestamp in await cur.fetchall():
+                self._sent_media_cache_set(table, _id, timestamp)
+                existing.add(_id)
+        return existing
@@ -4,6 +4,8 @@ from os import getenv
 from types import TracebackType
 from typing import Literal, Self
 
+from ._pool import MeteredPool
+
 logger = logging.getLogger(__name__)
 
 class Start:
@@ -15,18 +17,38 @@ class Start:
         Creates the LiveLaunch database connection pool
         and required tables if they don't exist yet.
 
+        Notes
+        -----
+        The pool is configured with the `DB_POOL_MIN`,
+        `DB_POOL_MAX`, `DB_POOL_RECYCLE`, `DB_CONNECT_TIMEOUT`
+        and `DB_STATEMENT_TIMEOUT` environment variables.
+        `DB_STATEMENT_TIMEOUT` is a server-side limit in seconds
+        that aborts every SELECT running longer, including the
+        large reconcile and reload queries, 0 disables it.
+
         Examples
         --------
         >>> async with db:
         ...    await db.start()
         """
         # Connect
-        self.pool = await aiomysql.create_pool(
-            host=self._host,
-            user=self._user,
-            password=getenv('DB_PWD'),
-            db=self._database,
-            autocommit=True
+        self.pool = MeteredPool(
+            await aiomysql.create_pool(
+                minsize=int(getenv('DB_POOL_MIN', 1)),
+                maxsize=int(getenv('DB_POOL_MAX', 10)),
+                pool_recycle=int(getenv('DB_POOL_RECYCLE', 3600)),
+                host=self._host,
+                user=self._user,
+                password=getenv('DB_PWD'),
+                db=self._database,
+                autocommit=True,
+                connect_timeout=float(getenv('DB_CONNECT_TIMEOUT', 10)),
+                # Server-side statement timeout of SELECT queries
+                # in milliseconds, disabled by default
+                init_command='SET SESSION MAX_EXECUTION_TIME=%d' % (
+                    float(getenv('DB_STATEMENT_TIMEOUT', 0)) * 1000
+                )
+            )
         )
         async with self.pool.acquire() as con, con.cursor() as cur:
             # Create table for storing guilds
@@ -67,7 +89,8 @@ class Start:
                 notification_scheduled_event TINYINT UNSIGNED DEFAULT 0,
                 notification_button_fc TINYINT UNSIGNED DEFAULT 1,
                 notification_button_g4l TINYINT UNSIGNED DEFAULT 1,
-                notification_button_sln TINYINT UNSIGNED DEFAULT 1
+                notification_button_sln TINYINT UNSIGNED DEFAULT 1,
+                INDEX enabled_guilds_notification (notification_webhook_url(8))
                 )
                 """
             )
@@ -110,10 +133,17 @@ class Start:
                 webcast_live TINYINT DEFAULT 0,
                 slug TEXT DEFAULT NULL,
                 flightclub TINYINT UNSIGNED DEFAULT 0,
+                is_event TINYINT UNSIGNED DEFAULT 0,
+                INDEX (is_event, start),
+                INDEX ll2_events_start (start),
+                INDEX ll2_events_end_status (end, status),
                 FOREIGN KEY (agency_id) REFERENCES ll2_agencies(agency_id)
                 )
                 """
             )
+            # Add the stored event type to existing LL2 events
+            if not await self._column_exists(cur, 'll2_events', 'is_event'):
+                await self._migrate_ll2_events_is_event(cur)
             # Create table for storing news sites
             await cur.execute(
                 """
@@ -149,6 +179,32 @@ class Start:
                 )
                 """
             )
+            # Create table for storing webhook messages to retry
+            await cur.execute(
+                """
+                CREATE TABLE IF NOT EXISTS delivery_queue (
+                id BIGINT UNSIGNED AUTO_INCREMENT PRIMARY KEY,
+                guild_id BIGINT UNSIGNED,
+                webhook VARCHAR(16),
+                payload JSON,
+                attempts TINYINT UNSIGNED DEFAULT 0,
+                created DATETIME DEFAULT CURRENT_TIMESTAMP,
+                next_attempt DATETIME,
+                INDEX (next_attempt),
+                FOREIGN KEY (guild_id) REFERENCES enabled_guilds(guild_id)
+                    ON DELETE CASCADE
+                )
+                """
+            )
+            # Create table for storing the sent countdown notifications watermark
+            await cur.execute(
+                """
+                CREATE TABLE IF NOT EXISTS notification_countdown_state (
+                id TINYINT UNSIGNED PRIMARY KEY,
+                watermark DATETIME DEFAULT NULL
+                )
+                """
+            )
             # Create table for storing Discord scheduled event IDs
             await cur.execute(
                 """
@@ -156,6 +212,7 @@ class Start:
                 scheduled_event_id BIGINT UNSIGNED PRIMARY KEY,
                 guild_id BIGINT UNSIGNED DEFAULT NULL,
                 ll2_id VARCHAR(36) DEFAULT NULL,
+                INDEX scheduled_events_guild_ll2 (guild_id, ll2_id),
                 FOREIGN KEY (guild_id) REFERENCES enabled_guilds(guild_id),
                 FOREIGN KEY (ll2_id) REFERENCES ll2_events(ll2_id)
                     ON DELETE CASCADE
@@ -175,11 +232,202 @@ class Start:
             await cur.execute(
                 """
                 CREATE TABLE IF NOT EXISTS sent_streams (
-                yt_vid_id TEXT,
-                datetime DATETIME DEFAULT NULL
+                yt_vid_id CHAR(11) CHARACTER SET ascii COLLATE ascii_bin PRIMARY KEY,
+                datetime DATETIME DEFAULT NULL,
+                INDEX (datetime)
                 )
                 """
             )
+            # Migrate sent live streams from the unindexed text column
+            if not await self._index_exists(cur, 'sent_streams', 'PRIMARY'):
+                await self._migrate_sent_streams(cur)
+            # Add the secondary indexes of the hot queries to existing tables
+            for table, index, columns in (
+                ('ll2_events', 'll2_events_start', 'start'),
+                ('ll2_events', 'll2_events_end_status', 'end, status'),
+                ('scheduled_events', 'scheduled_events_guild_ll2', 'guild_id, ll2_id'),
+                (
+                    'enabled_guilds',
+                    'enabled_guilds_notification',
+                    'notification_webhook_url(8)'
+                )
+            ):
+                if not await self._index_exists(cur, table, index):
+                    logger.info(f'Adding index {index} to {table}')
+                    await cur.execute(
+                        f"""
+                        ALTER TABLE {table}
+                        ADD INDEX {index} ({columns})
+                        """
+                    )
+
+        # Warm the sent media caches
+        await self.sent_media_warm()
+
+    async def _index_exists(
+        self,
+        cur: aiomysql.Cursor,
+        table: str,
+        index: str
+    ) -> bool:
+        """
+        Check if an index exists on a table.
+
+        Parameters
+        ----------
+        cur : aiomysql.Cursor
+            Database cursor.
+        table : str
+            Table name.
+        index : str
+            Index name, `PRIMARY`
+            for the primary key.
+
+        Returns
+        -------
+        exists : bool
+            True when the index exists.
+        """
+        await cur.execute(
+            """
+            SELECT COUNT(*)
+            FROM information_schema.statistics
+            WHERE
+                table_schema = DATABASE()
+                AND
+                table_name = %s
+                AND
+                index_name = %s
+            """,
+            (table, index)
+        )
+        return (await cur.fetchone())[0] != 0
+
+    async def _column_exists(
+        self,
+        cur: aiomysql.Cursor,
+        table: str,
+        column: str
+    ) -> bool:
+        """
+        Check if a column exists in a table.
+
+        Parameters
+        ----------
+        cur : aiomysql.Cursor
+            Database cursor.
+        table : str
+            Table name.
+        column : str
+            Column name.
+
+        Returns
+        -------
+        exists : bool
+            True when the column exists.
+        """
+        await cur.execute(
+            """
+            SELECT COUNT(*)
+            FROM information_schema.columns
+            WHERE
+                table_schema = DATABASE()
+                AND
+                table_name = %s
+                AND
+                column_name = %s
+            """,
+            (table, column)
+        )
+        return (await cur.fetchone())[0] != 0
+
+    async def _migrate_ll2_events_is_event(self, cur: aiomysql.Cursor) -> None:
+        """
+        Add the indexed `is_event` column to the `ll2_events`
+        table and fill it for the existing rows.
+
+        Parameters
+        ----------
+        cur : aiomysql.Cursor
+            Database cursor.
+
+        Notes
+        -----
+        LL2 events have numeric IDs,
+        launches have UUIDs.
+        """
+        logger.info('Migrating ll2_events to a stored event type')
+        await cur.execute(
+            """
+            ALTER TABLE ll2_events
+            ADD COLUMN is_event TINYINT UNSIGNED DEFAULT 0,
+            ADD INDEX (is_event, start)
+            """
+        )
+        await cur.execute(
+            """
+            UPDATE ll2_events
+            SET is_event = ll2_id REGEXP '^[0-9]+$'
+            """
+        )
+
+    async def _migrate_sent_streams(self, cur: aiomysql.Cursor) -> None:
+        """
+        Migrate the `sent_streams` table to a fixed-width
+        binary primary key on the YouTube video ID.
+
+        Parameters
+        ----------
+        cur : aiomysql.Cursor
+            Database cursor.
+
+        Notes
+        -----
+        Rows are copied into a new table, keeping
+        the first 11 characters of valid video IDs
+        and the latest datetime per video ID.
+        """
+        logger.info('Migrating sent_streams to an indexed video ID')
+        await cur.execute(
+            """
+            DROP TABLE IF EXISTS sent_streams_new
+            """
+        )
+        await cur.execute(
+            """
+            CREATE TABLE sent_streams_new (
+            yt_vid_id CHAR(11) CHARACTER SET ascii COLLATE ascii_bin PRIMARY KEY,
+            datetime DATETIME DEFAULT NULL,
+            INDEX (datetime)
+            )
+            """
+        )
+        await cur.execute(
+            """
+            INSERT INTO sent_streams_new
+            SELECT
+                CONVERT(LEFT(yt_vid_id, 11) USING ascii) COLLATE ascii_bin AS id,
+                MAX(datetime)
+            FROM
+                sent_streams
+            WHERE
+                yt_vid_id REGEXP '^[A-Za-z0-9_-]{11}'
+            GROUP BY
+                id
+            """
+        )
+        await cur.execute(
+            """
+            RENAME TABLE
+                sent_streams TO sent_streams_old,
+                sent_streams_new TO sent_streams
+            """
+        )
+        await cur.execute(
+            """
+            DROP TABLE sent_streams_old
+            """
+        )
 
     async def __aenter__(self) -> Self:
         """
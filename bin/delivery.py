@@ -0,0 +1,80 @@
+import aiohttp
+import discord
+from discord.ui import Button, View
+from typing import Any
+
+def delivery_retryable(e: Exception) -> bool:
+    """
+    Check if a failed webhook message
+    can be delivered again later.
+
+    Parameters
+    ----------
+    e : Exception
+        Exception raised while sending.
+
+    Returns
+    -------
+    retryable : bool
+        True for rate limits, Discord
+        server errors and network errors.
+    """
+    if isinstance(e, discord.HTTPException):
+        return e.status == 429 or e.status >= 500
+    return isinstance(e, (aiohttp.ClientError, TimeoutError))
+
+def delivery_payload(message: dict[str, Any]) -> dict[str, Any]:
+    """
+    Convert webhook message kwargs
+    into a json serializable payload.
+
+    Parameters
+    ----------
+    message : dict[str, Any]
+        Kwargs for `discord.Webhook.send`,
+        views may only contain link buttons.
+
+    Returns
+    -------
+    payload : dict[str, Any]
+        Json serializable message.
+    """
+    payload = message.copy()
+    if (embed := message.get('embed')):
+        payload['embed'] = embed.to_dict()
+    if (view := message.get('view')):
+        payload['view'] = [
+            {
+                'label': button.label,
+                'emoji': str(button.emoji) if button.emoji else None,
+                'url': button.url
+            }
+            for button in view.children
+        ]
+    return payload
+
+def delivery_message(payload: dict[str, Any]) -> dict[str, Any]:
+    """
+    Convert a payload created by `delivery_payload`
+    back into webhook message kwargs.
+
+    Parameters
+    ----------
+    payload : dict[str, Any]
+        Json serializable message.
+
+    Returns
+    -------
+    message : dict[str, Any]
+        Kwargs for `discord.Webhook.send`.
+    """
+    message = payload.copy()
+    if (embed := payload.get('embed')):
+        message['embed'] = discord.Embed.from_dict(embed)
+    if (buttons := payload.get('view')):
+        message['view'] = View(timeout=None)
+        for button in buttons:
+            message['view'].add_item(
+                Button(style=discord.ButtonStyle.link, **button)
+            )
+    return message
@@ -0,0 +1,164 @@
+import asyncio
+from collections.abc import AsyncIterable, Awaitable, Callable, Iterable
+import logging
+from time import monotonic
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+class Fanout:
+    """
+    Delivery engine that processes jobs concurrently
+    with a bounded amount of workers while respecting
+    a global request rate.
+
+    Notes
+    -----
+    Use the `.run()` method to deliver jobs and await
+    `.throttle()` before every outgoing request.
+    Per-webhook rate-limit buckets are handled by
+    discord.py, jobs for the same target are sent
+    sequentially within a single worker.
+    """
+    def __init__(
+        self,
+        name: str,
+        workers: int = 16,
+        rate: float = 40
+    ) -> None:
+        # Name used for logging
+        self.name = name
+        # Maximum amount of concurrent jobs
+        self.workers = max(1, workers)
+        # Global requests per second with an equal burst size
+        self.rate = rate
+        self._tokens = rate
+        self._updated = monotonic()
+        self._lock = asyncio.Lock()
+        # Statistics of the last run
+        self.stats: dict[str, float | int] = {}
+
+    async def throttle(self) -> None:
+        """
+        Wait until a request is allowed
+        within the global rate limit.
+        """
+        async with self._lock:
+            now = monotonic()
+            # Refill the token bucket
+            self._tokens = min(
+                self.rate,
+                self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            # Wait for the next token
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._tokens = 1
+                self._updated = monotonic()
+            self._tokens -= 1
+
+    @staticmethod
+    def _percentile(values: list[float], percentile: float) -> float:
+        """
+        Nearest-rank percentile of sorted values.
+
+        Parameters
+        ----------
+        values : list[float]
+            Sorted values.
+        percentile : float
+            Percentile between 0 and 100.
+
+        Returns
+        -------
+        value : float
+            Value at the percentile, 0 when empty.
+        """
+        if not values:
+            return 0.
+        index = max(0, -(-len(values) * percentile // 100) - 1)
+        return values[int(index)]
+
+    async def run[T](
+        self,
+        jobs: AsyncIterable[T] | Iterable[T],
+        deliver: Callable[[T], Awaitable[Any]]
+    ) -> dict[str, float | int]:
+        """
+        Deliver all jobs using the worker pool.
+
+        Parameters
+        ----------
+        jobs : AsyncIterable[T] or Iterable[T]
+            Jobs to deliver, consumed while
+            the workers are already sending.
+        deliver : Callable[[T], Awaitable[Any]]
+            Coroutine function delivering a single job.
+
+        Returns
+        -------
+        stats : dict[str, float | int]
+            Amount of jobs and failures, run duration
+            and delivery latency percentiles in seconds.
+        """
+        queue: asyncio.Queue[T] = asyncio.Queue(self.workers * 2)
+        latencies: list[float] = []
+        failed = 0
+        start = monotonic()
+
+        async def worker() -> None:
+            """
+            Deliver jobs from the queue until cancelled.
+            """
+            nonlocal failed
+            while True:
+                job = await queue.get()
+                try:
+                    await deliver(job)
+                except Exception as e:
+                    failed += 1
+                    logger.error(
+                        f'{self.name}: error during delivery: {e}, {type(e)}'
+                    )
+                else:
+                    latencies.append(monotonic() - start)
+                finally:
+                    queue.task_done()
+
+        workers = [
+            asyncio.create_task(worker()) for _ in range(self.workers)
+        ]
+        try:
+            # Feed the queue
+            if isinstance(jobs, AsyncIterable):
+                async for job in jobs:
+                    await queue.put(job)
+            else:
+                for job in jobs:
+                    await queue.put(job)
+            # Wait for the workers to finish
+            await queue.join()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        # Latency percentiles
+        latencies.sort()
+        self.stats = {
+            'jobs': len(latencies) + failed,
+            'failed': failed,
+            'duration': monotonic() - start,
+            'p50': self._percentile(latencies, 50),
+            'p90': self._percentile(latencies, 90),
+            'p99': self._percentile(latencies, 99)
+        }
+        logger.info(
+            f"{self.name}: delivered {self.stats['jobs']} jobs"
+            f" ({failed} failed) in {self.stats['duration']:.2f}s,"
+            f" p50 {self.stats['p50']:.2f}s,"
+            f" p90 {self.stats['p90']:.2f}s,"
+            f" p99 {self.stats['p99']:.2f}s"
+        )
+        return self.stats
@@ -1,10 +1,16 @@
+import asyncio
 from datetime import datetime, timedelta, timezone
 from isodate import parse_duration  # type: ignore
+import logging
 import os
+import random
+from time import perf_counter
 from typing import Any
 
 from bin import get
 
+logger = logging.getLogger(__name__)
+
 type Item = dict[str, bool | datetime | int | str | None]
 
 class LaunchLibrary2:
@@ -110,6 +116,13 @@ class LaunchLibrary2:
         # Launch Library 2 API
         self.ll2_launch_url = 'https://ll.thespacedevs.com/2.3.0/launches/upcoming/?limit=50&mode=detailed&net__lte=%s'
         self.ll2_event_url = 'https://ll.thespacedevs.com/2.3.0/events/upcoming/?date__lte=%s&limit=50'
+        # Timeout per request in seconds
+        self.timeout = float(os.getenv('LL2_TIMEOUT', 30))
+        # Amount of retries and the base backoff in seconds
+        self.retries = int(os.getenv('LL2_RETRIES', 2))
+        self.backoff = float(os.getenv('LL2_BACKOFF', 2))
+        # Fetch and processing durations of the last update in seconds
+        self.timings: dict[str, float] = {}
 
     async def ll2_request(self, url: str) -> list[dict[str, Any]] | None:
         """
@@ -124,19 +137,39 @@ class LaunchLibrary2:
         -------
         results : dict[str, Any] | None
             Get a dictionary of the results or None if it fails.
+
+        Notes
+        -----
+        Failed requests and responses without results,
+        e.g. when throttled, are retried `.retries` times
+        with an exponential backoff with full jitter.
         """
-        # Request data from the LL2 API
-        try:
-            result = await get(
-                url,
-                headers=self.__ll2_auth_header,
-                json=True
-            )
-        except:
-            return
-        else:
-            if 'results' in result:
-                return result['results']
+        for attempt in range(self.retries + 1):
+            # Wait before retrying
+            if attempt:
+                await asyncio.sleep(
+                    random.uniform(0, self.backoff * 2 ** (attempt - 1))
+                )
+            # Request data from the LL2 API
+            try:
+                async with asyncio.timeout(self.timeout):
+                    result = await get(
+                        url,
+                        headers=self.__ll2_auth_header,
+                        json=True
+                    )
+            except Exception as e:
+                logger.warning(
+                    f'LL2 request failed (attempt {attempt + 1}): {e}, {type(e)}'
+                )
+            else:
+                if 'results' in result:
+                    return result['results']
+                # Throttled or an error response
+                logger.warning(
+                    f'LL2 request without results (attempt {attempt + 1}): '
+                    f"{result.get('detail')}"
+                )
 
     async def upcoming_launches(
         self
@@ -157,7 +190,26 @@ class LaunchLibrary2:
         )
         if results is None:
             return {}
+        return self._parse_launches(results)
+
+    def _parse_launches(
+        self,
+        results: list[dict[str, Any]]
+    ) -> dict[str, Item]:
+        """
+        Parses the results of an upcoming launches request.
+
+        Parameters
+        ----------
+        results : list[dict[str, Any]]
+            Launch Library 2 launch results.
 
+        Returns
+        -------
+        streams : dict[str, Item]
+            Dictionairy with the launch name, webcast_live,
+            mission description, net time, video URL and LL2 ID.
+        """
         # Storage dict for returning
         launches: dict[str, Item] = {}
 
@@ -213,7 +265,8 @@ class LaunchLibrary2:
                 'agency_id': entry['launch_service_provider']['id'],
                 'agency_name': entry['launch_service_provider']['name'],
                 'status': entry['status']['id'],
-                'flightclub': bool(entry['flightclub_url'])
+                'flightclub': bool(entry['flightclub_url']),
+                'is_event': False
             }
 
         # Returning
@@ -238,7 +291,26 @@ class LaunchLibrary2:
         )
         if results is None:
             return {}
+        return self._parse_events(results)
 
+    def _parse_events(
+        self,
+        results: list[dict[str, Any]]
+    ) -> dict[str, Item]:
+        """
+        Parses the results of an upcoming events request.
+
+        Parameters
+        ----------
+        results : list[dict[str, Any]]
+            Launch Library 2 event results.
+
+        Returns
+        -------
+        streams : dict[str, Item]
+            Dictionairy with the event name, webcast_live,
+            mission description, net time, video URL and LL2 ID.
+        """
         # Storage dict for returning
         events: dict[str, Item] = {}
 
@@ -298,7 +370,8 @@ class LaunchLibrary2:
                 'location': entry['location'],
                 'webcast_live': entry['webcast_live'],
                 'slug': entry['slug'],
-                'flightclub': False
+                'flightclub': False,
+                'is_event': True
             }
 
         # Returning
@@ -316,10 +389,28 @@ class LaunchLibrary2:
             Dictionairy with the event name, webcast_live,
             mission description, net time, video URL and LL2 ID.
         """
-        launches = await self.upcoming_launches()
-        events = await self.upcoming_events()
+        # Request launches and events concurrently
+        start = perf_counter()
+        max_net = (
+            datetime.now(timezone.utc) + self.timedelta_max_net
+        ).strftime('%Y-%m-%dT%H:%M:%SZ')
+        launch_results, event_results = await asyncio.gather(
+            self.ll2_request(self.ll2_launch_url % max_net),
+            self.ll2_request(self.ll2_event_url % max_net)
+        )
+        fetched = perf_counter()
+
+        # Timings, processing is updated once the results are complete
+        self.timings = {
+            'fetch': fetched - start,
+            'process': 0.
+        }
 
         # Only return when there are both launches and events
+        if launch_results is None or event_results is None:
+            return {}
+        launches = self._parse_launches(launch_results)
+        events = self._parse_events(event_results)
         if not ( launches and events ):
             return {}
 
@@ -336,5 +427,12 @@ class LaunchLibrary2:
         # Update cache
         self.cache = upcoming
 
+        # Timings
+        self.timings['process'] = perf_counter() - fetched
+        logger.debug(
+            f"LL2 update: fetched in {self.timings['fetch']:.2f}s,"
+            f" processed in {self.timings['process']:.3f}s"
+        )
+
         # Returning
         return upcoming
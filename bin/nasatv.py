@@ -1,8 +1,6 @@
 from bs4 import BeautifulSoup
-import json
-from os.path import isfile
 
-from bin import get
+from bin import ConfigFile, get
 
 class NASATV:
     """
@@ -16,6 +14,18 @@ class NASATV:
         # NASA TV
         self._nasatv_file = 'LiveLaunch_NASATV.json'
         self._nasatv_url = 'https://www.nasa.gov/nasatv/'
+        # Default NASA TV URLs
+        self._config = ConfigFile(
+            self._nasatv_file,
+            {
+                'nasatv': [
+                    'https://www.youtube.com/watch?v=21X5lGlDOfg',
+                    'https://www.youtube.com/watch?v=nA9UZF-SZoQ'
+                ]
+            },
+            self._validate
+        )
+        self.nasatv: list[str] = self._config.data['nasatv']
 
     def __contains__(self, url: str) -> bool:
         """
@@ -34,32 +44,36 @@ class NASATV:
         """
         return url in self.nasatv
 
+    @staticmethod
+    def _validate(data: dict[str, list[str]]) -> None:
+        """
+        Validates the contents of the `._nasatv_file` json file.
+
+        Parameters
+        ----------
+        data : dict[str, list[str]]
+            Parsed json file.
+
+        Raises
+        ------
+        ValueError
+            When the NASA TV URLs are missing.
+        """
+        if not isinstance(data.get('nasatv'), list):
+            raise ValueError('expected `nasatv` as a list of URLs')
+
     def _defaultNASAlive(self) -> None:
         """
-        Reads the `._nasatv_file` json file
-        and sets the `.nasatv` variable.
+        Reloads the `._nasatv_file` json file when
+        it changed and sets the `.nasatv` variable.
 
         Notes
         -----
         Stores the NASA TV YouTube stream
         URLs into the `.nasatv` variable.
         """
-        # Default NASA TV URLs
-        nasatv_default = ['https://www.youtube.com/watch?v=21X5lGlDOfg', \
-                          'https://www.youtube.com/watch?v=nA9UZF-SZoQ']
-        # Open self._nasatv_file json to find previously found NASA TV URLs
-        if isfile(self._nasatv_file):
-            with open(self._nasatv_file, 'r', encoding='utf-8') as f:
-                f = json.load(f)
-            try:
-                self.nasatv = f['nasatv']
-            except:
-                self.nasatv = nasatv_default
-        # If self._nasatv_file json doesn't exist, create one with the defaults
-        else:
-            self.nasatv = nasatv_default
-            with open(self._nasatv_file, 'w', encoding='utf-8') as f:
-                json.dump({'nasatv': self.nasatv}, f, indent=2)
+        if self._config.reload():
+            self.nasatv = self._config.data['nasatv']
 
     async def _findNASAlive(self) -> None:
         """
@@ -90,8 +104,7 @@ class NASATV:
             # Add new streams
             self.nasatv += newstreams
             # Store new NASA TV streams in the self._nasatv_file json
-            with open(self._nasatv_file, 'w', encoding='utf-8') as f:
-                json.dump({'nasatv': self.nasatv}, f, indent=2)
+            self._config.save({'nasatv': self.nasatv})
 
     async def update(self) -> None:
         """
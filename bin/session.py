@@ -0,0 +1,167 @@
+import aiohttp
+from collections.abc import Awaitable, Callable
+import logging
+from os import getenv
+from types import SimpleNamespace, TracebackType
+from typing import Self
+
+logger = logging.getLogger(__name__)
+
+class SessionManager:
+    """
+    Shared, long-lived aiohttp client session for all outbound HTTP.
+
+    Notes
+    -----
+    The session is created on first use of `.session`
+    and keeps connections alive between requests.
+    Use the object as an asynchronous context manager
+    to close the session and its connection pool.
+    """
+    def __init__(self) -> None:
+        # Connection pool settings
+        self.limit = int(getenv('HTTP_LIMIT', 100))
+        self.limit_per_host = int(getenv('HTTP_LIMIT_PER_HOST', 20))
+        self.keepalive_timeout = float(getenv('HTTP_KEEPALIVE', 60))
+        self.ttl_dns_cache = int(getenv('HTTP_DNS_TTL', 300))
+        # Session, created on first use
+        self._session: aiohttp.ClientSession | None = None
+        # Connection reuse statistics
+        self._stats = {
+            'requests': 0,
+            'connections_created': 0,
+            'connections_reused': 0,
+            'dns_cache_hits': 0,
+            'dns_cache_misses': 0
+        }
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """
+        Shared client session, (re)created when needed.
+
+        Returns
+        -------
+        session : aiohttp.ClientSession
+            Client session with a shared connection pool.
+        """
+        if self._session is None or self._session.closed:
+            # Count connection events
+            trace_config = aiohttp.TraceConfig()
+            trace_config.on_request_start.append(self._count('requests'))
+            trace_config.on_connection_create_end.append(
+                self._count('connections_created')
+            )
+            trace_config.on_connection_reuseconn.append(
+                self._count('connections_reused')
+            )
+            trace_config.on_dns_cache_hit.append(
+                self._count('dns_cache_hits')
+            )
+            trace_config.on_dns_cache_miss.append(
+                self._count('dns_cache_misses')
+            )
+            # Create session with a keep-alive connection pool
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.limit,
+                    limit_per_host=self.limit_per_host,
+                    keepalive_timeout=self.keepalive_timeout,
+                    ttl_dns_cache=self.ttl_dns_cache
+                ),
+                trace_configs=[trace_config]
+            )
+        return self._session
+
+    def _count(
+        self,
+        key: str
+    ) -> Callable[
+        [aiohttp.ClientSession, SimpleNamespace, object],
+        Awaitable[None]
+    ]:
+        """
+        Create a trace callback incrementing a statistic.
+
+        Parameters
+        ----------
+        key : str
+            Statistic to increment.
+
+        Returns
+        -------
+        callback : Callable[
+            [aiohttp.ClientSession, SimpleNamespace, object],
+            Awaitable[None]
+        ]
+            Trace callback for aiohttp.
+        """
+        async def callback(
+            session: aiohttp.ClientSession,
+            context: SimpleNamespace,
+            params: object
+        ) -> None:
+            self._stats[key] += 1
+        return callback
+
+    @property
+    def stats(self) -> dict[str, float | int]:
+        """
+        Connection reuse statistics.
+
+        Returns
+        -------
+        stats : dict[str, float | int]
+            Request, connection and DNS cache
+            counters and the connection reuse ratio.
+        """
+        stats: dict[str, float | int] = self._stats.copy()
+        connections = stats['connections_created'] + stats['connections_reused']
+        stats['reuse_ratio'] = (
+            stats['connections_reused'] / connections if connections else 0.
+        )
+        return stats
+
+    async def close(self) -> None:
+        """
+        Close the session and its connection pool.
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+            logger.info(f'Closed HTTP session: {self.stats}')
+        self._session = None
+
+    async def __aenter__(self) -> Self:
+        """
+        Enter asynchronous context manager.
+
+        Returns
+        -------
+        self : SessionManager
+            Returns self.
+        """
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[Exception] | None,
+        exc_value: Exception | None,
+        traceback: TracebackType | None
+    ) -> None:
+        """
+        Exit asynchronous context manager.
+        Closes the session.
+
+        Parameters
+        ----------
+        exc_type : type[Exception] or None
+            Exception type.
+        exc_value : Exception or None
+            Exception value.
+        traceback : TracebackType or None
+            Exception traceback.
+        """
+        await self.close()
+
+# Session manager shared by the whole bot
+session_manager = SessionManager()
@@ -0,0 +1,217 @@
+import asyncio
+from collections import OrderedDict
+from collections.abc import Hashable
+import json
+import logging
+import os
+from time import time
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+class TTLCache[K: Hashable]:
+    """
+    Bounded in-memory cache with least recently used
+    and time to live eviction, optionally persisted
+    to a json file.
+
+    Notes
+    -----
+    Keys must be strings and values json serializable
+    when the cache is persisted, tuples are stored
+    and loaded as lists. Use `.dump_async()` within
+    the event loop to write the file in a thread.
+    """
+    def __init__(self, maxsize: int = 1024, ttl: float = 86400) -> None:
+        # Maximum amount of entries
+        self.maxsize = maxsize
+        # Time to live in seconds
+        self.ttl = ttl
+        # Cached entries, key: (expiry timestamp, value)
+        self._data: OrderedDict[K, tuple[float, Any]] = OrderedDict()
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """
+        Amount of cached entries, including expired ones.
+
+        Returns
+        -------
+        int
+        """
+        return len(self._data)
+
+    def __contains__(self, key: K) -> bool:
+        """
+        Check if an unexpired entry is cached,
+        counted as a lookup in the statistics.
+
+        Parameters
+        ----------
+        key : K
+            Cache key.
+
+        Returns
+        -------
+        bool
+        """
+        return self.get(key, self) is not self
+
+    def get(self, key: K, default: Any = None) -> Any:
+        """
+        Get a cached value and mark it as recently used.
+
+        Parameters
+        ----------
+        key : K
+            Cache key.
+        default : Any, default: None
+            Returned when missing or expired.
+
+        Returns
+        -------
+        value : Any
+            Cached value or the default.
+        """
+        if (entry := self._data.get(key)) is not None:
+            if entry[0] > time():
+                self._data.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            # Expired
+            del self._data[key]
+        self.misses += 1
+        return default
+
+    def set(
+        self,
+        key: K,
+        value: Any,
+        *,
+        expires: float | None = None
+    ) -> None:
+        """
+        Cache a value, evicting the least
+        recently used entries when full.
+
+        Parameters
+        ----------
+        key : K
+            Cache key.
+        value : Any
+            Value to cache.
+        expires : float or None, default: None
+            Expiry timestamp, when None,
+            it expires after `.ttl` seconds.
+        """
+        if expires is None:
+            expires = time() + self.ttl
+        elif expires <= time():
+            return
+        self._data[key] = (expires, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    @property
+    def stats(self) -> dict[str, float | int]:
+        """
+        Cache statistics.
+
+        Returns
+        -------
+        stats : dict[str, float | int]
+            Size, hits, misses and hit ratio.
+        """
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._data),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': self.hits / lookups if lookups else 0.
+        }
+
+    def _unexpired(self) -> dict[K, tuple[float, Any]]:
+        """
+        Copy of the unexpired entries.
+
+        Returns
+        -------
+        data : dict[K, tuple[float, Any]]
+            Key: (expiry timestamp, value).
+        """
+        now = time()
+        return {
+            key: entry for key, entry in self._data.items() if entry[0] > now
+        }
+
+    @staticmethod
+    def _write(path: str, data: dict[K, tuple[float, Any]]) -> None:
+        """
+        Write entries into a json file.
+
+        Parameters
+        ----------
+        path : str
+            Path of the json file.
+        data : dict[K, tuple[float, Any]]
+            Key: (expiry timestamp, value).
+        """
+        # Write to a temporary file first to keep the file intact on failure
+        try:
+            with open(f'{path}.tmp', 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(f'{path}.tmp', path)
+        except OSError as e:
+            logger.error(f'Cannot store cache in {path}: {e}')
+
+    def dump(self, path: str) -> None:
+        """
+        Store the unexpired entries into a json file.
+
+        Parameters
+        ----------
+        path : str
+            Path of the json file.
+        """
+        self._write(path, self._unexpired())
+
+    async def dump_async(self, path: str) -> None:
+        """
+        Store the unexpired entries into a json file,
+        written in a thread to not block the event loop.
+
+        Parameters
+        ----------
+        path : str
+            Path of the json file.
+        """
+        await asyncio.to_thread(self._write, path, self._unexpired())
+
+    def load(self, path: str) -> None:
+        """
+        Load the unexpired entries from a json file if it exists.
+
+        Parameters
+        ----------
+        path : str
+            Path of the json file.
+        """
+        if not os.path.isfile(path):
+            return
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error(f'Cannot load cache from {path}: {e}')
+            return
+        now = time()
+        for key, (expiry, value) in sorted(
+            data.items(), key=lambda item: item[1][0]
+        ):
+            if expiry > now:
+                self._data[key] = (expiry, value)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
@@ -1,87 +1,226 @@
-from googleapiclient.discovery import build, Resource  # type: ignore
+from collections.abc import Iterable
+import logging
 from os import getenv
+from time import monotonic
+from typing import Any
+
+from bin import session_manager, TTLCache
+
+logger = logging.getLogger(__name__)
 
 class YouTubeAPI:
     """
-    YouTube API class with methods for getting
-    information of videos and their channels.
+    Asynchronous YouTube API class with methods for
+    getting information of videos and their channels.
 
     Notes
     -----
+    Responses are cached with a TTL, the caches are
+    persisted when `YOUTUBE_CACHE_FILE` is set, at
+    most every `YOUTUBE_CACHE_PERSIST` seconds.
+
     Available methods:
-        `.get_channel_thumbtitle()`
-        `.get_channel_from_video()`
+        `.get_channel_thumbtitles()`
+        `.get_channels_from_videos()`
     """
     def __init__(self):
         # Youtube v3 API
         self._key = getenv('YOUTUBE_KEY')
-        self._API_SERVICE_NAME = 'youtube'
-        self._API_VERSION = 'v3'
-        # Authenticate
-        self._get_authenticated_service()
+        self._api_url = 'https://www.googleapis.com/youtube/v3/%s'
+        # Maximum amount of IDs per request
+        self.max_ids = 50
+        # Caches for video -> channel and channel -> (thumb, title)
+        self._video_cache: TTLCache[str] = TTLCache(
+            maxsize=int(getenv('YOUTUBE_CACHE_SIZE', 4096)),
+            ttl=604800
+        )
+        self._channel_cache: TTLCache[str] = TTLCache(
+            maxsize=int(getenv('YOUTUBE_CACHE_SIZE', 4096)),
+            ttl=86400
+        )
+        # Optional persistence of the caches
+        if (cache_file := getenv('YOUTUBE_CACHE_FILE')):
+            self._video_cache.load(f'{cache_file}.videos.json')
+            self._channel_cache.load(f'{cache_file}.channels.json')
+        self._cache_file = cache_file
+        self._persist_interval = float(getenv('YOUTUBE_CACHE_PERSIST', 300))
+        self._persisted_at = monotonic()
 
-    def _get_authenticated_service(self) -> None:
+    @property
+    def cache_stats(self) -> dict[str, dict[str, float | int]]:
         """
-        Logs into the YouTube API using the API key.
+        Statistics of the response caches.
 
-        Notes
-        -----
-        Stores the API access resource ``googleapiclient.discovery.build``
-        into the `.youtube` variable.
+        Returns
+        -------
+        stats : dict[str, dict[str, float | int]]
+            Cache statistics for `videos` and `channels`.
         """
-        self.youtube: Resource = build(
-            self._API_SERVICE_NAME,
-            self._API_VERSION,
-            developerKey=self._key
+        return {
+            'videos': self._video_cache.stats,
+            'channels': self._channel_cache.stats
+        }
+
+    async def _persist(self, force: bool = False) -> None:
+        """
+        Store the caches when persistence is enabled
+        and the persist interval has passed.
+
+        Parameters
+        ----------
+        force : bool, default: False
+            Ignore the persist interval.
+        """
+        if not self._cache_file or not force and (
+            monotonic() - self._persisted_at < self._persist_interval
+        ):
+            return
+        self._persisted_at = monotonic()
+        await self._video_cache.dump_async(f'{self._cache_file}.videos.json')
+        await self._channel_cache.dump_async(
+            f'{self._cache_file}.channels.json'
         )
 
-    def get_channel_thumbtitle(self, id: str) -> tuple[str, str] | None:
+    async def close(self) -> None:
+        """
+        Store the caches when persistence is enabled.
+        """
+        await self._persist(force=True)
+
+    async def _list(
+        self,
+        resource: str,
+        ids: Iterable[str],
+        fields: str
+    ) -> list[dict[str, Any]]:
         """
-        Retrieves a thumbnail URL and title for a given YouTube channel ID.
+        Request the snippets of the given IDs in
+        batches of up to `.max_ids` IDs per request.
 
         Parameters
         ----------
-        id : str
-            YouTube channel ID.
+        resource : str
+            API resource, e.g. `videos` or `channels`.
+        ids : Iterable[str]
+            YouTube video or channel IDs.
+        fields : str
+            Fields to include in the response.
 
         Returns
         -------
-        (thumb, title) : tuple[str, str] or None
-            Returns the thumbnail and channel title or None if it fails.
+        items : list[dict[str, Any]]
+            Returned items, batches
+            that fail are left out.
         """
-        try:
-            response = self.youtube.channels().list(
-                part='snippet',
-                id=id,
-                fields='items/snippet(title,thumbnails/default/url)'
-            ).execute()
-            snippet = response['items'][0]['snippet']
-            thumb = snippet['thumbnails']['default']['url']
-            title = snippet['title']
-            return thumb, title
-        except:
-            return None
-
-    def get_channel_from_video(self, id: str) -> str | None:
+        ids = list(dict.fromkeys(ids))
+        items: list[dict[str, Any]] = []
+        for i in range(0, len(ids), self.max_ids):
+            try:
+                async with session_manager.session.get(
+                    self._api_url % resource,
+                    params={
+                        'part': 'snippet',
+                        'id': ','.join(ids[i:i + self.max_ids]),
+                        'fields': fields,
+                        'key': self._key
+                    }
+                ) as response:
+                    response.raise_for_status()
+                    items += (await response.json()).get('items', [])
+            except Exception as e:
+                logger.error(
+                    f'YouTube API {resource} request failed: {e}, {type(e)}'
+                )
+        return items
+
+    async def get_channel_thumbtitles(
+        self,
+        ids: Iterable[str]
+    ) -> dict[str, tuple[str, str]]:
         """
-        Uses a YouTube video ID to find the corresponding channel ID.
+        Retrieves thumbnail URLs and titles for the given YouTube channel IDs.
 
         Parameters
         ----------
-        id : str
-            YouTube video ID.
+        ids : Iterable[str]
+            YouTube channel IDs.
 
         Returns
         -------
-        channel : str or None
-            Returns a string containing the channel ID or None if it fails.
+        channels : dict[str, tuple[str, str]]
+            Thumbnail and channel title per channel ID,
+            channels that can't be found are left out.
+        """
+        channels: dict[str, tuple[str, str]] = {}
+        # Use cached channels
+        missing: list[str] = []
+        for id in dict.fromkeys(ids):
+            if (cached := self._channel_cache.get(id)) is not None:
+                channels[id] = tuple(cached)
+            else:
+                missing.append(id)
+        if not missing:
+            return channels
+
+        # Request the remaining channels
+        for item in await self._list(
+            'channels',
+            missing,
+            'items(id,snippet(title,thumbnails/default/url))'
+        ):
+            try:
+                snippet = item['snippet']
+                channels[item['id']] = (
+                    snippet['thumbnails']['default']['url'],
+                    snippet['title']
+                )
+            except KeyError:
+                continue
+            self._channel_cache.set(item['id'], channels[item['id']])
+
+        await self._persist()
+        return channels
+
+    async def get_channels_from_videos(
+        self,
+        ids: Iterable[str]
+    ) -> dict[str, str]:
         """
-        try:
-            response = self.youtube.videos().list(
-                part='snippet',
-                id=id,
-                fields='items/snippet/channelId'
-            ).execute()
-            return response['items'][0]['snippet']['channelId']
-        except:
-            return None
\ No newline at end of file
+        Uses YouTube video IDs to find the corresponding channel IDs.
+
+        Parameters
+        ----------
+        ids : Iterable[str]
+            YouTube video IDs.
+
+        Returns
+        -------
+        channels : dict[str, str]
+            Channel ID per video ID, videos
+            that can't be found are left out.
+        """
+        channels: dict[str, str] = {}
+        # Use cached videos
+        missing: list[str] = []
+        for id in dict.fromkeys(ids):
+            if (cached := self._video_cache.get(id)) is not None:
+                channels[id] = cached
+            else:
+                missing.append(id)
+        if not missing:
+            return channels
+
+        # Request the remaining videos
+        for item in await self._list(
+            'videos',
+            missing,
+            'items(id,snippet/channelId)'
+        ):
+            try:
+                channels[item['id']] = item['snippet']['channelId']
+            except KeyError:
+                continue
+            self._video_cache.set(item['id'], channels[item['id']])
+
+        await self._persist()
+        return channels
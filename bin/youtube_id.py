@@ -12,12 +12,13 @@ def youtube_strip_video_id(url: str) -> str | None:
     Returns
     -------
     id : str or None
-        YouTube video ID when it can be found, otherwise it returns None.
+        The 11 character YouTube video ID when
+        it can be found, otherwise it returns None.
     """
     match = None
     if 'youtube' in url:
-        match = re.search(r'(?<=youtube.com\/watch\?v=).*', url)
+        match = re.search(r'(?<=youtube.com\/watch\?v=)[A-Za-z0-9_-]{11}', url)
     elif 'youtu.be' in url:
-        match = re.search(r'(?<=youtu.be\/).*', url)
+        match = re.search(r'(?<=youtu.be\/)[A-Za-z0-9_-]{11}', url)
     if match:
         return match.group()
@@ -1,10 +1,18 @@
-from bs4 import BeautifulSoup
-from datetime import datetime, timezone
-import json
-from os.path import isfile
+import asyncio
+from datetime import datetime, timedelta, timezone
+from io import BytesIO
+import logging
+from lxml import etree
+from os import getenv
 import re
+from time import perf_counter
+from typing import Any
 
-from bin import get
+from bin import ConfigFile, session_manager
+
+type Entry = tuple[str, str, datetime, datetime]
+
+logger = logging.getLogger(__name__)
 
 class YouTubeRSS:
     """
@@ -15,89 +23,234 @@ class YouTubeRSS:
     Notes
     -----
     Use the `.request()` method to try to find new streams.
+    Feeds are requested conditionally, unchanged feeds
+    reuse the previously parsed entries. The fetch time
+    per channel of the last request is available in
+    the `.timings` variable.
     """
     def __init__(self):
         # YouTube channels & keywords
         self.ytfile = 'LiveLaunch_YouTube.json'
+        self._config = ConfigFile(
+            self.ytfile,
+            {
+                'channels': [],
+                'keywords': {},
+                'ignore': {},
+                'agency_ids': {}
+            },
+            self._validate_channel_list
+        )
+        # Maximum amount of concurrent feed requests
+        self.concurrency = int(getenv('RSS_CONCURRENCY', 8))
+        # Timeout per feed in seconds
+        self.timeout = float(getenv('RSS_TIMEOUT', 10))
+        # Fetch time in seconds per channel of the last request
+        self.timings: dict[str, float] = {}
+        # Atom and YouTube XML namespaces
+        self._atom = '{http://www.w3.org/2005/Atom}'
+        self._yt = '{http://www.youtube.com/xml/schemas/2015}'
+        # Response validators (ETag, Last-Modified) and entries per channel
+        self._validators: dict[str, tuple[str | None, str | None]] = {}
+        self._entries: dict[str, list[Entry]] = {}
 
         self.channels: list[str] = []
         self.keywords: dict[str, list[str]] = {}
         self.ignore: dict[str, list[str]] = {}
         self.agency_ids: dict[str, int] = {}
+        # Compiled title matchers per channel
+        self._keyword_patterns: dict[str, re.Pattern[str]] = {}
+        self._ignore_patterns: dict[str, re.Pattern[str]] = {}
+
+    @staticmethod
+    def _validate_channel_list(data: dict[str, Any]) -> None:
+        """
+        Validates the contents of the `.ytfile` json file.
+
+        Parameters
+        ----------
+        data : dict[str, Any]
+            Parsed json file.
+
+        Raises
+        ------
+        ValueError
+            When the file is missing keys or has wrong types.
+        """
+        if not (
+            isinstance(data.get('channels'), list)
+            and all(isinstance(i, str) for i in data['channels'])
+            and all(
+                isinstance(data.get(key), dict)
+                for key in ('keywords', 'ignore', 'agency_ids')
+            )
+            and all(
+                isinstance(words, list)
+                and all(isinstance(i, str) for i in words)
+                for key in ('keywords', 'ignore')
+                for words in data[key].values()
+            )
+        ):
+            raise ValueError(
+                'expected `channels` as a list of channel IDs and '
+                '`keywords`, `ignore` and `agency_ids` as dictionaries'
+            )
 
     def _get_channel_list(self) -> None:
         """
-        Opens the `.ytfile` json file to see what YouTube channels to check and
-        their keywords to find livestreams.
+        Reloads the `.ytfile` json file when it changed to see what YouTube
+        channels to check and their keywords to find livestreams.
 
         Notes
         -----
-        Stores the data into the `.channels` and `.keywords` variables.
+        Stores the data into the `.channels`, `.keywords`, `.ignore`
+        and `.agency_ids` variables and compiles the title matchers.
         """
-        if isfile(self.ytfile):
-            with open(self.ytfile, 'r', encoding='utf-8') as f:
-                f = json.load(f)
-            try:
-                self.channels = f['channels']
-                self.keywords = f['keywords']
-                self.ignore = f['ignore']
-                self.agency_ids = f['agency_ids']
-            except:
-                self.channels = []
-                self.keywords = {}
-                self.ignore = {}
-                self.agency_ids = {}
-        else:
-            with open(self.ytfile, 'w', encoding='utf-8') as f:
-                json.dump(
-                    {
-                        'channels': [],
-                        'keywords': {},
-                        'ignore': {},
-                        'agency_ids': {}
-                    },
-                    f, indent=2
-                )
-            self.channels = []
-            self.keywords = {}
-            self.ignore = {}
-            self.agency_ids = {}
+        if not self._config.reload():
+            return
+
+        config = self._config.data
+        self.channels = config['channels']
+        self.keywords = config['keywords']
+        self.ignore = config['ignore']
+        self.agency_ids = config['agency_ids']
+
+        # Compile the title matchers
+        self._keyword_patterns = {
+            channel: pattern
+            for channel, words in self.keywords.items()
+            if (pattern := self._compile_words(words))
+        }
+        self._ignore_patterns = {
+            channel: pattern
+            for channel, words in self.ignore.items()
+            if (pattern := self._compile_words(words))
+        }
+
+    @staticmethod
+    def _compile_words(words: list[str]) -> re.Pattern[str] | None:
+        """
+        Compiles a list of words into a single
+        case-insensitive whole word pattern.
+
+        Parameters
+        ----------
+        words : list[str]
+            Words to search for.
+
+        Returns
+        -------
+        pattern : re.Pattern[str] or None
+            Pattern matching any of the words,
+            None when there are no words.
+        """
+        if not words:
+            return None
+        return re.compile(
+            r'\b(?:{})\b'.format('|'.join(map(re.escape, words))),
+            re.IGNORECASE
+        )
 
-    async def _requestRSS(self, channel: str) -> BeautifulSoup:
+    async def _requestRSS(
+        self,
+        channel: str,
+        max_days_ago: int
+    ) -> list[Entry] | None:
         """
-        Requests the RSS feed of the requested channel.
+        Requests and parses the RSS feed of the requested channel,
+        conditionally when the feed was requested before.
 
         Parameters
         ----------
         channel : str
             YouTube channel ID.
+        max_days_ago : int
+            Maximum days of video age to parse.
 
         Returns
         -------
-        soup : bs4.BeautifulSoup
-            Returns a soup object containing the RSS feed entries.
+        entries : list[Entry] or None
+            Returns the parsed RSS feed entries
+            or None when the feed is unchanged.
         """
         f = f'https://www.youtube.com/feeds/videos.xml?channel_id={channel}'
-        soup = BeautifulSoup(await get(f), features='xml')
-        return soup
+        # Validators of the previous response
+        headers: dict[str, str] = {}
+        etag, last_modified = self._validators.get(channel, (None, None))
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+
+        async with session_manager.session.get(f, headers=headers) as response:
+            # Unchanged
+            if response.status == 304:
+                return None
+            response.raise_for_status()
+            entries = self._parse_entries(await response.read(), max_days_ago)
+            # Store validators for the next request
+            self._validators[channel] = (
+                response.headers.get('ETag'),
+                response.headers.get('Last-Modified')
+            )
+        return entries
 
-    def _word_in_text(self, word: str, text: str) -> bool:
+    def _parse_entries(self, feed: bytes, max_days_ago: int) -> list[Entry]:
         """
-        Checks if a word is in a given text.
+        Parse the entries of an Atom feed incrementally,
+        stops at the first entry that is too old.
 
         Parameters
         ----------
-        word : str
-            Search word.
-        text : str
-            Text to search.
+        feed : bytes
+            Atom feed of a YouTube channel.
+        max_days_ago : int
+            Maximum days of video age to parse.
 
         Returns
         -------
-        bool
+        entries : list[Entry]
+            Video ID, title, published and updated
+            datetimes of the complete entries.
+
+        Notes
+        -----
+        Entries are ordered by publication date, newest first.
+        A video published `3 * max_days_ago + 1` days ago or
+        earlier can never pass the age checks of
+        `._get_channel_broadcastsRSS()`.
         """
-        match = re.search(r'\b({})\b'.format(word), text, re.IGNORECASE)
-        return bool(match)
+        cutoff = datetime.now(timezone.utc) - timedelta(days=3 * max_days_ago + 1)
+        entries: list[Entry] = []
+        for _, entry in etree.iterparse(
+            BytesIO(feed),
+            events=('end',),
+            tag=f'{self._atom}entry',
+            resolve_entities=False
+        ):
+            yt_vid_id = entry.findtext(f'{self._yt}videoId')
+            title = entry.findtext(f'{self._atom}title')
+            published = entry.findtext(f'{self._atom}published')
+            updated = entry.findtext(f'{self._atom}updated')
+            # Free the parsed entry
+            entry.clear()
+
+            # Skip incomplete entries
+            if not (yt_vid_id and title is not None and published and updated):
+                continue
+            published = datetime.fromisoformat(published)
+            # Remaining entries are too old
+            if published <= cutoff:
+                break
+            entries.append(
+                (
+                    yt_vid_id,
+                    title,
+                    published,
+                    datetime.fromisoformat(updated)
+                )
+            )
+        return entries
 
     async def _get_channel_broadcastsRSS(
         self,
@@ -119,42 +272,26 @@ class YouTubeRSS:
         streams : list containing strings
             Returns a list containing YouTube video IDs.
         """
-        soup = await self._requestRSS(channel)
+        # Only use new entries when the feed changed
+        if (entries := await self._requestRSS(channel, max_days_ago)) is not None:
+            self._entries[channel] = entries
+
         streams: list[str] = []
         # Get current time
         now = datetime.now(timezone.utc)
-        for entry in soup.find_all('entry'):
-            # get the amount of days ago the video was published & updated
-            if entry.published:
-                published = datetime.fromisoformat(entry.published.text)
-            else:
-                continue
-            if entry.updated:
-                updated = datetime.fromisoformat(entry.updated.text)
-            else:
-                continue
-
+        for yt_vid_id, title, published, updated in self._entries.get(channel, []):
             # Check if the video was posted less or equal to 2 days ago
             if ((now - updated).days <= max_days_ago
                     and (updated - published).days < 2 * max_days_ago):
                 # Check for the right words in the video title before appending
-                if any([
-                        self._word_in_text(i, entry.title.text)
-                        if entry.title else False
-                        for i in self.keywords[channel]
-                ]):
+                if (keywords := self._keyword_patterns.get(channel)) \
+                        and keywords.search(title):
                     # Don't append if the title contains an ignore keyword
                     if not (
-                        (ignore := self.ignore.get(channel)) and
-                        any([
-                            self._word_in_text(i, entry.title.text)
-                            if entry.title else False
-                            for i in ignore
-                        ])
+                        (ignore := self._ignore_patterns.get(channel))
+                        and ignore.search(title)
                     ):
-                        yt_vid_id = entry.find('yt:videoId')
-                        if yt_vid_id and yt_vid_id.string:
-                            streams.append(yt_vid_id.string)
+                        streams.append(yt_vid_id)
 
         return streams
 
@@ -171,9 +308,42 @@ class YouTubeRSS:
         """
         # Get YouTube channels and their keywords
         self._get_channel_list()
-        # Request upcoming streams for channels and store livestream links
-        streams: dict[str, list[str]] = {}
-        for channel in self.channels:
-            streams[channel] = await self._get_channel_broadcastsRSS(channel)
+        # Limit the amount of concurrent feed requests
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def fetch(channel: str) -> list[str]:
+            """
+            Request a single channel within the timeout.
+
+            Parameters
+            ----------
+            channel : str
+                YouTube channel ID.
+
+            Returns
+            -------
+            streams : list[str]
+                YouTube video IDs, empty when failed.
+            """
+            async with semaphore:
+                start = perf_counter()
+                try:
+                    async with asyncio.timeout(self.timeout):
+                        return await self._get_channel_broadcastsRSS(channel)
+                except Exception as e:
+                    logger.warning(
+                        f'YouTube channel {channel}: RSS request'
+                        f' failed: {e}, {type(e)}'
+                    )
+                    return []
+                finally:
+                    self.timings[channel] = perf_counter() - start
+
+        # Request upcoming streams for all channels concurrently
+        self.timings = {}
+        results = await asyncio.gather(
+            *(fetch(channel) for channel in self.channels)
+        )
+        streams: dict[str, list[str]] = dict(zip(self.channels, results))
         # Returning
         return streams
@@ -1,4 +1,3 @@
-import aiohttp
 from discord import Webhook
 from discord.ext import commands, tasks
 import logging
@@ -14,6 +13,7 @@ class LiveLaunchDB(commands.Cog):
     def __init__(self, bot: LiveLaunchBot) -> None:
         self.bot = bot
         self.clean_database.start()
+        self.log_pool_stats.start()
 
     @tasks.loop(hours=24)
     async def clean_database(self) -> None:
@@ -28,16 +28,15 @@ class LiveLaunchDB(commands.Cog):
         async for guild_id, webhook_url in async_iter:
 
             # Create webhook connection for deletion
-            async with aiohttp.ClientSession() as session:
-                webhook = Webhook.from_url(
-                    webhook_url,
-                    session=session
-                )
-                # Delete webhook
-                try:
-                    await webhook.delete()
-                except:
-                    pass
+            webhook = Webhook.from_url(
+                webhook_url,
+                session=self.bot.sessions.session
+            )
+            # Delete webhook
+            try:
+                await webhook.delete()
+            except:
+                pass
 
             # Update the guild settings
             await self.bot.lldb.enabled_guilds_edit(
@@ -51,6 +50,14 @@ class LiveLaunchDB(commands.Cog):
                 f'Guild ID {guild_id}: removed unused notification webhook'
             )
 
+    @tasks.loop(hours=1)
+    async def log_pool_stats(self) -> None:
+        """
+        Discord task for logging the
+        database pool statistics.
+        """
+        logger.info(f'Database pool: {self.bot.lldb.pool.stats}')
+
 
 async def setup(bot: LiveLaunchBot):
     await bot.add_cog(LiveLaunchDB(bot))
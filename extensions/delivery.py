@@ -0,0 +1,80 @@
+import discord
+from discord.ext import commands, tasks
+import logging
+
+from bin import delivery_message, delivery_retryable
+from main import LiveLaunchBot
+
+logger = logging.getLogger(__name__)
+
+class LiveLaunchDelivery(commands.Cog):
+    """
+    Discord.py cog for retrying failed webhook messages.
+    """
+    def __init__(self, bot: LiveLaunchBot) -> None:
+        self.bot = bot
+        # Start loops
+        self.retry_deliveries.start()
+
+    @tasks.loop(seconds=30)
+    async def retry_deliveries(self) -> None:
+        """
+        Discord task for retrying queued
+        webhook messages that are due.
+        """
+        for job in await self.bot.lldb.delivery_queue_due():
+            guild_id = job['guild_id']
+
+            # Drop the message when the guild removed the webhook
+            if job['webhook_url'] is None:
+                await self.bot.lldb.delivery_queue_remove(job['id'])
+                continue
+
+            try:
+                # Creating webhook with the client to be able to send buttons
+                webhook = discord.Webhook.from_url(
+                    job['webhook_url'],
+                    client=self.bot,
+                    session=self.bot.sessions.session
+                )
+
+                # Sending message
+                await webhook.send(**delivery_message(job['payload']))
+
+            # Remove channel and url from the db when either is removed or deleted
+            except discord.errors.NotFound:
+                if await self.bot.lldb.delivery_queue_webhook_remove(
+                    guild_id,
+                    job['webhook'],
+                    job['webhook_url']
+                ):
+                    logger.info(
+                        f"Guild ID {guild_id}: removed"
+                        f" unfound {job['webhook']} webhook"
+                    )
+                else:
+                    await self.bot.lldb.delivery_queue_remove(job['id'])
+            # Try again later
+            except Exception as e:
+                logger.error(
+                    f'Guild ID {guild_id}: error during queued '
+                    f"{job['webhook']} webhook sending: {e}, {type(e)}"
+                )
+                if delivery_retryable(e):
+                    await self.bot.lldb.delivery_queue_retry(
+                        job['id'],
+                        job['attempts'] + 1
+                    )
+                else:
+                    await self.bot.lldb.delivery_queue_remove(job['id'])
+            else:
+                await self.bot.lldb.delivery_queue_remove(job['id'])
+
+        # Queue metrics
+        stats = await self.bot.lldb.delivery_queue_stats()
+        if stats['depth']:
+            logger.info(f'Delivery queue: {stats}')
+
+
+async def setup(bot: LiveLaunchBot):
+    await bot.add_cog(LiveLaunchDelivery(bot))
@@ -1,4 +1,4 @@
-import aiohttp
+import asyncio
 from datetime import datetime, timedelta, timezone
 import discord
 from discord.ext import commands, tasks
@@ -7,13 +7,16 @@ from discord.utils import _bytes_to_base64_data
 from itertools import compress
 import logging
 from operator import itemgetter
-import re
+from os import getenv
 from typing import Any, Literal, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from discord.types import scheduled_event
 
 from bin import (
+    delivery_payload,
+    delivery_retryable,
+    Fanout,
     LaunchLibrary2 as ll2,
     NASATV,
     NotificationCheck,
@@ -52,8 +55,18 @@ class LiveLaunch(commands.Cog):
         self.ytrss = YouTubeRSS()
         # YouTube base url for videos
         self.yt_base_url = 'https://www.youtube.com/watch?v=%s'
-        # Regex check for type checking
-        self.type_check = re.compile('^[0-9]+$')
+        # Concurrent webhook delivery of streams
+        self.stream_fanout = Fanout(
+            'Stream webhooks',
+            workers=int(getenv('WEBHOOK_WORKERS', 16)),
+            rate=float(getenv('WEBHOOK_RATE', 40))
+        )
+        # Concurrent creation and removal of scheduled events
+        self.scheduled_events_fanout = Fanout(
+            'Scheduled events',
+            workers=int(getenv('SCHEDULED_EVENT_WORKERS', 8)),
+            rate=float(getenv('SCHEDULED_EVENT_RATE', 10))
+        )
         # Itemgetter object for getting notification button settings
         self.button_settings = itemgetter(
             'button_sln',
@@ -66,6 +79,12 @@ class LiveLaunch(commands.Cog):
         self.check_ll2.start()
         self.check_rss.start()
 
+    async def cog_unload(self) -> None:
+        """
+        Store the YouTube API caches when unloading.
+        """
+        await self.ytapi.close()
+
     async def send_webhook_message(
         self,
         sending: list[dict[str, int | str | None]]
@@ -92,43 +111,52 @@ class LiveLaunch(commands.Cog):
                     Embed to send for
                     NASA TV streams.
         """
-        async for guild_id, webhook_url in self.bot.lldb.enabled_guilds_webhook_iter():
+        # Agency filters of all guilds
+        agency_filter = await self.bot.lldb.ll2_agencies_filter_index()
 
-            # Fetch the agency filters set by the guild
+        async def deliver(guild: tuple[int, str]) -> None:
+            """
+            Send the streams to a single guild.
+
+            Parameters
+            ----------
+            guild : tuple[int, str]
+                Discord guild ID and webhook URL.
+            """
+            guild_id, webhook_url = guild
+
+            # Check the agency filters set by the guild
             filters = [
-                    await self.bot.lldb.ll2_agencies_filter_check(
-                        guild_id, i['agency_id']
-                    )
-                    if i['agency_id'] is not None
-                    else True
-                    for i in sending
+                agency_filter.check(guild_id, i['agency_id'])
+                for i in sending
             ]
 
-            # Check if the filter is set to include or exclude the agencies
-            if await self.bot.lldb.ll2_agencies_filter_get_include_exclude(guild_id):
-                # Set to include, invert filters
-                filters = [not i for i in filters]
-
-            # Continue when everything is being filtered
+            # Return when everything is being filtered
             if not any(filters):
-                continue
+                return
+
+            # Filtered streams, removed once sent
+            messages = [
+                {
+                    'content': self.yt_base_url % send['yt_vid_id'],
+                    'username': send['channel'],
+                    'avatar_url': send['avatar']
+                }
+                for send in compress(sending, filters)
+            ]
 
             try:
-                # Creating session
-                async with aiohttp.ClientSession() as session:
-                    # Creating webhook
-                    webhook = discord.Webhook.from_url(
-                        webhook_url,
-                        session=session
-                    )
+                # Creating webhook
+                webhook = discord.Webhook.from_url(
+                    webhook_url,
+                    session=self.bot.sessions.session
+                )
 
-                    # Sending streams
-                    for send in compress(sending, filters):
-                        await webhook.send(
-                            self.yt_base_url % send['yt_vid_id'],
-                            username=send['channel'],
-                            avatar_url=send['avatar']
-                        )
+                # Sending streams
+                while messages:
+                    await self.stream_fanout.throttle()
+                    await webhook.send(**messages[0])
+                    messages.pop(0)
 
             # Remove channel and url from the db when either is removed or deleted
             except discord.errors.NotFound:
@@ -147,10 +175,25 @@ class LiveLaunch(commands.Cog):
                     f'Guild ID {guild_id}: error during '
                     f'video webhook sending: {e}, {type(e)}'
                 )
+                # Retry the unsent streams later
+                if delivery_retryable(e):
+                    for message in messages:
+                        await self.bot.lldb.delivery_queue_add(
+                            guild_id,
+                            'video',
+                            delivery_payload(message)
+                        )
+
+        # Deliver to all guilds concurrently
+        await self.stream_fanout.run(
+            self.bot.lldb.enabled_guilds_webhook_iter(),
+            deliver
+        )
 
         # Sending complete, add streams to the database to prevent sending it again
-        for send in sending:
-            await self.bot.lldb.sent_media_add(yt_vid_id=send['yt_vid_id'])
+        await self.bot.lldb.sent_media_add_many(
+            yt_vid_ids=[send['yt_vid_id'] for send in sending]
+        )
 
     async def create_scheduled_event(
         self,
@@ -342,10 +385,7 @@ class LiveLaunch(commands.Cog):
 
         # Downloading image
         if (image_url := check.get('image_url')):
-            async with (
-                aiohttp.ClientSession() as session,
-                session.get(image_url) as resp
-            ):
+            async with self.bot.sessions.session.get(image_url) as resp:
                 # Check status and size (Discord maximum)
                 if (resp.status == 200
                         and resp.content_length
@@ -367,7 +407,8 @@ class LiveLaunch(commands.Cog):
                     pass
                 # Remove scheduled event from the database
                 await self.bot.lldb.scheduled_events_remove(
-                    scheduled_event_id
+                    scheduled_event_id,
+                    guild_id
                 )
 
             # Updating
@@ -408,7 +449,8 @@ class LiveLaunch(commands.Cog):
 
                             # Remove scheduled event from the database
                             await self.bot.lldb.scheduled_events_remove(
-                                scheduled_event_id
+                                scheduled_event_id,
+                                guild_id
                             )
 
                             # Skip updating, event is removed
@@ -470,7 +512,8 @@ class LiveLaunch(commands.Cog):
                 if remove_event:
                     # Remove scheduled event from the database
                     await self.bot.lldb.scheduled_events_remove(
-                        scheduled_event_id
+                        scheduled_event_id,
+                        guild_id
                     )
 
         # Update cache
@@ -522,12 +565,206 @@ class LiveLaunch(commands.Cog):
             if success:
                 # Remove scheduled event from the database
                 await self.bot.lldb.scheduled_events_remove(
-                    scheduled_event_id
+                    scheduled_event_id,
+                    guild_id
                 )
 
         # Return overall success status
         return status
 
+    async def reconcile_scheduled_events(
+        self,
+        upcoming: dict[str, dict[str, Any]]
+    ) -> None:
+        """
+        Create wanted and remove unwanted Discord scheduled
+        events, concurrently across guilds while keeping
+        the order of the operations within a guild.
+
+        Parameters
+        ----------
+        upcoming : dict[str, dict[str, Any]]
+            Upcoming LL2 events and launches by LL2 ID.
+
+        Notes
+        -----
+        Per-guild rate limits are handled by discord.py, the
+        database changes of a guild are written in batches
+        as soon as its operations finished.
+        """
+        # Group the operations per guild
+        guilds: dict[int, list[dict[str, bool | int | str]]] = {}
+        async for row in self.bot.lldb.scheduled_events_reconcile_iter():
+            guilds.setdefault(row['guild_id'], []).append(row)
+        if not guilds:
+            return
+
+        async def download_image(ll2_id: str) -> None:
+            """
+            Download the cover image of an LL2 event.
+
+            Parameters
+            ----------
+            ll2_id : str
+                Launch Library 2 ID.
+            """
+            data = upcoming[ll2_id]
+            if (data.get('image') is not None
+                    or not (image_url := data.get('image_url'))):
+                return
+            try:
+                async with self.bot.sessions.session.get(image_url) as resp:
+                    # Check status and size (Discord maximum)
+                    if (resp.status == 200
+                            and resp.content_length
+                            and resp.content_length <= 10240000):
+                        data['image'] = await resp.read()
+            except Exception as e:
+                logger.warning(
+                    f'LL2 ID {ll2_id}: image download failed: {e}, {type(e)}'
+                )
+
+        # Download the images of the events to create once
+        await asyncio.gather(
+            *(
+                download_image(ll2_id)
+                for ll2_id in {
+                    row['ll2_id']
+                    for rows in guilds.values()
+                    for row in rows
+                    if row['create_remove'] and row['ll2_id'] in upcoming
+                }
+            )
+        )
+
+        async def deliver_rows(
+            guild_id: int,
+            rows: list[dict[str, bool | int | str]],
+            created: list[tuple[int, int, str]],
+            removed: list[tuple[int, int]]
+        ) -> bool:
+            """
+            Run the operations of a single guild in order.
+
+            Parameters
+            ----------
+            guild_id : int
+                Discord guild ID.
+            rows : list[dict[str, bool | int | str]]
+                Operations of the guild.
+            created : list[tuple[int, int, str]]
+                Created scheduled events to store.
+            removed : list[tuple[int, int]]
+                Removed scheduled events to store.
+
+            Returns
+            -------
+            reset : bool
+                Whether the guild kicked the bot or
+                removed the scheduled event permissions.
+            """
+            reset = False
+            for row in rows:
+
+                # Create wanted Launch Library 2 as Discord scheduled events
+                if row['create_remove']:
+                    # Guild turned events off or the event is gone
+                    if reset or row['ll2_id'] not in upcoming:
+                        continue
+
+                    reset_settings = False
+                    try:
+                        # Create Discord scheduled event
+                        await self.scheduled_events_fanout.throttle()
+                        new_event = await self.create_scheduled_event(
+                            guild_id,
+                            **upcoming[row['ll2_id']]
+                        )
+                    except (discord.errors.Forbidden, discord.errors.NotFound):
+                        # When missing access or already removed event
+                        reset_settings = True
+                    except Exception as e:
+                        # Wrong permissions
+                        if getattr(e, 'code', None) == 50013:
+                            reset_settings = True
+                        else:
+                            logger.error(
+                                'Scheduled event creation failed'
+                                f' in iteration: {e} {type(e)}'
+                            )
+                            # Retry during the next iteration
+                            self.bot.lldb.scheduled_events_mark_dirty(
+                                guild_id
+                            )
+                    else:
+                        # Add scheduled event to the database
+                        created.append(
+                            (new_event['id'], guild_id, row['ll2_id'])
+                        )
+                    # Guild has kicked or removed permissions, turn events off
+                    if reset_settings:
+                        reset = True
+
+                # Remove unwanted Discord scheduled events
+                else:
+                    try:
+                        # Remove the scheduled event from Discord
+                        await self.scheduled_events_fanout.throttle()
+                        await self.bot.http.delete_scheduled_event(
+                            guild_id,
+                            row['scheduled_event_id']
+                        )
+                    except (discord.errors.Forbidden, discord.errors.NotFound):
+                        # When missing access or already removed event
+                        pass
+                    except Exception as e:
+                        # Wrong permissions
+                        if getattr(e, 'code', None) != 50013:
+                            logger.error(
+                                'Scheduled event removal failed'
+                                f' in iteration: {e} {type(e)}'
+                            )
+                            # Retry during the next iteration
+                            self.bot.lldb.scheduled_events_mark_dirty(
+                                guild_id
+                            )
+                            continue
+                    # Remove scheduled event from the database
+                    removed.append((row['scheduled_event_id'], guild_id))
+            return reset
+
+        async def deliver(
+            guild: tuple[int, list[dict[str, bool | int | str]]]
+        ) -> None:
+            """
+            Create and remove the scheduled events of a single guild.
+
+            Parameters
+            ----------
+            guild : tuple[int, list[dict[str, bool | int | str]]]
+                Discord guild ID and its operations.
+            """
+            guild_id, rows = guild
+            # Results to store in the database
+            created: list[tuple[int, int, str]] = []
+            removed: list[tuple[int, int]] = []
+            reset = False
+            try:
+                reset = await deliver_rows(guild_id, rows, created, removed)
+            finally:
+                # Store the results of the guild, even after a failure
+                await self.bot.lldb.scheduled_events_add_many(created)
+                await self.bot.lldb.scheduled_events_remove_many(removed)
+            # Set amount of events to 0 when the guild removed permissions
+            if reset:
+                await self.bot.lldb.enabled_guilds_edit(
+                    guild_id,
+                    scheduled_events=0
+                )
+
+        # Process all guilds concurrently
+        await self.scheduled_events_fanout.run(guilds.items(), deliver)
+
     async def send_notification(
         self,
         notification_type : int,
@@ -558,17 +795,19 @@ class LiveLaunch(commands.Cog):
             Previous start datetime.
         """
         async def send(
-            embed: discord.Embed,
+            embeds: dict[tuple[bool, bool], discord.Embed],
             buttons: dict[str, Button[View]],
             kwargs: dict[str, bool | int | str]
         ) -> None:
             """
-            Send notifications depending on the type.
+            Send notifications to all guilds, each
+            guild gets the embed of its changes.
 
             Parameters
             ----------
-            embed : discord.Embed
-                Embed object to send.
+            embeds : dict[tuple[bool, bool], discord.Embed]
+                Embed objects to send per
+                T-0 and status change.
             buttons : dict[str, Button[View]]
                 Buttons to external sites:
                     ` button_fc `: FC button.
@@ -582,6 +821,12 @@ class LiveLaunch(commands.Cog):
                 guild_id = notification['guild_id']
                 scheduled_event_id = notification['scheduled_event_id']
 
+                # Embed of the changes enabled by the guild
+                embed = embeds[
+                    notification['t0_change'],
+                    notification['status_change']
+                ]
+
                 # Scheduled event
                 message = {}
                 if scheduled_event_id:
@@ -590,29 +835,31 @@ class LiveLaunch(commands.Cog):
                         scheduled_event_id
                     )
 
-                # Add correct buttons
+                # Add correct buttons, one view per button combination
                 if any(button_settings := self.button_settings(notification)):
-                    message['view'] = View()
-                    for key in compress(buttons, button_settings):
-                        message['view'].add_item(buttons[key])
+                    if (view := views.get(button_settings)) is None:
+                        view = views[button_settings] = View(timeout=None)
+                        for key in compress(buttons, button_settings):
+                            view.add_item(buttons[key])
+                    message['view'] = view
+
+                # Message of the guild
+                message |= {
+                    'embed': embed,
+                    'username': agency,
+                    'avatar_url': logo_url
+                }
 
                 try:
-                    # Creating session
-                    async with aiohttp.ClientSession() as session:
-                        # Creating webhook with the client to be able to send buttons
-                        webhook = discord.Webhook.from_url(
-                            notification['notification_webhook_url'],
-                            client=self.bot,
-                            session=session
-                        )
+                    # Creating webhook with the client to be able to send buttons
+                    webhook = discord.Webhook.from_url(
+                        notification['notification_webhook_url'],
+                        client=self.bot,
+                        session=self.bot.sessions.session
+                    )
 
-                        # Sending notification
-                        await webhook.send(
-                            **message,
-                            embed=embed,
-                            username=agency,
-                            avatar_url=logo_url
-                        )
+                    # Sending notification
+                    await webhook.send(**message)
 
                 # Remove channel and url from the db when either is removed or deleted
                 except discord.errors.NotFound:
@@ -631,6 +878,16 @@ class LiveLaunch(commands.Cog):
                         f'Guild ID: {guild_id}: error during '
                         f'notification webhook sending: {e}, {type(e)}'
                     )
+                    # Retry later
+                    if delivery_retryable(e):
+                        await self.bot.lldb.delivery_queue_add(
+                            guild_id,
+                            'notification',
+                            delivery_payload(message)
+                        )
+
+        # Views shared by guilds with the same button settings
+        views: dict[tuple[bool, bool, bool], View] = {}
 
         # Kwargs dict and get status
         kwargs: dict[str, bool | int | str] = {'ll2_id': ll2_id}
@@ -645,14 +902,13 @@ class LiveLaunch(commands.Cog):
             url = ll2.no_stream
 
         # Select the correct G4L and SLN base URL
-        if self.type_check.match(ll2_id):
+        if data['is_event']:
             g4l_url = ll2.g4l_event_url
             sln_url = ll2.sln_event_url
             kwargs['event'] = True
         else:
             g4l_url = ll2.g4l_launch_url
             sln_url = ll2.sln_launch_url
-            kwargs['launch'] = True
 
         # FC, G4L and SLN buttons for the event
         buttons: dict[str, Button[View]] = {}
@@ -701,19 +957,18 @@ class LiveLaunch(commands.Cog):
             text='LiveLaunch Notifications, powered by LL2'
         )
 
+        # Embeds per T-0 and status change
+        embeds: dict[tuple[bool, bool], discord.Embed] = {}
+
         # Status change
         if notification_type != 1:
             # Reference or shallow copy
             status_embed = embed.copy() if notification_type == 2 else embed
             # Set description
             status_embed.description = f'**New status:** {ll2.status_names[status]}\n{url}'
-
-            # Send notifications
-            if notification_type == 0:
-                await send(status_embed, buttons, {'ll2_id': ll2_id, 'status': status})
-            else:
-                # Add status to the kwargs
-                kwargs['status'] = status
+            embeds[False, True] = status_embed
+            # Add status to the kwargs
+            kwargs['status'] = status
 
         # T-0 change
         if notification_type != 0:
@@ -723,10 +978,9 @@ class LiveLaunch(commands.Cog):
             t0_embed.description = f'**T-0** changed from <t:{int(cached_start.timestamp())}:F>' \
                 f" to <t:{int(data['start'].timestamp())}:F>\n" + \
                 (f'**Status:** {ll2.status_names[status]}\n{url}' if status else url)
-
-            # Send notifications
-            if notification_type == 1:
-                await send(t0_embed, buttons, kwargs)
+            embeds[True, False] = t0_embed
+            # Add T-0 change to the kwargs
+            kwargs['t0_change'] = True
 
         # Both T-0 change and status change
         if notification_type == 2:
@@ -734,18 +988,10 @@ class LiveLaunch(commands.Cog):
             embed.description = f'**T-0** changed from <t:{int(cached_start.timestamp())}:F>' \
                 f" to <t:{int(data['start'].timestamp())}:F>\n" + \
                 (f'**New status:** {ll2.status_names[status]}\n{url}' if status else url)
+            embeds[True, True] = embed
 
-            # Send to servers with both T-0 and status change
-            await send(embed, buttons, kwargs)
-
-            # Send to servers with status change, but not T-0 change
-            kwargs['no_t0'] = True
-            await send(status_embed, buttons, kwargs)
-
-            # Send to servers with T-0 change, but not status change
-            kwargs.pop('no_t0')
-            kwargs['no_status'] = True
-            await send(t0_embed, buttons, kwargs)
+        # Send to all guilds in a single pass
+        await send(embeds, buttons, kwargs)
 
     @tasks.loop(hours=1)
     async def update_variables(self):
@@ -903,89 +1149,13 @@ class LiveLaunch(commands.Cog):
                 **upcoming[ll2_id]
             )
 
-        # Asking the database for Guilds that need new events
-        async for row in self.bot.lldb.scheduled_events_remove_create_iter():
-
-            # Create wanted Launch Library 2 as Discord scheduled events
-            if row['create_remove']:
-
-                # Downloading image
-                if (upcoming[row['ll2_id']].get('image') is None
-                        and (image_url := upcoming[row['ll2_id']].get('image_url'))):
-                    async with (
-                        aiohttp.ClientSession() as session,
-                        session.get(image_url) as resp
-                    ):
-                        # Check status and size (Discord maximum)
-                        if (resp.status == 200
-                                and resp.content_length
-                                and resp.content_length <= 10240000):
-                            upcoming[row['ll2_id']]['image'] = await resp.read()
-
-                reset_settings = False
-                try:
-                    # Create Discord scheduled event
-                    new_event = await self.create_scheduled_event(
-                        row['guild_id'],
-                        **upcoming[row['ll2_id']]
-                    )
-                except (discord.errors.Forbidden, discord.errors.NotFound):
-                    # When missing access or already removed event
-                    reset_settings = True
-                except Exception as e:
-                    # Wrong permissions
-                    if getattr(e, 'code', None) == 50013:
-                        reset_settings = True
-                    else:
-                        logger.error(
-                            'Scheduled event creation failed'
-                            f' in iteration: {e} {type(e)}'
-                        )
-                else:
-                    # Add scheduled event to the database
-                    await self.bot.lldb.scheduled_events_add(
-                        new_event['id'],
-                        row['guild_id'],
-                        row['ll2_id']
-                    )
-                # Guild has kicked or removed permissions, turn events off
-                if reset_settings:
-                    # Set amount of events to 0
-                    await self.bot.lldb.enabled_guilds_edit(
-                        row['guild_id'],
-                        scheduled_events=0
-                    )
-
-            # Remove unwanted Discord scheduled events
-            else:
-                removed = True
-                try:
-                    # Remove the scheduled event from Discord
-                    await self.bot.http.delete_scheduled_event(
-                        row['guild_id'],
-                        row['scheduled_event_id']
-                    )
-                except (discord.errors.Forbidden, discord.errors.NotFound):
-                    # When missing access or already removed event
-                    pass
-                except Exception as e:
-                    # Wrong permissions
-                    if getattr(e, 'code', None) != 50013:
-                        removed = False
-                        logger.error(
-                            'Scheduled event removal failed'
-                            f' in iteration: {e} {type(e)}'
-                        )
-                if removed:
-                    # Remove scheduled event from the database
-                    await self.bot.lldb.scheduled_events_remove(
-                        row['scheduled_event_id']
-                    )
+        # Create and remove the Discord scheduled events of changed Guilds
+        await self.reconcile_scheduled_events(upcoming)
 
         #### Sending streams using webhooks ####
 
         # Go through upcoming streams for webhook sending
-        sending: list[dict[str, int | str | None]] = []
+        candidates: dict[str, int | None] = {}
         for ll2_id, data in upcoming.items():
             # Add stream if it is within 1 hour to the sending list
             now = datetime.now(timezone.utc)
@@ -993,33 +1163,39 @@ class LiveLaunch(commands.Cog):
                 # Check if the stream is on YouTube and not a NASA TV stream
                 yt_vid_id = youtube_strip_video_id(data['url'])
                 if yt_vid_id and self.yt_base_url % yt_vid_id not in self.nasatv:
-                    # Only send streams that aren't sent already
-                    if not await self.bot.lldb.sent_media_exists(
-                        yt_vid_id=yt_vid_id
-                    ):
-
-                        # Get YouTube channel
-                        channel = self.ytapi.get_channel_from_video(yt_vid_id)
-                        if channel is None:
-                            # Can't find the channel, continue
-                            continue
-                        # Get YouTube channel name and avatar
-                        channel_info = self.ytapi.get_channel_thumbtitle(
-                            channel
-                        )
-                        if channel_info is None:
-                            continue
-                        thumb, title = channel_info
-
-                        # Adding to the sending list
-                        sending.append(
-                            {
-                                'avatar': thumb,
-                                'channel': title,
-                                'yt_vid_id': yt_vid_id,
-                                'agency_id': data.get('agency_id')
-                            }
-                        )
+                    candidates[yt_vid_id] = data.get('agency_id')
+
+        # Only send streams that aren't sent already
+        for yt_vid_id in await self.bot.lldb.sent_media_exists_many(
+            yt_vid_ids=candidates
+        ):
+            del candidates[yt_vid_id]
+
+        sending: list[dict[str, int | str | None]] = []
+        if candidates:
+            # Get YouTube channels of all videos in one batch
+            channels = await self.ytapi.get_channels_from_videos(candidates)
+            # Get YouTube channel names and avatars in one batch
+            channel_info = await self.ytapi.get_channel_thumbtitles(
+                channels.values()
+            )
+
+            for yt_vid_id, agency_id in candidates.items():
+                # Can't find the channel, continue
+                if (channel := channels.get(yt_vid_id)) is None \
+                        or channel not in channel_info:
+                    continue
+                thumb, title = channel_info[channel]
+
+                # Adding to the sending list
+                sending.append(
+                    {
+                        'avatar': thumb,
+                        'channel': title,
+                        'yt_vid_id': yt_vid_id,
+                        'agency_id': agency_id
+                    }
+                )
 
         if sending:
             # Send streams
@@ -1040,34 +1216,43 @@ class LiveLaunch(commands.Cog):
         # Check if there are any streams
         streams = await self.ytrss.request()
 
+        # Only send streams that aren't sent already
+        sent = await self.bot.lldb.sent_media_exists_many(
+            yt_vid_ids=[
+                yt_vid_id
+                for channel_streams in streams.values()
+                for yt_vid_id in channel_streams
+            ]
+        )
+
         # Iterate over dictionary to see which streams needs to be sent
-        for channel in streams:
-            # Check if the channel has any streams
-            if streams[channel]:
-                # Iterate through the streams of a channel
-                for yt_vid_id in streams[channel]:
-                    # Only send streams that aren't sent already
-                    if not await self.bot.lldb.sent_media_exists(
-                        yt_vid_id=yt_vid_id
-                    ):
-
-                        # Get YouTube channel name and avatar
-                        channel_info = self.ytapi.get_channel_thumbtitle(
-                            channel
-                        )
-                        if channel_info is None:
-                            continue
-                        thumb, title = channel_info
-
-                        # Adding to the sending list
-                        sending.append(
-                            {
-                                'avatar': thumb,
-                                'channel': title,
-                                'yt_vid_id': yt_vid_id,
-                                'agency_id': self.ytrss.agency_ids.get(channel)
-                            }
-                        )
+        unsent: list[tuple[str, str]] = [
+            (channel, yt_vid_id)
+            for channel, channel_streams in streams.items()
+            for yt_vid_id in channel_streams
+            if yt_vid_id not in sent
+        ]
+
+        if unsent:
+            # Get YouTube channel names and avatars in one batch
+            channel_info = await self.ytapi.get_channel_thumbtitles(
+                channel for channel, _ in unsent
+            )
+
+            for channel, yt_vid_id in unsent:
+                if channel not in channel_info:
+                    continue
+                thumb, title = channel_info[channel]
+
+                # Adding to the sending list
+                sending.append(
+                    {
+                        'avatar': thumb,
+                        'channel': title,
+                        'yt_vid_id': yt_vid_id,
+                        'agency_id': self.ytrss.agency_ids.get(channel)
+                    }
+                )
 
         if sending:
             # Send streams
@@ -1,10 +1,13 @@
-import aiohttp
 import discord
 from discord.ext import commands, tasks
 from itertools import compress
 import logging
 
-from bin import SpaceflightNewsAPI
+from bin import (
+    delivery_payload,
+    delivery_retryable,
+    SpaceflightNewsAPI
+)
 from main import LiveLaunchBot
 
 logger = logging.getLogger(__name__)
@@ -29,21 +32,20 @@ class LiveLaunchNewsTasks(commands.Cog):
         # Get news articles
         news = await self.snapi()
 
-        # Check if article is already sent, then generate embeds
+        # Check which articles are already sent
+        sent = await self.bot.lldb.sent_media_exists_many(
+            snapi_ids=[article['id'] for article in news]
+        )
+
+        # Generate embeds for the new articles
         new_news = []
         for article in news:
-            if await self.bot.lldb.sent_media_exists(snapi_id=article['id']):
+            if article['id'] in sent:
                 continue
 
-            # Add `snapi_id` to the db to prevent resending
-            await self.bot.lldb.sent_media_add(snapi_id=article['id'])
-
             # Add the news site to the db if needed
             await self.bot.lldb.news_sites_add(article['news_site'])
 
-            # Get the news site logo
-            article['logo_url'] = await self.bot.lldb.news_sites_get_logo(article['news_site'])
-
             # Create embed object
             embed = discord.Embed(
                 color=0x00E8FF,
@@ -70,40 +72,57 @@ class LiveLaunchNewsTasks(commands.Cog):
         if not new_news:
             return
 
+        # Add `snapi_id` to the db to prevent resending
+        await self.bot.lldb.sent_media_add_many(
+            snapi_ids=[article['id'] for article in new_news]
+        )
+
+        # Get the news site IDs and logos
+        news_sites = await self.bot.lldb.news_sites_get(
+            article['news_site'] for article in new_news
+        )
+        for article in new_news:
+            article['news_site_id'], article['logo_url'] = news_sites.get(
+                article['news_site'], (None, None)
+            )
+
+        # News site filters of all guilds
+        news_filter = await self.bot.lldb.news_filter_index()
+
         # Sending
         async for guild_id, webhook_url in self.bot.lldb.enabled_guilds_news_iter():
 
-            # Fetch the news site filters set by the guild
+            # Check the news site filters set by the guild
             filters = [
-                await self.bot.lldb.news_filter_check(guild_id, i['news_site'])
+                news_filter.check(guild_id, i['news_site_id'])
                 for i in new_news
             ]
 
-            # Check if the filter is set to include or exclude the news sites
-            if await self.bot.lldb.news_filter_get_include_exclude(guild_id):
-                # Set to include, invert filters
-                filters = [not i for i in filters]
-
             # Continue when everything is being filtered
             if not any(filters):
                 continue
 
+            # Filtered articles, removed once sent
+            messages = [
+                {
+                    'embed': article['embed'],
+                    'username': article['news_site'],
+                    'avatar_url': article['logo_url']
+                }
+                for article in compress(new_news, filters)
+            ]
+
             try:
-                # Creating session
-                async with aiohttp.ClientSession() as session:
-                    # Creating webhook
-                    webhook = discord.Webhook.from_url(
-                        webhook_url,
-                        session=session
-                    )
-
-                    # Sending filtered articles
-                    for article in compress(new_news, filters):
-                        await webhook.send(
-                            embed=article['embed'],
-                            username=article['news_site'],
-                            avatar_url=article['logo_url']
-                        )
+                # Creating webhook
+                webhook = discord.Webhook.from_url(
+                    webhook_url,
+                    session=self.bot.sessions.session
+                )
+
+                # Sending filtered articles
+                while messages:
+                    await webhook.send(**messages[0])
+                    messages.pop(0)
 
             # Remove channel and url from the db when either is removed or deleted
             except discord.errors.NotFound:
@@ -122,6 +141,14 @@ class LiveLaunchNewsTasks(commands.Cog):
                     f'Guild ID {guild_id}: error during '
                     f'news webhook sending: {e}, {type(e)}'
                 )
+                # Retry the unsent articles later
+                if delivery_retryable(e):
+                    for message in messages:
+                        await self.bot.lldb.delivery_queue_add(
+                            guild_id,
+                            'news',
+                            delivery_payload(message)
+                        )
 
 
 async def setup(bot: LiveLaunchBot):
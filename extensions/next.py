@@ -5,7 +5,6 @@ from discord.app_commands import AppCommandError, Range
 from discord.ext import commands
 from discord.ui import Button, View
 import logging
-import re
 from typing import Literal
 
 from bin import LaunchLibrary2 as ll2
@@ -19,8 +18,6 @@ class LiveLaunchNext(commands.Cog):
     """
     def __init__(self, bot: LiveLaunchBot):
         self.bot = bot
-        # Regex check for type checking
-        self.type_check = re.compile('^[0-9]+$')
         # Scheduled event base url
         self.se_url = 'https://discord.com/events/%s/%s'
 
@@ -28,7 +25,8 @@ class LiveLaunchNext(commands.Cog):
         self,
         button_settings: dict[str, bool],
         ll2_id: str,
-        slug: str
+        slug: str,
+        is_event: bool
     ) -> View | None:
         """
         Create buttons if required.
@@ -41,6 +39,9 @@ class LiveLaunchNext(commands.Cog):
             Launch Library 2 ID.
         slug : str
             Slug of the event.
+        is_event : bool
+            Whether it is an event
+            instead of a launch.
 
         Returns
         -------
@@ -48,7 +49,7 @@ class LiveLaunchNext(commands.Cog):
             Created buttons.
         """
         # Select the correct G4L and SLN base URL
-        if self.type_check.match(ll2_id):
+        if is_event:
             g4l_url = ll2.g4l_event_url
             sln_url = ll2.sln_event_url
         else:
@@ -275,7 +276,8 @@ class LiveLaunchNext(commands.Cog):
             buttons = await self.create_buttons(
                 button_settings,
                 ll2_id,
-                items[ll2_id]['slug']
+                items[ll2_id]['slug'],
+                items[ll2_id]['is_event']
             )
             if buttons is not None:
                 message['view'] = buttons
@@ -1,12 +1,15 @@
-import aiohttp
+from datetime import datetime
 import discord
 from discord.ext import commands, tasks
 from discord.ui import Button, View
 import logging
+from operator import itemgetter
 from typing import Literal
 
 from bin import (
     convert_minutes,
+    delivery_payload,
+    delivery_retryable,
     LaunchLibrary2 as ll2
 )
 from main import LiveLaunchBot
@@ -21,95 +24,145 @@ class LiveLaunchNotificationsTasks(commands.Cog):
         self.bot = bot
         # Scheduled event base url
         self.se_url = 'https://discord.com/events/%s/%s'
+        # Itemgetter object for getting notification button settings
+        self.button_settings = itemgetter(
+            'button_sln',
+            'button_g4l',
+            'button_fc'
+        )
         # Start loops
         self.countdown_notifications.start()
 
-    @tasks.loop(minutes=1)
+    def countdown_payload(
+        self,
+        notification: dict[str, bool | datetime | int | str]
+    ) -> dict[str, discord.Embed | View]:
+        """
+        Create the embed and buttons of a countdown
+        notification, shared by all guilds with the
+        same launch or event, minutes and buttons.
+
+        Parameters
+        ----------
+        notification : dict[
+            str, bool and datetime and int and str
+        ]
+            Countdown notification row.
+
+        Returns
+        -------
+        payload : dict[str, discord.Embed | View]
+            Embed and optional view with buttons.
+        """
+        status = notification['status']
+
+        # Only enable video URL when available
+        title_url: dict[Literal['url'], str] = {}
+        if (url := notification['url']):
+            title_url['url'] = url
+            url = f'[Stream]({url})'
+        else:
+            url = ll2.no_stream
+
+        # Select the correct G4L and SLN base URL
+        if notification['type']:
+            g4l_url = ll2.g4l_event_url
+            sln_url = ll2.sln_event_url
+        else:
+            g4l_url = ll2.g4l_launch_url
+            sln_url = ll2.sln_launch_url
+
+        # Payload dict
+        payload = {}
+
+        # FC, G4L and SLN buttons for the event
+        buttons: list[Button[View]] = []
+        # Add SLN button
+        if notification['button_sln']:
+            buttons.append(
+                Button(
+                    label=ll2.sln_name,
+                    style=discord.ButtonStyle.link,
+                    emoji=ll2.sln_emoji,
+                    url=sln_url % notification['slug']
+                )
+            )
+        # Add G4L button
+        if notification['button_g4l']:
+            buttons.append(
+                Button(
+                    label=ll2.g4l_name,
+                    style=discord.ButtonStyle.link,
+                    emoji=ll2.g4l_emoji,
+                    url=g4l_url % notification['ll2_id']
+                )
+            )
+        # Add FC button
+        if notification['button_fc']:
+            buttons.append(
+                Button(
+                    label=ll2.fc_name,
+                    style=discord.ButtonStyle.link,
+                    emoji=ll2.fc_emoji,
+                    url=ll2.fc_url % notification['ll2_id']
+                )
+            )
+        # Add to the payload
+        if buttons:
+            payload['view'] = View(timeout=None)
+            for i in buttons:
+                payload['view'].add_item(i)
+
+        # Creating embed
+        embed = discord.Embed(
+            color=ll2.status_colours.get(status, 0xFFFF00),
+            description=f"**T-{convert_minutes(notification['minutes'])}**\n" +
+                (f'**Status:** {ll2.status_names[status]}\n{url}' if status else url),
+            timestamp=notification['start'],
+            title=notification['name'],
+            **title_url
+        )
+        # Set thumbnail
+        if notification['image_url']:
+            embed.set_thumbnail(
+                url=notification['image_url']
+            )
+        # Set footer
+        embed.set_footer(
+            text='LiveLaunch Notifications, powered by LL2'
+        )
+        payload['embed'] = embed
+        return payload
+
+    @tasks.loop(seconds=1)
     async def countdown_notifications(self):
         """
         Discord task for sending
         countdown notifications.
         """
+        # Payloads per launch or event, minutes and button settings
+        payloads: dict[
+            tuple[str, int, bool, bool, bool],
+            dict[str, discord.Embed | View]
+        ] = {}
+
         async for notification in self.bot.lldb.notification_countdown_iter():
             guild_id = notification['guild_id']
-            status = notification['status']
-
-            # Only enable video URL when available
-            title_url: dict[Literal['url'], str] = {}
-            if (url := notification['url']):
-                title_url['url'] = url
-                url = f'[Stream]({url})'
-            else:
-                url = ll2.no_stream
-
-            # Select the correct G4L and SLN base URL
-            if notification['type']:
-                g4l_url = ll2.g4l_event_url
-                sln_url = ll2.sln_event_url
-            else:
-                g4l_url = ll2.g4l_launch_url
-                sln_url = ll2.sln_launch_url
 
-            # Message dict
-            message = {}
-
-            # FC, G4L and SLN buttons for the event
-            buttons: list[Button[View]] = []
-            # Add SLN button
-            if notification['button_sln']:
-                buttons.append(
-                    Button(
-                        label=ll2.sln_name,
-                        style=discord.ButtonStyle.link,
-                        emoji=ll2.sln_emoji,
-                        url=sln_url % notification['slug']
-                    )
-                )
-            # Add G4L button
-            if notification['button_g4l']:
-                buttons.append(
-                    Button(
-                        label=ll2.g4l_name,
-                        style=discord.ButtonStyle.link,
-                        emoji=ll2.g4l_emoji,
-                        url=g4l_url % notification['ll2_id']
-                    )
-                )
-            # Add FC button
-            if notification['button_fc']:
-                buttons.append(
-                    Button(
-                        label=ll2.fc_name,
-                        style=discord.ButtonStyle.link,
-                        emoji=ll2.fc_emoji,
-                        url=ll2.fc_url % notification['ll2_id']
-                    )
-                )
-            # Add to the message
-            if buttons:
-                message['view'] = View()
-                for i in buttons:
-                    message['view'].add_item(i)
-
-            # Creating embed
-            embed = discord.Embed(
-                color=ll2.status_colours.get(status, 0xFFFF00),
-                description=f"**T-{convert_minutes(notification['minutes'])}**\n" +
-                    (f'**Status:** {ll2.status_names[status]}\n{url}' if status else url),
-                timestamp=notification['start'],
-                title=notification['name'],
-                **title_url
+            # Create the payload once
+            key = (
+                notification['ll2_id'],
+                notification['minutes'],
+                *self.button_settings(notification)
             )
-            # Set thumbnail
-            if notification['image_url']:
-                embed.set_thumbnail(
-                    url=notification['image_url']
-                )
-            # Set footer
-            embed.set_footer(
-                text='LiveLaunch Notifications, powered by LL2'
-            )
-            message['embed'] = embed
+            if (payload := payloads.get(key)) is None:
+                payload = payloads[key] = self.countdown_payload(notification)
+
+            # Message dict
+            message = payload | {
+                'username': notification['agency'],
+                'avatar_url': notification['logo_url']
+            }
 
             # Scheduled event
             if notification['scheduled_event_id']:
@@ -119,21 +172,15 @@ class LiveLaunchNotificationsTasks(commands.Cog):
                 )
 
             try:
-                # Creating session
-                async with aiohttp.ClientSession() as session:
-                    # Creating webhook with the client to be able to send buttons
-                    webhook = discord.Webhook.from_url(
-                        notification['notification_webhook_url'],
-                        client=self.bot,
-                        session=session
-                    )
+                # Creating webhook with the client to be able to send buttons
+                webhook = discord.Webhook.from_url(
+                    notification['notification_webhook_url'],
+                    client=self.bot,
+                    session=self.bot.sessions.session
+                )
 
-                    # Sending notification
-                    await webhook.send(
-                        **message,
-                        username=notification['agency'],
-                        avatar_url=notification['logo_url']
-                    )
+                # Sending notification
+                await webhook.send(**message)
 
             # Remove channel and url from the db when either is removed or deleted
             except discord.errors.NotFound:
@@ -152,6 +199,13 @@ class LiveLaunchNotificationsTasks(commands.Cog):
                     f'Guild ID {guild_id}: error during '
                     f'notification webhook sending: {e}, {type(e)}'
                 )
+                # Retry later
+                if delivery_retryable(e):
+                    await self.bot.lldb.delivery_queue_add(
+                        guild_id,
+                        'notification',
+                        delivery_payload(message)
+                    )
 
 
 async def setup(bot: LiveLaunchBot):
@@ -8,7 +8,7 @@ from pathlib import Path
 from typing import override
 import warnings
 
-from bin import Database
+from bin import Database, session_manager
 
 class LiveLaunchBot(commands.Bot):
     """
@@ -24,6 +24,9 @@ class LiveLaunchBot(commands.Bot):
         # Database object
         self.lldb = Database()
 
+        # Shared HTTP session for all outbound requests
+        self.sessions = session_manager
+
         # Extensions to load with database first as others depend on it
         self.initial_extensions  = [
             'extensions.database',
@@ -37,7 +40,8 @@ class LiveLaunchBot(commands.Bot):
     @override
     def run(self, token: str) -> None:  # type: ignore
         """
-        Connect to the database and start the bot.
+        Connect to the database and start the bot,
+        the shared HTTP session is closed on exit.
 
         Parameters
         ----------
@@ -45,7 +49,7 @@ class LiveLaunchBot(commands.Bot):
             The authentication token.
         """
         async def runner() -> None:
-            async with self.lldb, self:
+            async with self.lldb, self.sessions, self:
                 await self.lldb.start()
                 await self.start(token, reconnect=True)
 
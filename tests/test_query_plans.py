@@ -0,0 +1,368 @@
+"""
+Query plan regression tests of the hot database queries.
+
+The queries are captured from the database methods and explained
+against a seeded MySQL database, a test fails when a query does a
+full table scan instead of using its index.
+
+Notes
+-----
+Configure the database with the `TEST_DB_HOST`, `TEST_DB_USER`,
+`TEST_DB_PWD` and `TEST_DB_NAME` environment variables, the tests
+are skipped when `TEST_DB_HOST` is not set. The database named by
+`TEST_DB_NAME` (default: `LiveLaunchTest`) is dropped and recreated.
+
+Examples
+--------
+>>> TEST_DB_HOST=localhost python -m unittest discover tests
+"""
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from os import environ, getenv
+from typing import Any
+import unittest
+
+try:
+    import aiomysql
+except ImportError:
+    aiomysql = None
+
+TEST_DB_HOST = getenv('TEST_DB_HOST')
+TEST_DB_USER = getenv('TEST_DB_USER', 'root')
+TEST_DB_PWD = getenv('TEST_DB_PWD')
+TEST_DB_NAME = getenv('TEST_DB_NAME', 'LiveLaunchTest')
+
+# Seeded table sizes
+AGENCIES = 20
+EVENTS = 5000
+GUILDS = 1000
+EVENTS_PER_GUILD = 5
+# Every n-th guild has notifications enabled
+NOTIFICATION_GUILDS = 10
+COUNTDOWN_MINUTES = (10, 60)
+
+
+class _RecordingCursor:
+    """
+    Cursor that records the executed queries
+    instead of sending them to the database.
+    """
+    def __init__(
+        self,
+        queries: list[tuple[str, Any]],
+        dictionary: bool
+    ) -> None:
+        self.queries = queries
+        self.dictionary = dictionary
+        self.rowcount = 0
+
+    async def __aenter__(self) -> '_RecordingCursor':
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        pass
+
+    def __aiter__(self) -> '_RecordingCursor':
+        return self
+
+    async def __anext__(self) -> Any:
+        raise StopAsyncIteration
+
+    async def execute(self, query: str, args: Any = None) -> None:
+        self.queries.append((query, args))
+
+    async def fetchall(self) -> list[Any]:
+        return []
+
+    async def fetchone(self) -> dict[str, None] | tuple[None]:
+        if self.dictionary:
+            return defaultdict(lambda: None)
+        return (None,)
+
+
+class _RecordingPool:
+    """
+    Pool handing out recording cursors.
+    """
+    def __init__(self) -> None:
+        self.queries: list[tuple[str, Any]] = []
+
+    def acquire(self) -> '_RecordingPool':
+        return self
+
+    async def __aenter__(self) -> '_RecordingPool':
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        pass
+
+    def cursor(self, *args: Any) -> _RecordingCursor:
+        return _RecordingCursor(self.queries, bool(args))
+
+
+@unittest.skipIf(aiomysql is None, 'aiomysql is not installed')
+@unittest.skipIf(TEST_DB_HOST is None, 'TEST_DB_HOST is not set')
+class TestQueryPlans(unittest.IsolatedAsyncioTestCase):
+    """
+    EXPLAIN the hot queries against a seeded database.
+    """
+    async def asyncSetUp(self) -> None:
+        from bin import Database
+
+        # Recreate the test database
+        con = await aiomysql.connect(
+            host=TEST_DB_HOST,
+            user=TEST_DB_USER,
+            password=TEST_DB_PWD,
+            autocommit=True
+        )
+        async with con.cursor() as cur:
+            await cur.execute(f'DROP DATABASE IF EXISTS {TEST_DB_NAME}')
+            await cur.execute(f'CREATE DATABASE {TEST_DB_NAME}')
+        con.close()
+
+        # Create the schema
+        environ['DB_PWD'] = TEST_DB_PWD or ''
+        self.db = Database()
+        self.db._host = TEST_DB_HOST
+        self.db._user = TEST_DB_USER
+        self.db._database = TEST_DB_NAME
+        await self.db.start()
+        self.pool = self.db.pool
+        await self.seed()
+
+    async def asyncTearDown(self) -> None:
+        self.pool.close()
+        await self.pool.wait_closed()
+
+    async def seed(self) -> None:
+        """
+        Fill the tables with mostly past LL2
+        events and guilds with scheduled events.
+        """
+        now = datetime.now(timezone.utc).replace(microsecond=0, tzinfo=None)
+        first = now - timedelta(days=300)
+        events = [
+            (
+                f'{i:036d}',
+                i % AGENCIES,
+                f'Event {i}',
+                i % 9 + 1,
+                first + timedelta(hours=1.5 * i),
+                first + timedelta(hours=1.5 * i + 1),
+                f'event-{i}',
+                int(i % 5 == 0)
+            )
+            for i in range(EVENTS)
+        ]
+        upcoming = [event[0] for event in events if event[4] > now]
+        self.ll2_id = upcoming[0]
+        self.now = now
+        notification_guilds = range(1, GUILDS + 1, NOTIFICATION_GUILDS)
+        async with self.pool.acquire() as con, con.cursor() as cur:
+            await cur.executemany(
+                'INSERT INTO ll2_agencies (agency_id, name) VALUES (%s, %s)',
+                [(i, f'Agency {i}') for i in range(AGENCIES)]
+            )
+            await cur.executemany(
+                """
+                INSERT INTO ll2_events
+                (ll2_id, agency_id, name, status, start, end, slug, is_event)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+                """,
+                events
+            )
+            await cur.executemany(
+                """
+                INSERT INTO enabled_guilds
+                (guild_id, scheduled_events, notification_webhook_url)
+                VALUES (%s, %s, %s)
+                """,
+                [
+                    (
+                        guild_id,
+                        EVENTS_PER_GUILD,
+                        f'https://webhook/{guild_id}'
+                        if guild_id in notification_guilds else None
+                    )
+                    for guild_id in range(1, GUILDS + 1)
+                ]
+            )
+            await cur.executemany(
+                'INSERT INTO notification_countdown VALUES (%s, %s)',
+                [
+                    (guild_id, minutes)
+                    for guild_id in notification_guilds
+                    for minutes in COUNTDOWN_MINUTES
+                ]
+            )
+            await cur.executemany(
+                'INSERT INTO scheduled_events VALUES (%s, %s, %s)',
+                [
+                    (guild_id * 100 + i, guild_id, upcoming[i])
+                    for guild_id in range(1, GUILDS + 1)
+                    for i in range(EVENTS_PER_GUILD)
+                ]
+            )
+            await cur.executemany(
+                'INSERT INTO sent_streams VALUES (%s, %s)',
+                [
+                    (f'{i:011d}', now - timedelta(hours=i))
+                    for i in range(EVENTS)
+                ]
+            )
+            await cur.execute(
+                """
+                ANALYZE TABLE
+                    ll2_agencies,
+                    ll2_events,
+                    enabled_guilds,
+                    notification_countdown,
+                    scheduled_events,
+                    sent_streams
+                """
+            )
+            await cur.fetchall()
+
+    async def explain(
+        self,
+        method: str,
+        *args: Any,
+        **kwargs: Any
+    ) -> list[dict[str, Any]]:
+        """
+        Capture the queries of a database method and explain them.
+
+        Parameters
+        ----------
+        method : str
+            Name of the database method.
+        *args : Any
+            Arguments of the method.
+        **kwargs : Any
+            Keyword arguments of the method.
+
+        Returns
+        -------
+        plans : list[dict[str, Any]]
+            EXPLAIN rows of all captured queries.
+        """
+        recorder = _RecordingPool()
+        self.db.pool = recorder
+        try:
+            result = getattr(self.db, method)(*args, **kwargs)
+            if hasattr(result, '__aiter__'):
+                async for _ in result:
+                    pass
+            else:
+                await result
+        finally:
+            self.db.pool = self.pool
+
+        plans: list[dict[str, Any]] = []
+        async with (
+            self.pool.acquire() as con,
+            con.cursor(aiomysql.DictCursor) as cur
+        ):
+            for query, query_args in recorder.queries:
+                await cur.execute(f'EXPLAIN {query}', query_args)
+                plans += await cur.fetchall()
+        self.assertTrue(plans, f'{method} executed no queries')
+        return plans
+
+    def assertIndexed(
+        self,
+        plans: list[dict[str, Any]],
+        table: str,
+        keys: set[str]
+    ) -> None:
+        """
+        Assert that every access of a table
+        alias uses one of the given indexes.
+
+        Parameters
+        ----------
+        plans : list[dict[str, Any]]
+            EXPLAIN rows.
+        table : str
+            Table alias in the query.
+        keys : set[str]
+            Accepted index names.
+        """
+        rows = [row for row in plans if row['table'] == table]
+        self.assertTrue(rows, f'{table} is not in the plan: {plans}')
+        for row in rows:
+            self.assertNotEqual(row['type'], 'ALL', f'full scan: {row}')
+            self.assertIn(row['key'], keys, f'unexpected index: {row}')
+
+    def assertNoFullScan(
+        self,
+        plans: list[dict[str, Any]],
+        table: str
+    ) -> None:
+        """
+        Assert that a table alias is not fully scanned,
+        the table may be optimized away entirely.
+
+        Parameters
+        ----------
+        plans : list[dict[str, Any]]
+            EXPLAIN rows.
+        table : str
+            Table alias in the query.
+        """
+        for row in plans:
+            if row['table'] == table:
+                self.assertNotEqual(row['type'], 'ALL', f'full scan: {row}')
+
+    async def test_scheduled_events_create_iter(self) -> None:
+        plans = await self.explain('scheduled_events_create_iter', [1, 2])
+        self.assertIndexed(plans, 'le', {'ll2_events_end_status'})
+        self.assertIndexed(plans, 'se', {'scheduled_events_guild_ll2'})
+
+    async def test_scheduled_events_remove_iter(self) -> None:
+        plans = await self.explain('scheduled_events_remove_iter', [1, 2])
+        self.assertIndexed(plans, 'le', {'ll2_events_end_status'})
+        self.assertIndexed(plans, 'se', {'scheduled_events_guild_ll2'})
+
+    async def test_scheduled_events_next_transition(self) -> None:
+        plans = await self.explain('_scheduled_events_next_transition')
+        self.assertNoFullScan(plans, 'll2_events')
+
+    async def test_ll2_events_next(self) -> None:
+        plans = await self.explain('ll2_events_next', 1, 5, 'launches')
+        self.assertIndexed(plans, 'le', {'is_event', 'll2_events_start'})
+
+    async def test_notification_iter(self) -> None:
+        plans = await self.explain(
+            'notification_iter',
+            ll2_id=self.ll2_id,
+            status=1,
+            t0_change=True
+        )
+        self.assertIndexed(plans, 'le', {'PRIMARY'})
+        self.assertIndexed(plans, 'eg', {'enabled_guilds_notification'})
+
+    async def test_notification_countdown_load(self) -> None:
+        plans = await self.explain(
+            '_notification_countdown_load',
+            self.now,
+            self.now + timedelta(minutes=10)
+        )
+        self.assertIndexed(plans, 'le', {'ll2_events_start'})
+        self.assertIndexed(
+            plans,
+            'eg',
+            {'PRIMARY', 'enabled_guilds_notification'}
+        )
+
+    async def test_sent_media_exists_many(self) -> None:
+        plans = await self.explain(
+            'sent_media_exists_many',
+            yt_vid_ids=[f'{i:011d}' for i in range(0, EVENTS, 100)]
+        )
+        self.assertIndexed(plans, 'sent_streams', {'PRIMARY'})
+
+
+if __name__ == '__main__':
+    unittest.main()